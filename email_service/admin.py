@@ -1,3 +1,25 @@
 from django.contrib import admin
 
-# Register your models here.
+from .models import CommandRun, DripRun, OutboundEmail
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ("subject", "status", "attempts", "next_attempt_at", "sent_at", "created_at")
+    list_filter = ("status",)
+    search_fields = ("subject", "last_error")
+    readonly_fields = ("created_at", "updated_at", "sent_at", "locked_at")
+
+
+@admin.register(DripRun)
+class DripRunAdmin(admin.ModelAdmin):
+    list_display = ("run_id", "status", "last_consumer_id", "total_sent", "started_at", "finished_at")
+    list_filter = ("status",)
+    readonly_fields = ("run_id", "started_at", "updated_at", "finished_at")
+
+
+@admin.register(CommandRun)
+class CommandRunAdmin(admin.ModelAdmin):
+    list_display = ("command", "started_at", "duration_seconds", "messages_sent", "messages_per_second")
+    list_filter = ("command",)
+    readonly_fields = ("command", "started_at", "duration_seconds", "messages_sent", "messages_per_second", "summary", "created_at")
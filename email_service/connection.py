@@ -0,0 +1,104 @@
+import queue
+import smtplib
+import threading
+
+from django.conf import settings
+from django.core.mail import get_connection
+
+
+class _PooledConnection:
+    """A single email backend plus the bookkeeping needed to recycle it."""
+
+    def __init__(self, backend_kwargs: dict):
+        self.backend = get_connection(**backend_kwargs)
+        self.is_open = False
+        self.sent = 0
+
+    def open(self) -> None:
+        if not self.is_open:
+            self.backend.open()
+            self.is_open = True
+            self.sent = 0
+
+    def close(self) -> None:
+        if self.is_open:
+            self.backend.close()
+            self.is_open = False
+
+    def send(self, message, max_messages: int) -> int:
+        if max_messages and self.sent >= max_messages:
+            self.close()
+        self.open()
+        try:
+            count = self.backend.send_messages([message])
+        except smtplib.SMTPServerDisconnected:
+            # The server dropped an idle session; reconnect once and retry.
+            self.close()
+            self.open()
+            count = self.backend.send_messages([message])
+        self.sent += count or 0
+        return count or 0
+
+
+class EmailConnectionPool:
+    """Keep authenticated SMTP connections open for the length of a command run.
+
+    Up to ``size`` connections are opened lazily and handed out one message at
+    a time, so the TLS handshake is paid once per connection instead of once
+    per email. A connection the server has timed out is reopened transparently,
+    and every connection is recycled after ``max_messages`` sends. The pool is
+    thread-safe and is meant to be used as a context manager::
+
+        with EmailConnectionPool() as pool:
+            pool.send(message)
+    """
+
+    def __init__(self, size: int | None = None, max_messages: int | None = None, **backend_kwargs):
+        if size is None:
+            size = getattr(settings, "EMAIL_POOL_SIZE", 2)
+        if max_messages is None:
+            max_messages = getattr(settings, "EMAIL_POOL_MAX_MESSAGES", 100)
+        self.size = max(1, int(size))
+        self.max_messages = max(0, int(max_messages))
+        self._backend_kwargs = backend_kwargs
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._connections: list[_PooledConnection] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "EmailConnectionPool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _acquire(self) -> _PooledConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if len(self._connections) < self.size:
+                conn = _PooledConnection(self._backend_kwargs)
+                self._connections.append(conn)
+                return conn
+        return self._idle.get()
+
+    def send(self, message) -> int:
+        """Send one message over a pooled connection; returns the number sent."""
+        conn = self._acquire()
+        try:
+            return conn.send(message, self.max_messages)
+        finally:
+            self._idle.put(conn)
+
+    def send_messages(self, messages) -> int:
+        return sum(self.send(message) for message in messages)
+
+    def close(self) -> None:
+        with self._lock:
+            for conn in self._connections:
+                try:
+                    conn.close()
+                except Exception:
+                    # A broken connection must not mask the command's own result.
+                    pass
@@ -5,6 +5,14 @@ from pathlib import Path
 from django.conf import settings
 
 
+def script_log_dir(script_name: str) -> Path:
+    """Return (creating it if needed) `<LOGS_ROOT>/<script_name>/` (default `<BASE_DIR>/logs`)."""
+    base_dir = Path(getattr(settings, "BASE_DIR", "."))
+    logs_root = Path(getattr(settings, "LOGS_ROOT", base_dir / "logs")) / script_name
+    logs_root.mkdir(parents=True, exist_ok=True)
+    return logs_root
+
+
 def get_script_logger(
     script_name: str,
     *,
@@ -15,15 +23,11 @@ def get_script_logger(
 ) -> logging.Logger:
     """Return a configured logger for an email_service script.
 
-    Writes logs to `<BASE_DIR>/logs/<script_name>/<script_name>.log` and
+    Writes logs to `<LOGS_ROOT>/<script_name>/<script_name>.log` and
     rotates them daily, keeping a limited history. Handlers are attached only
     once per process.
     """
-    base_dir = Path(getattr(settings, "BASE_DIR", "."))
-    logs_root = base_dir / "logs" / script_name
-    logs_root.mkdir(parents=True, exist_ok=True)
-
-    logfile = logs_root / f"{script_name}.log"
+    logfile = script_log_dir(script_name) / f"{script_name}.log"
 
     logger_name = f"email_service.{script_name}"
     logger = logging.getLogger(logger_name)
@@ -0,0 +1,121 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from email_service.connection import EmailConnectionPool
+from email_service.logger import get_script_logger
+from email_service.metrics import RunMetrics
+from email_service.models import OutboundEmail
+
+
+class Command(BaseCommand):
+    help = "Deliver queued OutboundEmail rows over pooled SMTP connections, retrying failures with backoff."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50, help="Rows claimed per transaction.")
+        parser.add_argument("--limit", type=int, help="Absolute cap on emails attempted this run.")
+        parser.add_argument(
+            "--retry-delay",
+            type=float,
+            default=getattr(settings, "EMAIL_QUEUE_RETRY_DELAY", 60.0),
+            help="Base retry delay in seconds; doubles after each failed attempt.",
+        )
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=15,
+            help="Return rows stuck in 'sending' for this long (e.g. after a crash) to the queue.",
+        )
+
+    def handle(self, *args, **opts):
+        logger = get_script_logger("process_email_queue")
+        metrics = RunMetrics("process_email_queue")
+        batch_size = max(1, opts["batch_size"])
+        limit = opts.get("limit")
+
+        with metrics.phase("query"):
+            reclaimed = OutboundEmail.objects.filter(
+                status=OutboundEmail.Status.SENDING,
+                locked_at__lt=timezone.now() - timedelta(minutes=opts["stale_minutes"]),
+            ).update(status=OutboundEmail.Status.PENDING, locked_at=None, updated_at=timezone.now())
+        if reclaimed:
+            logger.warning("Returned %s stale 'sending' row(s) to the queue.", reclaimed)
+
+        sent = failed = 0
+        with EmailConnectionPool() as pool:
+            while limit is None or sent + failed < limit:
+                size = batch_size if limit is None else min(batch_size, limit - sent - failed)
+                with metrics.phase("query"):
+                    batch = self._claim(size)
+                if not batch:
+                    break
+                batch_sent, batch_failed = self._deliver(batch, pool, opts["retry_delay"], logger, metrics)
+                sent += batch_sent
+                failed += batch_failed
+
+        logger.info("Email queue run completed. Emails sent=%s failed=%s", sent, failed)
+        metrics.finish(logger, sent, failed=failed, reclaimed=reclaimed)
+        self.stdout.write(self.style.SUCCESS(f"Email queue run completed. Emails sent={sent} failed={failed}"))
+
+    @staticmethod
+    def _claim(size: int) -> list[OutboundEmail]:
+        """Lock due rows, flip them to SENDING and commit, so concurrent workers skip them."""
+        now = timezone.now()
+        with transaction.atomic():
+            batch = list(
+                OutboundEmail.objects.select_for_update(skip_locked=True)
+                .filter(status=OutboundEmail.Status.PENDING, next_attempt_at__lte=now)
+                .order_by("next_attempt_at", "id")[:size]
+            )
+            if batch:
+                OutboundEmail.objects.filter(id__in=[row.id for row in batch]).update(
+                    status=OutboundEmail.Status.SENDING,
+                    locked_at=now,
+                    updated_at=now,
+                )
+        return batch
+
+    @staticmethod
+    def _deliver(
+        batch: list[OutboundEmail],
+        pool: EmailConnectionPool,
+        retry_delay: float,
+        logger,
+        metrics: RunMetrics,
+    ) -> tuple[int, int]:
+        sent_ids: list[int] = []
+        failures: list[OutboundEmail] = []
+        for row in batch:
+            with metrics.phase("render"):
+                message = row.to_message()
+            try:
+                with metrics.send():
+                    pool.send(message)
+            except Exception as exc:
+                logger.exception("Failed to send queued email id=%s to %s | %s", row.id, row.to, exc)
+                row.schedule_retry(str(exc), retry_delay)
+                failures.append(row)
+                continue
+            logger.info("Sent queued email id=%s to %s subject=%s", row.id, row.to, row.subject)
+            sent_ids.append(row.id)
+
+        now = timezone.now()
+        with metrics.phase("bookkeeping"), transaction.atomic():
+            if sent_ids:
+                OutboundEmail.objects.filter(id__in=sent_ids).update(
+                    status=OutboundEmail.Status.SENT,
+                    attempts=F("attempts") + 1,
+                    sent_at=now,
+                    locked_at=None,
+                    updated_at=now,
+                )
+            if failures:
+                OutboundEmail.objects.bulk_update(
+                    failures,
+                    ["status", "attempts", "last_error", "locked_at", "next_attempt_at", "updated_at"],
+                )
+        return len(sent_ids), len(failures)
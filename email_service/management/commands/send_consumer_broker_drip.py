@@ -1,14 +1,26 @@
-from datetime import datetime, time, timedelta
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import SimpleNamespace
 from zoneinfo import ZoneInfo
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Count, Q
 from django.template.loader import render_to_string
 from django.urls import NoReverseMatch, reverse
 from django.utils import timezone
 
+from email_service.connection import EmailConnectionPool
 from email_service.logger import get_script_logger
+from email_service.metrics import RunMetrics
+from email_service.models import DripRun
+from email_service.rendering import SkeletonTemplate
+from email_service.throttle import DomainRateLimiter
+from website.exports import DEFAULT_EXPORT_FORMAT, EXPORT_FORMATS, WINDOW_TZ, default_window, window_export
 from website.models import (
     BrokerContactLog,
     Consumer,
@@ -17,15 +29,67 @@ from website.models import (
 )
 
 
-def _split_recipients(raw: str | None) -> list[str]:
-    if not raw:
-        return []
-    recipients: list[str] = []
-    for part in raw.replace(";", ",").split(","):
-        value = part.strip()
-        if value:
-            recipients.append(value)
-    return recipients
+OUTREACH_TEMPLATE = "emails/broker_outreach_request"
+DIGEST_TEMPLATE = "emails/broker_outreach_digest"
+
+# Options stored on a DripRun and restored by --resume.
+RUN_OPTIONS = ("consumer_id", "max_batch", "limit", "test", "digest")
+
+# The only values that vary between individual outreach emails.
+OUTREACH_FIELDS = ("consumer_name", "consumer_email", "broker_name", "request_type", "compliance_link")
+
+
+def outreach_context(values: dict) -> dict:
+    """Build the outreach template context from flat per-message values."""
+    return {
+        "consumer": SimpleNamespace(full_name=values["consumer_name"], primary_email=values["consumer_email"]),
+        "broker": SimpleNamespace(name=values["broker_name"]),
+        "status": SimpleNamespace(get_request_type_display=values["request_type"]),
+        "compliance_link": values["compliance_link"],
+    }
+
+
+@dataclass
+class _OutreachJob:
+    """Everything a worker thread needs to render and submit one email (no DB access).
+
+    An individual outreach covers a single status row and carries flat
+    ``OUTREACH_FIELDS`` values for the skeleton renderer; a digest covers
+    several rows sent to the same recipients (one broker, or brokers sharing
+    a contact address) and carries a full context.
+    """
+
+    statuses: list[ConsumerBrokerStatus]
+    recipients: list[str]
+    subject: str
+    context: dict = field(repr=False)
+    template: str = OUTREACH_TEMPLATE
+
+    @property
+    def is_digest(self) -> bool:
+        return self.template == DIGEST_TEMPLATE
+
+    def describe(self) -> str:
+        status = self.statuses[0]
+        if self.is_digest:
+            broker_ids = dict.fromkeys(str(row.broker_id) for row in self.statuses)
+            return f"broker {', '.join(broker_ids)} digest covering {len(self.statuses)} request(s)"
+        return f"consumer {status.consumer_id} broker {status.broker_id}"
+
+
+@dataclass
+class _SendOutcome:
+    """Result of one send, held until the batch is written to the DB."""
+
+    job: _OutreachJob
+    snippet: str
+    sent_at: datetime
+    error: str = ""
+    exc: BaseException | None = field(default=None, repr=False)
+
+
+def _broker_names(statuses: list[ConsumerBrokerStatus]) -> str:
+    return ", ".join(dict.fromkeys(status.broker.name for status in statuses))
 
 
 class Command(BaseCommand):
@@ -56,6 +120,12 @@ class Command(BaseCommand):
             action="store_true",
             help="Build a CSV for paid Stop My Spam submissions between 8am prior day and 8am today (America/Los_Angeles) and attach to each email.",
         )
+        parser.add_argument(
+            "--attach-format",
+            choices=sorted(EXPORT_FORMATS),
+            default=DEFAULT_EXPORT_FORMAT,
+            help="File format of the --attach-window-csv attachment (same columns in every format).",
+        )
         parser.add_argument(
             "--window-start",
             help="Override window start (ISO 8601). If naive, assumes America/Los_Angeles.",
@@ -64,151 +134,467 @@ class Command(BaseCommand):
             "--window-end",
             help="Override window end (ISO 8601). If naive, assumes America/Los_Angeles.",
         )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Render and submit emails on N threads (DB updates stay on the main thread).",
+        )
+        parser.add_argument(
+            "--domain-rate",
+            type=float,
+            default=None,
+            help="Max emails per minute to any one recipient domain (default: BROKER_DRIP_DOMAIN_RATE; 0 disables).",
+        )
+        parser.add_argument(
+            "--domain-burst",
+            type=int,
+            default=None,
+            help="Emails a recipient domain may receive back-to-back before the rate applies (default: BROKER_DRIP_DOMAIN_BURST).",
+        )
+        parser.add_argument(
+            "--digest",
+            action="store_true",
+            help="Send one email per broker listing every consumer queued for it this run, instead of one per consumer.",
+        )
+        parser.add_argument(
+            "--digest-subject",
+            default="Stop My Spam deletion requests for {count} consumer(s)",
+            help="Digest subject template. Available fields: {broker}, {count}.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last drip run if it did not complete, skipping consumers it already processed.",
+        )
 
     def handle(self, *args, **opts):
         # Setup logger
         logger = get_script_logger("send_consumer_broker_drip")
+        self.metrics = RunMetrics("send_consumer_broker_drip")
+        self.dry_run = opts.get("dry_run", False)
+        self.run = None
+        if not self.dry_run:
+            self.run = DripRun.resumable() if opts.get("resume") else None
+            if self.run is not None:
+                logger.info("Resuming drip run %s after consumer %s", self.run.run_id, self.run.last_consumer_id)
+                # A resumed run keeps the filters and mode it was started with.
+                for key in RUN_OPTIONS:
+                    opts[key] = self.run.options.get(key, opts.get(key))
+            else:
+                if opts.get("resume"):
+                    logger.info("No unfinished drip run to resume; starting a new run.")
+                self.run = DripRun.objects.create(options={key: opts.get(key) for key in RUN_OPTIONS})
         consumers = Consumer.objects.all().order_by("id")
         if opts.get("consumer_id"):
             consumers = consumers.filter(id=opts["consumer_id"])
+        if self.run is not None and self.run.last_consumer_id:
+            consumers = consumers.filter(id__gt=self.run.last_consumer_id)
         if not consumers.exists():
             self.stdout.write("No consumers found for drip processing.")
+            if self.run is not None:
+                self.run.finish()
             return
         csv_payload = None
         if opts.get("attach_window_csv"):
-            csv_payload = self._build_window_csv(opts)
-        # Process each consumer record
+            with self.metrics.phase("export"):
+                csv_payload = self._build_window_csv(opts)
+        # Run-wide send settings shared by every consumer batch
+        base_url = getattr(settings, "PUBLIC_BASE_URL", "http://127.0.0.1:8000").rstrip("/")
+        self.link_template = f"{base_url}{self._resolve_path_template(uuid.uuid4())}"
+        self.from_email = opts.get("from_email") or getattr(
+            settings, "DEFAULT_FROM_EMAIL", getattr(settings, "EMAIL_HOST_USER", None)
+        )
+        self.csv_payload = csv_payload
+        self.test_recipients = None
+        if opts.get("test"):
+            self.test_recipients = list(getattr(settings, "TEST_BROKER_RECIPIENTS", []))
+            if not self.test_recipients:
+                logger.warning("TEST_BROKER_RECIPIENTS is empty; test mode will send nothing.")
+        workers = max(1, opts.get("workers") or 1)
+        self.workers = workers
+        domain_rate = opts.get("domain_rate")
+        if domain_rate is None:
+            domain_rate = getattr(settings, "BROKER_DRIP_DOMAIN_RATE", 0)
+        domain_burst = opts.get("domain_burst") or getattr(settings, "BROKER_DRIP_DOMAIN_BURST", 1)
+        self.limiter = DomainRateLimiter(domain_rate, domain_burst)
+        self.skeletons = {
+            ext: SkeletonTemplate(f"{OUTREACH_TEMPLATE}.{ext}", outreach_context, OUTREACH_FIELDS)
+            for ext in ("txt", "html")
+        }
         total_sent = 0
-        for consumer in consumers:
-            sent = self._process_consumer(consumer, opts, logger, csv_payload)
-            total_sent += sent
+        try:
+            with EmailConnectionPool(size=workers) as pool, ThreadPoolExecutor(max_workers=workers) as executor:
+                self.pool = pool
+                self.executor = executor if workers > 1 else None
+                with self.metrics.phase("query"):
+                    due = self._prepare_consumers(consumers, logger)
+                if opts.get("digest"):
+                    total_sent = self._process_digest(due, opts, logger)
+                else:
+                    for consumer, state in due:
+                        sent = self._process_consumer(consumer, state, opts, logger)
+                        total_sent += sent
+        except Exception as exc:
+            if self.run is not None:
+                self.run.finish(error=str(exc) or exc.__class__.__name__)
+            raise
+        if self.run is not None:
+            self.run.finish()
 
         logger.info("Completed drip run. Emails sent=%s", total_sent)
+        self.metrics.finish(
+            logger,
+            total_sent,
+            dry_run=self.dry_run,
+            workers=workers,
+            digest=bool(opts.get("digest")),
+            run_id=str(self.run.run_id) if self.run is not None else None,
+        )
         self.stdout.write(self.style.SUCCESS(f"Completed drip run. Emails sent={total_sent}"))
 
-    def _process_consumer(self, consumer: Consumer, opts: dict, logger, csv_payload) -> int:
-        """
-        Process a single consumer's queued broker statuses, sending emails as appropriate.
-        """
-        state, _ = EmailDripState.objects.get_or_create(consumer=consumer)
-        batch_size = state.next_batch_size(opts.get("max_batch"))
-        if opts.get("limit"):
-            batch_size = min(batch_size, opts["limit"])
-
-        # Ensure broker statuses exist for this consumer (default DELETE)
-        if not consumer.broker_statuses.exists():
-            consumer.initialize_broker_statuses(request_type=ConsumerBrokerStatus.RequestType.DELETE)
-
-        qs = consumer.broker_statuses.filter(
+    @staticmethod
+    def _queued_filter() -> Q:
+        return Q(
             status=ConsumerBrokerStatus.Status.QUEUED,
-            broker__contact_email__gt="",
+            # Only brokers whose contact_email holds at least one usable address.
+            broker__contact_recipients__gt="",
             request_type=ConsumerBrokerStatus.RequestType.DELETE,
-        ).select_related("broker")
+        )
 
-        statuses = list(qs[:batch_size])
-        if not statuses:
-            logger.info("Consumer %s has no queued brokers.", consumer.id)
-            return 0
+    def _prepare_consumers(self, consumers, logger) -> list[tuple[Consumer, EmailDripState]]:
+        """Load drip state and queued counts for every consumer up front.
 
-        base_url = getattr(settings, "PUBLIC_BASE_URL", "http://127.0.0.1:8000").rstrip("/")
-        path_template = self._resolve_path_template(statuses[0].tracking_token)
-        from_email = opts.get("from_email") or getattr(
-            settings, "DEFAULT_FROM_EMAIL", getattr(settings, "EMAIL_HOST_USER", None)
+        Consumers whose onboarding was deferred at signup are onboarded first.
+        After that it uses a constant number of queries regardless of consumer
+        count: one for existing drip states (plus one insert and reload for
+        missing ones) and one grouped count of status rows. Consumers with
+        nothing queued are dropped here without any further DB access.
+        """
+        consumer_qs = consumers
+        onboarded, _ = Consumer.onboard_pending(consumer_qs)
+        if onboarded:
+            logger.info("Onboarded %s consumer(s) awaiting broker initialization.", onboarded)
+        consumers = list(consumer_qs)
+        states = {state.consumer_id: state for state in EmailDripState.objects.filter(consumer__in=consumer_qs)}
+        missing = [consumer for consumer in consumers if consumer.id not in states]
+        if missing:
+            EmailDripState.objects.bulk_create(
+                [EmailDripState(consumer=consumer) for consumer in missing],
+                ignore_conflicts=True,
+                batch_size=500,
+            )
+            # Reload rather than trust bulk_create, which does not return PKs on MySQL.
+            states = {state.consumer_id: state for state in EmailDripState.objects.filter(consumer__in=consumer_qs)}
+
+        counts = self._status_counts(consumer_qs)
+        due: list[tuple[Consumer, EmailDripState]] = []
+        for consumer in consumers:
+            if not counts.get(consumer.id, 0):
+                logger.info("Consumer %s has no queued brokers.", consumer.id)
+                continue
+            due.append((consumer, states[consumer.id]))
+        return due
+
+    def _status_counts(self, consumers) -> dict[int, int]:
+        """Map consumer id -> queued row count, for consumers that have any status rows."""
+        rows = (
+            ConsumerBrokerStatus.objects.filter(consumer__in=consumers)
+            .values("consumer_id")
+            .annotate(queued=Count("id", filter=self._queued_filter()))
+            .order_by()
         )
-        subject_template = opts["subject"]
-        dry_run = opts.get("dry_run", False)
-        test_mode = opts.get("test", False)
-        test_recipients = []
-        if test_mode:
-            test_recipients = list(getattr(settings, "TEST_BROKER_RECIPIENTS", []))
-            if not test_recipients:
-                logger.warning("TEST_BROKER_RECIPIENTS is empty; test mode will send nothing.")
-        sent = 0
-        batch_number = state.sequence_index + 1
+        return {row["consumer_id"]: row["queued"] for row in rows}
 
+    def _select_batch(
+        self, consumer: Consumer, state: EmailDripState, opts: dict, already: int = 0
+    ) -> list[ConsumerBrokerStatus]:
+        """Return the queued rows due for this consumer in this run, less ``already`` recorded ones."""
+        batch_size = state.next_batch_size(opts.get("max_batch"))
+        if opts.get("limit"):
+            batch_size = min(batch_size, opts["limit"])
+        batch_size -= already
+        if batch_size <= 0:
+            return []
+        qs = consumer.broker_statuses.filter(self._queued_filter()).select_related("broker")
+        with self.metrics.phase("query"):
+            return list(qs[:batch_size])
+
+    def _recipients_for(self, broker, logger) -> list[str]:
+        if self.test_recipients is not None:
+            recipients = self.test_recipients
+        else:
+            recipients = broker.recipients
+        if not recipients:
+            logger.warning("Skipping broker id=%s (no recipients)", broker.id)
+        return recipients
+
+    def _recipient_groups(
+        self, statuses: list[ConsumerBrokerStatus], logger
+    ) -> list[tuple[list[str], list[ConsumerBrokerStatus]]]:
+        """Group rows whose brokers share normalized recipients, in first-seen order."""
+        groups: dict[str, tuple[list[str], list[ConsumerBrokerStatus]]] = {}
         for status in statuses:
-            if test_mode:
-                recipients = test_recipients
-            else:
-                recipients = _split_recipients(status.broker.contact_email)
+            recipients = self._recipients_for(status.broker, logger)
             if not recipients:
-                logger.warning("Skipping broker id=%s (no recipients)", status.broker_id)
                 continue
+            # Keyed on the real addresses so --test coalesces exactly like a live run.
+            key = status.broker.contact_recipients or f"broker:{status.broker_id}"
+            groups.setdefault(key, (recipients, []))[1].append(status)
+        return list(groups.values())
 
-            compliance_link = f"{base_url}{path_template.format(token=status.tracking_token)}"
-            context = {
-                "consumer": consumer,
-                "status": status,
-                "broker": status.broker,
-                "compliance_link": compliance_link,
-            }
+    def _digest_job(self, statuses: list[ConsumerBrokerStatus], recipients: list[str], subject: str) -> _OutreachJob:
+        brokers = list({status.broker_id: status.broker for status in statuses}.values())
+        context = {
+            "broker": brokers[0],
+            "brokers": brokers,
+            "broker_names": _broker_names(statuses),
+            "entries": [
+                {
+                    "consumer": status.consumer,
+                    "status": status,
+                    "broker": status.broker,
+                    "compliance_link": self._compliance_link(status),
+                }
+                for status in statuses
+            ],
+        }
+        return _OutreachJob(statuses, recipients, subject, context, DIGEST_TEMPLATE)
+
+    def _compliance_link(self, status: ConsumerBrokerStatus) -> str:
+        return self.link_template.format(token=status.tracking_token)
+
+    def _process_consumer(self, consumer: Consumer, state: EmailDripState, opts: dict, logger) -> int:
+        """
+        Process a single consumer's queued broker statuses, sending emails as appropriate.
+        """
+        statuses = self._select_batch(consumer, state, opts)
+        subject_template = opts["subject"]
+        jobs: list[_OutreachJob] = []
+        for recipients, group in self._recipient_groups(statuses, logger):
+            broker_names = _broker_names(group)
             subject = subject_template.format(
                 consumer=consumer.full_name,
-                broker=status.broker.name,
-                request_type=status.get_request_type_display(),
+                broker=broker_names,
+                request_type=group[0].get_request_type_display(),
             )
-            text_body = render_to_string("emails/broker_outreach_request.txt", context)
-            html_body = render_to_string("emails/broker_outreach_request.html", context)
-            email = EmailMultiAlternatives(subject, text_body, from_email, recipients)
-            email.attach_alternative(html_body, "text/html")
-            if csv_payload:
-                filename, content = csv_payload
-                email.attach(filename, content, "text/csv")
+            if len(group) > 1:
+                # Brokers sharing a contact address get one message listing each request.
+                jobs.append(self._digest_job(group, recipients, subject))
+                continue
+            status = group[0]
+            values = {
+                "consumer_name": consumer.full_name,
+                "consumer_email": consumer.primary_email,
+                "broker_name": status.broker.name,
+                "request_type": status.get_request_type_display(),
+                "compliance_link": self._compliance_link(status),
+            }
+            jobs.append(_OutreachJob([status], recipients, subject, values))
 
-            if dry_run:
-                logger.info(
-                    "[DRY RUN] Would send to %s for consumer %s broker %s subject=%s",
-                    recipients,
-                    consumer.id,
-                    status.broker_id,
-                    subject,
-                )
+        outcomes = self._send_jobs(jobs, logger)
+        if self.dry_run:
+            return 0
+        self._record_outcomes(outcomes, {consumer.id: state}, consumer.id)
+        # Emails, not rows: a coalesced message covers several rows.
+        return sum(1 for outcome in outcomes if not outcome.error)
+
+    def _process_digest(self, due: list[tuple[Consumer, EmailDripState]], opts: dict, logger) -> int:
+        """Group every consumer's due rows by recipients and send one email per group.
+
+        Each consumer's batch is selected exactly as in the per-consumer mode,
+        so drip throttling is unchanged; only the delivery is coalesced, across
+        consumers and across brokers that share a contact address. Every
+        covered row still gets its own transition and contact log.
+
+        Digests are recorded as they go out, a chunk of ``--workers`` at a
+        time, so a crash can leave at most one chunk unrecorded. A consumer's
+        rows may span several digests: its drip state advances once all of
+        them are recorded, and the run checkpoint only moves past consumers
+        that are complete. A resumed run shrinks each consumer's batch by the
+        rows it already logged, so recorded digests are not sent again.
+        """
+        already: dict[int, int] = {}
+        if self.run is not None:
+            # Consumers whose batch an earlier invocation of this run finished are done.
+            due = [(consumer, state) for consumer, state in due if not self._finished_this_run(state)]
+            already = self._rows_logged_this_run(due)
+        states: dict[int, EmailDripState] = {}
+        due_statuses: list[ConsumerBrokerStatus] = []
+        for consumer, state in due:
+            states[consumer.id] = state
+            due_statuses.extend(self._select_batch(consumer, state, opts, already=already.get(consumer.id, 0)))
+
+        jobs: list[_OutreachJob] = []
+        due_statuses.sort(key=lambda status: status.broker_id)
+        for recipients, group in self._recipient_groups(due_statuses, logger):
+            subject = opts["digest_subject"].format(broker=_broker_names(group), count=len(group))
+            jobs.append(self._digest_job(group, recipients, subject))
+
+        pending: dict[int, int] = {consumer.id: 0 for consumer, _ in due}
+        for job in jobs:
+            for status in job.statuses:
+                pending[status.consumer_id] += 1
+        # Consumers with nothing left to send count as complete straight away.
+        completed = [consumer_id for consumer_id, count in pending.items() if not count]
+        sent = 0
+        # At least one pass, so consumers with nothing to send are still checkpointed.
+        for start in range(0, max(len(jobs), 1), self.workers):
+            outcomes = self._send_jobs(jobs[start : start + self.workers], logger)
+            sent += sum(1 for outcome in outcomes if not outcome.error)
+            if self.dry_run or not due:
                 continue
+            for outcome in outcomes:
+                for status in outcome.job.statuses:
+                    pending[status.consumer_id] -= 1
+                    if not pending[status.consumer_id]:
+                        completed.append(status.consumer_id)
+            # Advance through the id-ordered prefix of consumers with every row recorded.
+            last_consumer_id = None
+            for consumer, _ in due:
+                if pending[consumer.id]:
+                    break
+                last_consumer_id = consumer.id
+            self._record_outcomes(outcomes, states, last_consumer_id, completed=completed)
+            completed = []
+        return 0 if self.dry_run else sent
 
-            try:
-                email.send()
+    def _finished_this_run(self, state: EmailDripState) -> bool:
+        return bool(state.last_run_at and state.last_run_at >= self.run.started_at)
+
+    def _rows_logged_this_run(self, due: list[tuple[Consumer, EmailDripState]]) -> dict[int, int]:
+        """Map consumer id -> rows this run already recorded (only non-zero after a crash mid-digest)."""
+        rows = (
+            BrokerContactLog.objects.filter(
+                consumer_id__in=[consumer.id for consumer, _ in due],
+                sent_at__gte=self.run.started_at,
+            )
+            .values("consumer_id")
+            .annotate(logged=Count("id"))
+            .order_by()
+        )
+        return {row["consumer_id"]: row["logged"] for row in rows}
+
+    def _send_jobs(self, jobs: list[_OutreachJob], logger) -> list[_SendOutcome]:
+        # executor.map yields in submission order, so logging and bookkeeping
+        # below are identical whether one or many workers did the sending.
+        outcomes = list(self.executor.map(self._deliver, jobs) if self.executor else map(self._deliver, jobs))
+
+        for outcome in outcomes:
+            job = outcome.job
+            if self.dry_run:
                 logger.info(
-                    "Sent outreach to %s for consumer %s broker %s subject=%s",
-                    recipients,
-                    consumer.id,
-                    status.broker_id,
-                    subject,
+                    "[DRY RUN] Would send to %s for %s subject=%s",
+                    job.recipients,
+                    job.describe(),
+                    job.subject,
                 )
-                status.mark_contacted(subject=subject, batch_number=batch_number)
-                BrokerContactLog.objects.create(
-                    consumer=consumer,
-                    broker=status.broker,
-                    status=status,
-                    subject=subject,
-                    snippet=text_body[:500],
-                    sent_at=timezone.now(),
-                    success=True,
+            elif outcome.error:
+                logger.error(
+                    "Failed to send to %s | %s",
+                    job.describe(),
+                    outcome.error,
+                    exc_info=outcome.exc,
                 )
-                sent += 1
-            except Exception as exc:  # pragma: no cover - defensive
-                logger.exception(
-                    "Failed to send to broker id=%s for consumer id=%s | %s",
-                    status.broker_id,
-                    consumer.id,
-                    exc,
+            else:
+                logger.info(
+                    "Sent outreach to %s for %s subject=%s",
+                    job.recipients,
+                    job.describe(),
+                    job.subject,
                 )
-                status.status = ConsumerBrokerStatus.Status.BOUNCED
-                status.notes = f"Send failure: {exc}"
-                status.save(update_fields=["status", "notes", "updated_at"])
-                BrokerContactLog.objects.create(
-                    consumer=consumer,
-                    broker=status.broker,
-                    status=status,
-                    subject=subject,
-                    snippet=text_body[:500],
-                    sent_at=timezone.now(),
-                    success=False,
-                    error=str(exc),
+        return outcomes
+
+    def _deliver(self, job: _OutreachJob) -> _SendOutcome:
+        """Render and submit one email. Runs on a worker thread, so it must not touch the DB."""
+        with self.metrics.phase("render"):
+            if job.is_digest:
+                text_body = render_to_string(f"{job.template}.txt", job.context)
+                html_body = render_to_string(f"{job.template}.html", job.context)
+            else:
+                text_body = self.skeletons["txt"].render(job.context)
+                html_body = self.skeletons["html"].render(job.context)
+            email = EmailMultiAlternatives(job.subject, text_body, self.from_email, job.recipients)
+            email.attach_alternative(html_body, "text/html")
+            if self.csv_payload:
+                email.attach(*self.csv_payload)
+        outcome = _SendOutcome(job, text_body[:500], timezone.now())
+        if self.dry_run:
+            return outcome
+
+        with self.metrics.phase("throttle"):
+            self.limiter.acquire(job.recipients)
+        try:
+            with self.metrics.send():
+                self.pool.send(email)
+        except Exception as exc:  # pragma: no cover - defensive
+            outcome.error = str(exc)
+            outcome.exc = exc
+        outcome.sent_at = timezone.now()
+        return outcome
+
+    def _record_outcomes(
+        self,
+        outcomes: list[_SendOutcome],
+        states: dict[int, EmailDripState],
+        last_consumer_id: int | None,
+        completed: list[int] | None = None,
+    ) -> int:
+        """Persist send results in one transaction; returns the number of rows contacted.
+
+        Status transitions are written with a single ``bulk_update`` and the
+        contact logs with a single ``bulk_create``. Only rows whose send
+        succeeded move to CONTACTED, so a rollback can at worst leave a
+        delivered message unrecorded, never an undelivered one marked sent.
+        The run checkpoint advances to ``last_consumer_id`` in the same
+        transaction, so a resumed run never repeats a recorded batch.
+
+        By default every consumer in ``outcomes`` has finished its batch. The
+        digest mode records partial batches and passes ``completed``, the
+        consumers whose last row is in this call; their drip state advances by
+        everything the run sent them.
+        """
+        statuses: list[ConsumerBrokerStatus] = []
+        logs: list[BrokerContactLog] = []
+        sent_per_consumer: dict[int, int] = {}
+        for outcome in outcomes:
+            job = outcome.job
+            metadata = {"digest_size": len(job.statuses)} if job.is_digest else {}
+            for status in job.statuses:
+                if outcome.error:
+                    status.mark_bounced(outcome.error, commit=False)
+                else:
+                    batch_number = states[status.consumer_id].sequence_index + 1
+                    status.mark_contacted(subject=job.subject, batch_number=batch_number, commit=False)
+                    status.contacted_at = outcome.sent_at
+                    sent_per_consumer[status.consumer_id] = sent_per_consumer.get(status.consumer_id, 0) + 1
+                statuses.append(status)
+                logs.append(
+                    BrokerContactLog(
+                        consumer_id=status.consumer_id,
+                        broker_id=status.broker_id,
+                        status=status,
+                        subject=job.subject,
+                        snippet=outcome.snippet,
+                        sent_at=outcome.sent_at,
+                        success=not outcome.error,
+                        error=outcome.error,
+                        metadata=metadata,
+                    )
                 )
 
-        if not dry_run and sent:
-            state.mark_batch_complete(sent)
-        return sent
+        with self.metrics.phase("bookkeeping"), transaction.atomic():
+            ConsumerBrokerStatus.bulk_save_outreach(statuses)
+            BrokerContactLog.objects.bulk_create(logs)
+            if self.run is not None:
+                self.run.checkpoint(last_consumer_id, sent_per_consumer)
+            if completed is None:
+                for consumer_id, sent in sent_per_consumer.items():
+                    states[consumer_id].mark_batch_complete(sent)
+            else:
+                for consumer_id in completed:
+                    states[consumer_id].mark_batch_complete(self.run.sent_counts.get(str(consumer_id), 0))
+        return sum(sent_per_consumer.values())
 
     @staticmethod
     def _resolve_path_template(sample_token):
@@ -223,64 +609,16 @@ class Command(BaseCommand):
             separator = "&" if "?" in legacy_path else "?"
             return f"{legacy_path}{separator}t={{token}}"
 
-    def _build_window_csv(self, opts) -> tuple[str, str] | None:
-        """Build a CSV of paid Stop My Spam signups within the specified LA window."""
-        from io import StringIO
-        import csv
-        from website.models import DoNotEmailRequest
-
-        la = ZoneInfo("America/Los_Angeles")
-        start, end = self._compute_window(opts, la)
-
-        dne_qs = (
-            DoNotEmailRequest.objects.filter(
-                paid_confirmed=True,
-                created_at__gte=start,
-                created_at__lt=end,
-            ).order_by("created_at")
-        )
-        if not dne_qs.exists():
-            return None
+    def _build_window_csv(self, opts) -> tuple[str, bytes, str] | None:
+        """Load the shared export of paid Stop My Spam signups within the LA window.
 
-        buf = StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(
-            [
-                "first_name",
-                "last_name",
-                "email1",
-                "email2",
-                "address1",
-                "address2",
-                "city",
-                "state",
-                "postal",
-                "region",
-                "created_at",
-            ]
-        )
-        for r in dne_qs:
-            created_local = r.created_at.astimezone(la).isoformat()
-            writer.writerow(
-                [
-                    r.first_name,
-                    r.last_name,
-                    r.primary_email,
-                    r.secondary_email or "",
-                    r.address1,
-                    r.address2 or "",
-                    r.city,
-                    r.region,
-                    r.postal,
-                    r.region,
-                    created_local,
-                ]
-            )
-
-        start_label = start.astimezone(la).strftime("%Y%m%d_%H%M")
-        end_label = end.astimezone(la).strftime("%Y%m%d_%H%M")
-        filename = f"dne_records_{start_label}_to_{end_label}.csv"
-        return filename, buf.getvalue()
+        Returns ``(filename, content, mimetype)`` in the ``--attach-format`` format.
+        """
+        start, end = self._compute_window(opts, WINDOW_TZ)
+        export = window_export(start, end, opts.get("attach_format"))
+        if export is None:
+            return None
+        return export.filename, export.read_bytes(), export.content_type
 
     def _compute_window(self, opts, la: ZoneInfo) -> tuple[datetime, datetime]:
         """Default window: 8am prior day -> 8am today (America/Los_Angeles)."""
@@ -290,12 +628,7 @@ class Command(BaseCommand):
                 return timezone.make_aware(dt, la)
             return dt.astimezone(la)
 
-        now_la = timezone.now().astimezone(la)
-        today = now_la.date()
-        end_default = timezone.make_aware(datetime.combine(today, time(8)), la)
-        if now_la < end_default:
-            end_default -= timedelta(days=1)
-        start_default = end_default - timedelta(days=1)
+        start_default, end_default = default_window()
 
         start = _parse(opts["window_start"]) if opts.get("window_start") else start_default
         end = _parse(opts["window_end"]) if opts.get("window_end") else end_default
@@ -3,10 +3,13 @@ from datetime import timedelta
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.core.management.base import BaseCommand
+from django.db.models import Q
 from django.template.loader import render_to_string
 from django.utils import timezone
 
+from email_service.connection import EmailConnectionPool
 from email_service.logger import get_script_logger
+from email_service.metrics import RunMetrics
 from website.models import Consumer
 from website.utils import manage_preferences_url
 
@@ -24,60 +27,98 @@ class Command(BaseCommand):
             default="Weekly Status Update from Stop My Spam",
             help="Email subject line.",
         )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Consumers loaded, counted and marked sent per batch.",
+        )
 
     def handle(self, *args, **opts):
         logger = get_script_logger("send_consumer_weekly_status")
+        metrics = RunMetrics("send_consumer_weekly_status")
+        lookback = timezone.now() - timedelta(days=opts["days"])
         consumers = Consumer.objects.filter(weekly_status_opt_in=True).order_by("id")
         if opts.get("consumer_id"):
             consumers = consumers.filter(id=opts["consumer_id"])
+        if not opts.get("force"):
+            consumers = consumers.filter(
+                Q(last_status_email_at__isnull=True) | Q(last_status_email_at__lte=lookback)
+            )
 
-        lookback = timezone.now() - timedelta(days=opts["days"])
         dry_run = opts.get("dry_run", False)
-        subject = opts["subject"]
-        sent = 0
+        batch_size = max(1, opts["batch_size"])
+        from_email = getattr(settings, "DEFAULT_FROM_EMAIL", None)
+        self.from_email = f"Stop My Spam <{from_email}>" if from_email else "Stop My Spam"
+        self.base_context = {
+            "lookback_start": lookback,
+            "manage_url": manage_preferences_url(),
+            "support_email": getattr(settings, "SUPPORT_EMAIL_HOST_USER", getattr(settings, "DEFAULT_FROM_EMAIL", "")),
+        }
+        sent = failed = 0
 
-        for consumer in consumers:
-            if (
-                not opts.get("force")
-                and consumer.last_status_email_at
-                and consumer.last_status_email_at > lookback
-            ):
-                logger.info(
-                    "Skipping consumer %s (status email sent %s)",
-                    consumer.id,
-                    consumer.last_status_email_at,
-                )
-                continue
+        with EmailConnectionPool() as pool:
+            last_id = 0
+            while True:
+                # Keyset batches: each costs one consumer query, one grouped
+                # status query and (when anything was sent) one UPDATE.
+                with metrics.phase("query"):
+                    batch = list(consumers.filter(id__gt=last_id)[:batch_size])
+                    if not batch:
+                        break
+                    last_id = batch[-1].id
+                    snapshots = Consumer.bulk_progress_snapshots(
+                        [consumer.id for consumer in batch],
+                        window_start=lookback,
+                    )
+                sent_ids, batch_failed = self._send_batch(batch, snapshots, pool, opts, metrics, logger)
+                failed += batch_failed
+                if dry_run or not sent_ids:
+                    continue
+                with metrics.phase("bookkeeping"):
+                    now = timezone.now()
+                    Consumer.objects.filter(id__in=sent_ids).update(last_status_email_at=now, updated_at=now)
+                sent += len(sent_ids)
 
-            snapshot = consumer.progress_snapshot(window_start=lookback)
+        logger.info("Weekly status run completed. Emails sent=%s failed=%s", sent, failed)
+        metrics.finish(logger, sent, failed=failed, dry_run=dry_run)
+        summary = f"Weekly status run completed. Emails sent={sent} failed={failed}"
+        self.stdout.write(self.style.WARNING(summary) if failed else self.style.SUCCESS(summary))
+
+    def _send_batch(self, consumers, snapshots, pool, opts, metrics, logger) -> tuple[list[int], int]:
+        """Render and send one batch; returns the ids of consumers emailed and the number of failed sends.
+
+        A failed send is logged and counted, and the consumer keeps its old
+        ``last_status_email_at`` so the next run tries again.
+        """
+        subject = opts["subject"]
+        sent_ids: list[int] = []
+        failed = 0
+        for consumer in consumers:
+            snapshot = snapshots[consumer.id]
             total = snapshot.get("total", 0)
             if total == 0:
                 continue
 
-            context = {
-                "consumer": consumer,
-                "snapshot": snapshot,
-                "total_brokers": total,
-                "lookback_start": lookback,
-                "generated_at": timezone.now(),
-                "manage_url": manage_preferences_url(),
-                "support_email": getattr(settings, "SUPPORT_EMAIL_HOST_USER", getattr(settings, "DEFAULT_FROM_EMAIL", "")),
-            }
-            text_body = render_to_string("emails/consumer_weekly_status.txt", context)
-            html_body = render_to_string("emails/consumer_weekly_status.html", context)
-            from_email = getattr(
-                settings, "DEFAULT_FROM_EMAIL", getattr(settings, "DEFAULT_FROM_EMAIL", None)
-            )
-            from_email_str = f"Stop My Spam <{from_email}>" if from_email else "Stop My Spam"
-            email = EmailMultiAlternatives(
-                subject,
-                text_body,
-                from_email_str,
-                [consumer.primary_email],
-            )
-            email.attach_alternative(html_body, "text/html")
+            with metrics.phase("render"):
+                context = {
+                    **self.base_context,
+                    "consumer": consumer,
+                    "snapshot": snapshot,
+                    "total_brokers": total,
+                    "generated_at": timezone.now(),
+                }
+                text_body = render_to_string("emails/consumer_weekly_status.txt", context)
+                html_body = render_to_string("emails/consumer_weekly_status.html", context)
+                email = EmailMultiAlternatives(
+                    subject,
+                    text_body,
+                    self.from_email,
+                    [consumer.primary_email],
+                )
+                email.attach_alternative(html_body, "text/html")
 
-            if dry_run:
+            if opts.get("dry_run"):
                 logger.info(
                     "[DRY RUN] Would send weekly status to consumer id=%s email=%s subject=%s",
                     consumer.id,
@@ -86,16 +127,18 @@ class Command(BaseCommand):
                 )
                 continue
 
-            email.send()
+            try:
+                with metrics.send():
+                    pool.send(email)
+            except Exception as exc:
+                logger.exception("Failed to send weekly status to consumer id=%s | %s", consumer.id, exc)
+                failed += 1
+                continue
             logger.info(
                 "Sent weekly status to consumer id=%s email=%s subject=%s",
                 consumer.id,
                 consumer.primary_email,
                 subject,
             )
-            consumer.last_status_email_at = timezone.now()
-            consumer.save(update_fields=["last_status_email_at", "updated_at"])
-            sent += 1
-
-        logger.info("Weekly status run completed. Emails sent=%s", sent)
-        self.stdout.write(self.style.SUCCESS(f"Weekly status run completed. Emails sent={sent}"))
+            sent_ids.append(consumer.id)
+        return sent_ids, failed
@@ -0,0 +1,120 @@
+import json
+import logging
+import math
+import threading
+import time
+from contextlib import contextmanager
+
+from django.utils import timezone
+
+from email_service.logger import script_log_dir
+
+
+def percentile(values: list[float], pct: float) -> float | None:
+    """Linear-interpolated percentile of ``values`` (``pct`` in 0-100)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100.0
+    low, high = math.floor(rank), math.ceil(rank)
+    if low == high:
+        return ordered[low]
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+class RunMetrics:
+    """Per-phase timings and send latencies for one management command run.
+
+    Phases are free-form names (``query``, ``render``, ``send``,
+    ``bookkeeping``). Timings are summed across threads, so with several
+    workers a phase total can exceed the run's wall-clock duration. Safe to
+    use from worker threads.
+    """
+
+    def __init__(self, script_name: str, *, clock=time.perf_counter):
+        self.script_name = script_name
+        self._clock = clock
+        self._started = clock()
+        self.started_at = timezone.now()
+        self.phases: dict[str, dict] = {}
+        self.send_latencies: list[float] = []
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float) -> None:
+        with self._lock:
+            phase = self.phases.setdefault(name, {"seconds": 0.0, "count": 0})
+            phase["seconds"] += seconds
+            phase["count"] += 1
+
+    @contextmanager
+    def phase(self, name: str):
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.add(name, self._clock() - start)
+
+    @contextmanager
+    def send(self):
+        """Time one SMTP submit; counted in the ``send`` phase and the latency percentiles."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            elapsed = self._clock() - start
+            self.add("send", elapsed)
+            with self._lock:
+                self.send_latencies.append(elapsed)
+
+    def summary(self, messages_sent: int, **extra) -> dict:
+        duration = self._clock() - self._started
+        return {
+            "command": self.script_name,
+            "started_at": self.started_at.isoformat(),
+            "finished_at": timezone.now().isoformat(),
+            "duration_seconds": round(duration, 6),
+            "messages_sent": messages_sent,
+            "messages_per_second": round(messages_sent / duration, 3) if duration > 0 else None,
+            "phases": {
+                name: {"seconds": round(phase["seconds"], 6), "count": phase["count"]}
+                for name, phase in sorted(self.phases.items())
+            },
+            "send_latency_seconds": {
+                key: (round(value, 6) if value is not None else None)
+                for key, value in (
+                    ("p50", percentile(self.send_latencies, 50)),
+                    ("p90", percentile(self.send_latencies, 90)),
+                    ("p99", percentile(self.send_latencies, 99)),
+                    ("max", max(self.send_latencies, default=None)),
+                )
+            },
+            **extra,
+        }
+
+    def finish(self, logger: logging.Logger, messages_sent: int, **extra) -> dict:
+        """Log the run summary, write it next to the script log and store a ``CommandRun``.
+
+        Reporting problems are logged and swallowed; they must never fail a
+        run whose emails have already gone out.
+        """
+        from email_service.models import CommandRun
+
+        summary = self.summary(messages_sent, **extra)
+        logger.info("Run summary: %s", json.dumps(summary, sort_keys=True))
+        try:
+            path = script_log_dir(self.script_name) / f"{self.script_name}.last_run.json"
+            path.write_text(json.dumps(summary, indent=2, sort_keys=True), encoding="utf-8")
+        except OSError as exc:
+            logger.warning("Could not write run summary file: %s", exc)
+        try:
+            CommandRun.objects.create(
+                command=self.script_name,
+                started_at=self.started_at,
+                duration_seconds=summary["duration_seconds"],
+                messages_sent=messages_sent,
+                messages_per_second=summary["messages_per_second"],
+                summary=summary,
+            )
+        except Exception as exc:  # pragma: no cover - defensive
+            logger.warning("Could not store run summary: %s", exc)
+        return summary
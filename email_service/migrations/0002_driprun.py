@@ -0,0 +1,34 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:09
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_service', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DripRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('run_id', models.UUIDField(default=uuid.uuid4, editable=False, unique=True)),
+                ('status', models.CharField(choices=[('running', 'Running'), ('completed', 'Completed'), ('failed', 'Failed')], default='running', max_length=20)),
+                ('options', models.JSONField(blank=True, default=dict)),
+                ('last_consumer_id', models.PositiveIntegerField(blank=True, null=True)),
+                ('sent_counts', models.JSONField(blank=True, default=dict)),
+                ('total_sent', models.PositiveIntegerField(default=0)),
+                ('error', models.TextField(blank=True)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ('-started_at', '-id'),
+                'indexes': [models.Index(fields=['status', 'started_at'], name='email_servi_status_427c23_idx')],
+            },
+        ),
+    ]
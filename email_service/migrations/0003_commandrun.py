@@ -0,0 +1,30 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('email_service', '0002_driprun'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CommandRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('command', models.CharField(max_length=100)),
+                ('started_at', models.DateTimeField()),
+                ('duration_seconds', models.FloatField()),
+                ('messages_sent', models.PositiveIntegerField(default=0)),
+                ('messages_per_second', models.FloatField(blank=True, null=True)),
+                ('summary', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ('-started_at', '-id'),
+                'indexes': [models.Index(fields=['command', 'started_at'], name='email_servi_command_b2a60c_idx')],
+            },
+        ),
+    ]
@@ -1,3 +1,172 @@
+import uuid
+from datetime import timedelta
+
+from django.core.mail import EmailMultiAlternatives
 from django.db import models
+from django.utils import timezone
+
+
+class OutboundEmail(models.Model):
+    """An email queued by request handlers and delivered by ``process_email_queue``."""
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pending"
+        SENDING = "sending", "Sending"
+        SENT = "sent", "Sent"
+        FAILED = "failed", "Failed"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True)
+    html_body = models.TextField(blank=True)
+    from_email = models.CharField(max_length=255, blank=True)
+    to = models.JSONField(default=list)
+    cc = models.JSONField(default=list, blank=True)
+    bcc = models.JSONField(default=list, blank=True)
+    reply_to = models.JSONField(default=list, blank=True)
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.PENDING,
+    )
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(blank=True, null=True)
+    sent_at = models.DateTimeField(blank=True, null=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("next_attempt_at", "id")
+        indexes = [
+            models.Index(fields=("status", "next_attempt_at")),
+        ]
+
+    def __str__(self):
+        return f"{self.subject} -> {', '.join(self.to)} ({self.status})"
+
+    def to_message(self) -> EmailMultiAlternatives:
+        message = EmailMultiAlternatives(
+            self.subject,
+            self.body,
+            self.from_email or None,
+            self.to,
+            bcc=self.bcc or None,
+            cc=self.cc or None,
+            reply_to=self.reply_to or None,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
+
+    def schedule_retry(self, error: str, base_delay: float) -> None:
+        """Record a failed attempt and back off exponentially, or give up after ``max_attempts``.
+
+        Only updates the instance; the caller persists it (usually in bulk).
+        """
+        now = timezone.now()
+        self.attempts += 1
+        self.last_error = error
+        self.locked_at = None
+        self.updated_at = now
+        if self.attempts >= self.max_attempts:
+            self.status = self.Status.FAILED
+        else:
+            self.status = self.Status.PENDING
+            self.next_attempt_at = now + timedelta(seconds=base_delay * 2 ** (self.attempts - 1))
+
+
+class ResumableRun(models.Model):
+    """Status and lifecycle shared by resumable command runs.
+
+    Subclasses add their own checkpoint fields and a ``checkpoint()`` method;
+    ``--resume`` picks up the latest run that did not complete.
+    """
+
+    class Status(models.TextChoices):
+        RUNNING = "running", "Running"
+        COMPLETED = "completed", "Completed"
+        FAILED = "failed", "Failed"
+
+    status = models.CharField(
+        max_length=20,
+        choices=Status.choices,
+        default=Status.RUNNING,
+    )
+    options = models.JSONField(default=dict, blank=True)
+    error = models.TextField(blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        abstract = True
+        ordering = ("-started_at", "-id")
+
+    @classmethod
+    def resumable(cls):
+        """Return the most recent run if it did not complete, else ``None``."""
+        latest = cls.objects.first()
+        if latest is None or latest.status == cls.Status.COMPLETED:
+            return None
+        return latest
+
+    def finish(self, error: str = "") -> None:
+        self.status = self.Status.FAILED if error else self.Status.COMPLETED
+        self.error = error
+        self.finished_at = timezone.now()
+        self.save(update_fields=["status", "error", "finished_at", "updated_at"])
+
+
+class DripRun(ResumableRun):
+    """Checkpoint for one ``send_consumer_broker_drip`` run.
+
+    Consumers are processed in id order, so ``last_consumer_id`` is enough to
+    resume: ``--resume`` continues the latest unfinished run from the next id
+    instead of giving earlier consumers a second batch.
+    """
+
+    run_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    last_consumer_id = models.PositiveIntegerField(blank=True, null=True)
+    sent_counts = models.JSONField(default=dict, blank=True)
+    total_sent = models.PositiveIntegerField(default=0)
+
+    class Meta(ResumableRun.Meta):
+        indexes = [
+            models.Index(fields=("status", "started_at")),
+        ]
+
+    def __str__(self):
+        return f"Drip run {self.run_id} ({self.status})"
+
+    def checkpoint(self, last_consumer_id: int | None, sent_per_consumer: dict[int, int] | None = None) -> None:
+        """Record progress through ``last_consumer_id`` (``None``: sends only); call inside the bookkeeping transaction."""
+        for consumer_id, sent in (sent_per_consumer or {}).items():
+            key = str(consumer_id)
+            self.sent_counts[key] = self.sent_counts.get(key, 0) + sent
+            self.total_sent += sent
+        if last_consumer_id is not None:
+            self.last_consumer_id = max(last_consumer_id, self.last_consumer_id or 0)
+        self.save(update_fields=["last_consumer_id", "sent_counts", "total_sent", "updated_at"])
+
+
+class CommandRun(models.Model):
+    """Timing summary of one email_service command run (see ``email_service.metrics``)."""
+
+    command = models.CharField(max_length=100)
+    started_at = models.DateTimeField()
+    duration_seconds = models.FloatField()
+    messages_sent = models.PositiveIntegerField(default=0)
+    messages_per_second = models.FloatField(blank=True, null=True)
+    summary = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ("-started_at", "-id")
+        indexes = [
+            models.Index(fields=("command", "started_at")),
+        ]
 
-# Create your models here.
+    def __str__(self):
+        return f"{self.command} at {self.started_at:%Y-%m-%d %H:%M} ({self.messages_sent} sent)"
@@ -0,0 +1,54 @@
+from typing import Iterable
+
+from django.core.mail import EmailMessage
+
+from email_service.models import OutboundEmail
+
+
+def enqueue_email(
+    subject: str,
+    body: str,
+    from_email: str | None,
+    to: Iterable[str],
+    *,
+    html_body: str = "",
+    cc: Iterable[str] = (),
+    bcc: Iterable[str] = (),
+    reply_to: Iterable[str] = (),
+) -> OutboundEmail:
+    """Queue an email for ``process_email_queue``; a drop-in for ``send_mail`` in views."""
+    return OutboundEmail.objects.create(
+        subject=subject[:255],
+        body=body,
+        html_body=html_body or "",
+        from_email=from_email or "",
+        to=list(to),
+        cc=list(cc),
+        bcc=list(bcc),
+        reply_to=list(reply_to),
+    )
+
+
+def enqueue_message(message: EmailMessage) -> OutboundEmail:
+    """Queue an already-built ``EmailMessage``/``EmailMultiAlternatives``.
+
+    Only the text body and an optional ``text/html`` alternative are carried
+    over; messages with attachments must be sent directly.
+    """
+    if message.attachments:
+        raise ValueError("Queued emails cannot carry attachments.")
+    html_body = ""
+    for content, mimetype in getattr(message, "alternatives", []):
+        if mimetype == "text/html":
+            html_body = content
+            break
+    return enqueue_email(
+        message.subject,
+        message.body,
+        message.from_email,
+        message.to,
+        html_body=html_body,
+        cc=message.cc,
+        bcc=message.bcc,
+        reply_to=message.reply_to,
+    )
@@ -0,0 +1,23 @@
+from email.utils import getaddresses
+
+
+def split_recipients(raw: str | None) -> list[str]:
+    """Split a ``contact_email`` cell ("a@x.com; b@x.com, Name <c@y.com>") into its entries."""
+    if not raw:
+        return []
+    return [part.strip() for part in raw.replace(";", ",").split(",") if part.strip()]
+
+
+def normalize_recipients(raw: str | None) -> list[str]:
+    """Bare, lower-cased, de-duplicated and sorted addresses from a ``contact_email`` cell.
+
+    Two brokers whose cells differ only in order, case, display names or
+    separators normalize to the same list.
+    """
+    addresses = {addr.strip().lower() for _, addr in getaddresses(split_recipients(raw))}
+    return sorted(addr for addr in addresses if "@" in addr)
+
+
+def recipient_key(raw: str | None) -> str:
+    """The stored form of ``normalize_recipients``: one comma-separated string ("" when none)."""
+    return ",".join(normalize_recipients(raw))
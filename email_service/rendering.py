@@ -0,0 +1,53 @@
+import re
+from typing import Callable, Iterable
+
+from django.template.loader import render_to_string
+from django.utils.html import escape
+
+_SENTINEL = "\x00"
+
+
+class SkeletonTemplate:
+    """Render a template once, then fill in per-message fields by substitution.
+
+    ``build_context`` turns a mapping of field values into the template
+    context. It is called once with sentinel placeholders to produce a
+    skeleton; ``render`` then splices HTML-escaped values into that skeleton
+    exactly where Django's autoescaping would have printed them, which is
+    byte-identical to a full render and far cheaper than running the template
+    engine for every email.
+
+    If the template transforms a field (for example with a filter), the
+    sentinels do not survive intact and every ``render`` falls back to a full
+    ``render_to_string`` instead.
+    """
+
+    def __init__(self, template_name: str, build_context: Callable[[dict], dict], fields: Iterable[str]):
+        self.template_name = template_name
+        self.build_context = build_context
+        self.fields = tuple(fields)
+        self._parts: list[str] | None = self._compile()
+
+    @property
+    def compiled(self) -> bool:
+        return self._parts is not None
+
+    def _compile(self) -> list[str] | None:
+        placeholders = {name: f"{_SENTINEL}{name}{_SENTINEL}" for name in self.fields}
+        skeleton = render_to_string(self.template_name, self.build_context(placeholders))
+        if not self.fields:
+            return [skeleton]
+        field_pattern = "|".join(re.escape(name) for name in self.fields)
+        # Even indexes hold literal text, odd indexes hold field names.
+        parts = re.split(f"{_SENTINEL}({field_pattern}){_SENTINEL}", skeleton)
+        if any(_SENTINEL in part for part in parts[::2]):
+            return None
+        return parts
+
+    def render(self, values: dict) -> str:
+        if self._parts is None:
+            return render_to_string(self.template_name, self.build_context(values))
+        out = []
+        for index, part in enumerate(self._parts):
+            out.append(escape(values[part]) if index % 2 else part)
+        return "".join(out)
@@ -1,18 +1,231 @@
+import shutil
+import tempfile
 from datetime import timedelta
+from io import StringIO
+from pathlib import Path
+from smtplib import SMTPException, SMTPServerDisconnected
+from unittest.mock import patch
 
 from django.core import mail
+from django.core.mail import EmailMessage, EmailMultiAlternatives
+from django.core.mail.backends import locmem
 from django.core.management import call_command
-from django.test import TestCase, override_settings
+from django.db import DatabaseError
+from django.db.models import Count
+from django.template.loader import render_to_string
+from django.test import SimpleTestCase, TestCase, override_settings
 from django.utils import timezone
 
+from email_service.connection import EmailConnectionPool
+from email_service.metrics import RunMetrics, percentile
+from email_service.models import CommandRun, DripRun, OutboundEmail
+from email_service.queue import enqueue_email, enqueue_message
+from email_service.management.commands.send_consumer_broker_drip import OUTREACH_FIELDS, outreach_context
+from email_service.recipients import normalize_recipients, recipient_key
+from email_service.rendering import SkeletonTemplate
+from email_service.throttle import DomainRateLimiter, TokenBucket
 from website.models import (
     BrokerContactLog,
     Consumer,
     ConsumerBrokerStatus,
     DataBrokers2025,
+    EmailDripState,
 )
 
 
+_logs_override = None
+
+
+def setUpModule():
+    # Command logs and run summaries go to a scratch dir, not the working tree.
+    global _logs_override
+    _logs_override = override_settings(LOGS_ROOT=Path(tempfile.mkdtemp()))
+    _logs_override.enable()
+
+
+def tearDownModule():
+    shutil.rmtree(_logs_override.options["LOGS_ROOT"], ignore_errors=True)
+    _logs_override.disable()
+
+
+class CountingBackend(locmem.EmailBackend):
+    """locmem backend that records open/close calls and can drop a session once."""
+
+    opened = 0
+    closed = 0
+    disconnect_next = False
+
+    def open(self):
+        CountingBackend.opened += 1
+
+    def close(self):
+        CountingBackend.closed += 1
+
+    def send_messages(self, messages):
+        if CountingBackend.disconnect_next:
+            CountingBackend.disconnect_next = False
+            raise SMTPServerDisconnected("Connection unexpectedly closed")
+        return super().send_messages(messages)
+
+
+class EmailConnectionPoolTests(TestCase):
+    backend = "email_service.tests.CountingBackend"
+
+    def setUp(self):
+        CountingBackend.opened = 0
+        CountingBackend.closed = 0
+        CountingBackend.disconnect_next = False
+
+    def _message(self, n):
+        return EmailMessage(f"Message {n}", "body", "from@example.com", ["to@example.com"])
+
+    def test_reuses_one_connection_for_many_messages(self):
+        with EmailConnectionPool(size=1, backend=self.backend) as pool:
+            sent = pool.send_messages([self._message(n) for n in range(5)])
+        self.assertEqual(sent, 5)
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertEqual(CountingBackend.closed, 1)
+
+    def test_recycles_connection_after_max_messages(self):
+        with EmailConnectionPool(size=1, max_messages=2, backend=self.backend) as pool:
+            pool.send_messages([self._message(n) for n in range(5)])
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(CountingBackend.opened, 3)
+
+    def test_reconnects_after_server_timeout(self):
+        with EmailConnectionPool(size=1, backend=self.backend) as pool:
+            pool.send(self._message(1))
+            CountingBackend.disconnect_next = True
+            self.assertEqual(pool.send(self._message(2)), 1)
+        self.assertEqual([m.subject for m in mail.outbox], ["Message 1", "Message 2"])
+        self.assertEqual(CountingBackend.opened, 2)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+        self.slept: list[float] = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class ThrottleTests(SimpleTestCase):
+    def test_token_bucket_allows_burst_then_paces(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock, sleep=clock.sleep)
+        waits = [bucket.acquire() for _ in range(4)]
+        self.assertEqual(waits, [0.0, 0.0, 0.5, 0.5])
+
+    def test_token_bucket_wait_time_does_not_take_a_token(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, clock=clock, sleep=clock.sleep)
+        self.assertEqual(bucket.wait_time(), 0.0)
+        bucket.acquire()
+        self.assertEqual(bucket.wait_time(), 1.0)
+        self.assertEqual(bucket.wait_time(), 1.0)
+        self.assertEqual(bucket.acquire(), 1.0)
+
+    def test_domain_limiter_keeps_separate_buckets(self):
+        clock = FakeClock()
+        limiter = DomainRateLimiter(per_minute=60, burst=1, clock=clock, sleep=clock.sleep)
+        limiter.acquire(["a@one.example"])
+        limiter.acquire(["Privacy <b@two.example>"])
+        self.assertEqual(clock.slept, [])
+        limiter.acquire(["c@ONE.example"])
+        self.assertEqual(clock.slept, [1.0])
+
+    def test_zero_rate_disables_limiting(self):
+        limiter = DomainRateLimiter(per_minute=0)
+        self.assertFalse(limiter.enabled)
+        self.assertEqual(limiter.acquire(["a@one.example"] * 10), 0.0)
+
+
+class RecipientTests(SimpleTestCase):
+    def test_equivalent_cells_normalize_to_one_key(self):
+        cells = [
+            "Privacy <PRIVACY@Parent.example>; legal@parent.example",
+            " legal@parent.example ,privacy@parent.example,privacy@parent.example",
+        ]
+        self.assertEqual({recipient_key(cell) for cell in cells}, {"legal@parent.example,privacy@parent.example"})
+        self.assertEqual(normalize_recipients("see website; n/a"), [])
+        self.assertEqual(recipient_key(None), "")
+
+
+class RunMetricsTests(SimpleTestCase):
+    def test_percentile_interpolates(self):
+        self.assertIsNone(percentile([], 50))
+        self.assertEqual(percentile([4.0], 99), 4.0)
+        self.assertEqual(percentile([1.0, 2.0, 3.0, 4.0], 50), 2.5)
+        self.assertAlmostEqual(percentile(list(range(1, 101)), 90), 90.1)
+
+    def test_summary_reports_phases_and_throughput(self):
+        clock = FakeClock()
+        metrics = RunMetrics("unit", clock=clock)
+        with metrics.phase("query"):
+            clock.now += 0.5
+        for latency in (0.1, 0.2, 0.3):
+            with metrics.send():
+                clock.now += latency
+
+        summary = metrics.summary(3, dry_run=False)
+
+        self.assertEqual(summary["phases"]["query"], {"seconds": 0.5, "count": 1})
+        self.assertEqual(summary["phases"]["send"]["count"], 3)
+        self.assertAlmostEqual(summary["duration_seconds"], 1.1)
+        self.assertAlmostEqual(summary["messages_per_second"], 3 / 1.1, places=3)
+        self.assertAlmostEqual(summary["send_latency_seconds"]["p50"], 0.2)
+        self.assertAlmostEqual(summary["send_latency_seconds"]["max"], 0.3)
+        self.assertFalse(summary["dry_run"])
+
+
+class SkeletonTemplateTests(TestCase):
+    def test_outreach_skeleton_matches_full_render_byte_for_byte(self):
+        consumer = Consumer.objects.create(
+            first_name="Mary-Kate",
+            last_name="O'Brien & <Sons>",
+            primary_email="mk+\"quotes\"@example.com",
+        )
+        broker = DataBrokers2025.objects.create(name="Smith & Wesson <Data> 'Co'")
+        status = ConsumerBrokerStatus.objects.create(
+            consumer=consumer,
+            broker=broker,
+            request_type=ConsumerBrokerStatus.RequestType.DO_NOT_SELL,
+        )
+        link = f"https://example.com/broker-compliance/{status.tracking_token}/?a=1&b=<2>"
+        values = {
+            "consumer_name": consumer.full_name,
+            "consumer_email": consumer.primary_email,
+            "broker_name": broker.name,
+            "request_type": status.get_request_type_display(),
+            "compliance_link": link,
+        }
+        full_context = {"consumer": consumer, "status": status, "broker": broker, "compliance_link": link}
+
+        for ext in ("txt", "html"):
+            name = f"emails/broker_outreach_request.{ext}"
+            skeleton = SkeletonTemplate(name, outreach_context, OUTREACH_FIELDS)
+            self.assertTrue(skeleton.compiled)
+            self.assertEqual(
+                skeleton.render(values).encode("utf-8"),
+                render_to_string(name, full_context).encode("utf-8"),
+            )
+
+    def test_transformed_field_falls_back_to_full_render(self):
+        def build(values):
+            return {"value": values["name"]}
+
+        with patch("email_service.rendering.render_to_string", side_effect=lambda name, ctx: ctx["value"].upper()):
+            skeleton = SkeletonTemplate("unused.txt", build, ("name",))
+            self.assertFalse(skeleton.compiled)
+            self.assertEqual(skeleton.render({"name": "pat"}), "PAT")
+
+
 @override_settings(
     EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
     DEFAULT_FROM_EMAIL="support@example.com",
@@ -59,6 +272,64 @@ class SendConsumerWeeklyStatusCommandTests(TestCase):
         self.assertIsNotNone(consumer.last_status_email_at)
         self.assertGreater(consumer.last_status_email_at, before_run)
 
+    def test_batch_uses_constant_queries_and_matches_snapshots(self):
+        brokers = [DataBrokers2025.objects.create(name=f"Weekly {i}") for i in range(3)]
+        consumers = [
+            Consumer.objects.create(first_name=f"Weekly{i}", last_name="Test", primary_email=f"weekly{i}@example.com")
+            for i in range(4)
+        ]
+        for i, consumer in enumerate(consumers):
+            status = consumer.broker_statuses.get(broker=brokers[i % 3])
+            status.apply_broker_response(ConsumerBrokerStatus.Status.COMPLETED)
+        recent = consumers[3]
+        recent.last_status_email_at = timezone.now() - timedelta(days=1)
+        recent.save(update_fields=["last_status_email_at"])
+
+        lookback = timezone.now() - timedelta(days=7)
+        bulk = Consumer.bulk_progress_snapshots([consumer.id for consumer in consumers], window_start=lookback)
+        for consumer in consumers:
+            self.assertEqual(bulk[consumer.id], consumer.progress_snapshot(window_start=lookback))
+
+        # Consumer batch, grouped hot and archived status counts, one UPDATE,
+        # the empty follow-up batch and the metrics record.
+        with self.assertNumQueries(6):
+            call_command("send_consumer_weekly_status", days=7)
+
+        self.assertEqual(sorted(message.to[0] for message in mail.outbox), [f"weekly{i}@example.com" for i in range(3)])
+        self.assertIn("New confirmations this week: 1", mail.outbox[0].body)
+        self.assertEqual(
+            Consumer.objects.filter(last_status_email_at__gte=lookback + timedelta(days=6, hours=23)).count(),
+            3,
+        )
+
+    def test_failed_sends_are_counted_and_retried_next_run(self):
+        DataBrokers2025.objects.create(name="Weekly Data")
+        consumers = [
+            Consumer.objects.create(
+                first_name=f"Fail{i}",
+                last_name="Test",
+                primary_email=f"fail{i}@example.com",
+                weekly_status_opt_in=True,
+            )
+            for i in range(2)
+        ]
+        original_send = EmailConnectionPool.send
+
+        def flaky_send(pool, message):
+            if message.to == ["fail0@example.com"]:
+                raise SMTPException("mailbox unavailable")
+            return original_send(pool, message)
+
+        out = StringIO()
+        with patch.object(EmailConnectionPool, "send", flaky_send):
+            call_command("send_consumer_weekly_status", stdout=out)
+
+        self.assertIn("Emails sent=1 failed=1", out.getvalue())
+        run = CommandRun.objects.get(command="send_consumer_weekly_status")
+        self.assertEqual((run.messages_sent, run.summary["failed"]), (1, 1))
+        consumers[0].refresh_from_db()
+        self.assertIsNone(consumers[0].last_status_email_at)
+
 
 @override_settings(
     EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend",
@@ -107,3 +378,347 @@ class SendConsumerBrokerDripCommandTests(TestCase):
 
         drip_state = consumer.drip_state
         self.assertEqual(drip_state.last_batch_size, 1)
+
+    def test_batch_outcomes_are_written_in_bulk(self):
+        consumer = Consumer.objects.create(
+            first_name="Robin",
+            last_name="Park",
+            primary_email="robin@example.com",
+        )
+        brokers = [
+            DataBrokers2025.objects.create(name=f"Broker {i}", contact_email=f"privacy@broker{i}.example")
+            for i in range(3)
+        ]
+        statuses = [
+            ConsumerBrokerStatus.objects.create(
+                consumer=consumer,
+                broker=broker,
+                status=ConsumerBrokerStatus.Status.QUEUED,
+            )
+            for broker in brokers
+        ]
+
+        original_send = EmailConnectionPool.send
+
+        def flaky_send(pool, message):
+            if "privacy@broker1.example" in message.to:
+                raise SMTPException("mailbox unavailable")
+            return original_send(pool, message)
+
+        with patch.object(EmailConnectionPool, "send", flaky_send), patch.object(
+            ConsumerBrokerStatus, "save", side_effect=AssertionError("per-row save")
+        ):
+            call_command("send_consumer_broker_drip", consumer_id=consumer.id)
+
+        self.assertEqual(len(mail.outbox), 2)
+        for status in statuses:
+            status.refresh_from_db()
+        self.assertEqual(statuses[0].status, ConsumerBrokerStatus.Status.CONTACTED)
+        self.assertEqual(statuses[1].status, ConsumerBrokerStatus.Status.BOUNCED)
+        self.assertIn("mailbox unavailable", statuses[1].notes)
+        self.assertEqual(statuses[2].status, ConsumerBrokerStatus.Status.CONTACTED)
+        self.assertEqual(BrokerContactLog.objects.filter(consumer=consumer, success=True).count(), 2)
+        failed_log = BrokerContactLog.objects.get(consumer=consumer, success=False)
+        self.assertEqual(failed_log.status_id, statuses[1].id)
+        self.assertEqual(consumer.drip_state.last_batch_size, 2)
+
+    def test_failed_bookkeeping_rolls_back_every_transition(self):
+        consumer = Consumer.objects.create(
+            first_name="Alex",
+            last_name="Kim",
+            primary_email="alex@example.com",
+        )
+        broker = DataBrokers2025.objects.create(name="DataCo", contact_email="privacy@dataco.example")
+        status = ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+
+        with patch.object(BrokerContactLog.objects, "bulk_create", side_effect=DatabaseError("boom")):
+            with self.assertRaises(DatabaseError):
+                call_command("send_consumer_broker_drip", consumer_id=consumer.id)
+
+        status.refresh_from_db()
+        self.assertEqual(status.status, ConsumerBrokerStatus.Status.QUEUED)
+        self.assertIsNone(status.contacted_at)
+        self.assertFalse(BrokerContactLog.objects.exists())
+
+    def test_worker_pool_matches_sequential_results(self):
+        consumer = Consumer.objects.create(
+            first_name="Sam",
+            last_name="Reyes",
+            primary_email="sam@example.com",
+        )
+        brokers = [
+            DataBrokers2025.objects.create(name=f"Broker {i}", contact_email=f"privacy@broker{i}.example")
+            for i in range(4)
+        ]
+        for broker in brokers:
+            ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+
+        call_command("send_consumer_broker_drip", consumer_id=consumer.id, workers=3, domain_rate=0)
+
+        self.assertCountEqual(
+            [message.to for message in mail.outbox],
+            [[broker.contact_email] for broker in brokers],
+        )
+        statuses = consumer.broker_statuses.all()
+        self.assertTrue(all(s.status == ConsumerBrokerStatus.Status.CONTACTED for s in statuses))
+        self.assertEqual(BrokerContactLog.objects.filter(consumer=consumer, success=True).count(), 4)
+        self.assertEqual(consumer.drip_state.last_batch_size, 4)
+
+    def test_digest_mode_sends_one_email_per_broker(self):
+        consumers = [
+            Consumer.objects.create(first_name=name, last_name="Test", primary_email=f"{name.lower()}@example.com")
+            for name in ("Ana", "Ben", "Cal")
+        ]
+        brokers = [
+            DataBrokers2025.objects.create(name=f"Broker {i}", contact_email=f"privacy@broker{i}.example")
+            for i in range(2)
+        ]
+        for consumer in consumers:
+            for broker in brokers:
+                ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+
+        call_command("send_consumer_broker_drip", digest=True, domain_rate=0)
+
+        self.assertEqual(len(mail.outbox), 2)
+        first = mail.outbox[0]
+        self.assertEqual(first.to, ["privacy@broker0.example"])
+        self.assertIn("3 consumer(s)", first.subject)
+        for consumer in consumers:
+            self.assertIn(consumer.full_name, first.body)
+            status = consumer.broker_statuses.get(broker=brokers[0])
+            self.assertIn(str(status.tracking_token), first.body)
+
+        self.assertFalse(
+            ConsumerBrokerStatus.objects.exclude(status=ConsumerBrokerStatus.Status.CONTACTED).exists()
+        )
+        logs = BrokerContactLog.objects.filter(success=True)
+        self.assertEqual(logs.count(), 6)
+        self.assertEqual(logs.first().metadata, {"digest_size": 3})
+        for consumer in consumers:
+            consumer.drip_state.refresh_from_db()
+            self.assertEqual(consumer.drip_state.last_batch_size, 2)
+            self.assertEqual(consumer.drip_state.total_contacted, 2)
+
+    def test_brokers_sharing_an_address_get_one_email(self):
+        consumer = Consumer.objects.create(first_name="Dee", last_name="Moss", primary_email="dee@example.com")
+        brokers = [
+            DataBrokers2025.objects.create(name="Parent A", contact_email="privacy@parent.example"),
+            DataBrokers2025.objects.create(name="Other", contact_email="privacy@other.example"),
+            DataBrokers2025.objects.create(name="Parent B", contact_email="Privacy Team <PRIVACY@parent.example>;"),
+            # No usable address, so its row is never picked for a batch.
+            DataBrokers2025.objects.create(name="Unreachable", contact_email="Privacy Team"),
+        ]
+        for broker in brokers:
+            ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+
+        out = StringIO()
+        call_command(
+            "send_consumer_broker_drip", consumer_id=consumer.id, domain_rate=0, subject="{broker}", stdout=out
+        )
+        self.assertIn("Emails sent=2", out.getvalue())
+
+        self.assertEqual(
+            [message.to for message in mail.outbox], [["privacy@parent.example"], ["privacy@other.example"]]
+        )
+        combined = mail.outbox[0]
+        self.assertEqual(combined.subject, "Parent A, Parent B")
+        for status in consumer.broker_statuses.filter(broker__contact_recipients="privacy@parent.example"):
+            self.assertIn(str(status.tracking_token), combined.body)
+        self.assertEqual(BrokerContactLog.objects.filter(success=True, metadata={"digest_size": 2}).count(), 2)
+        self.assertEqual(consumer.drip_state.last_batch_size, 3)
+        unreachable = consumer.broker_statuses.get(broker=brokers[3])
+        self.assertEqual(unreachable.status, ConsumerBrokerStatus.Status.QUEUED)
+
+    def test_digest_crash_resumes_without_resending_recorded_digests(self):
+        consumers = [
+            Consumer.objects.create(first_name=name, last_name="Test", primary_email=f"{name.lower()}@example.com")
+            for name in ("Ana", "Ben", "Cal")
+        ]
+        brokers = [
+            DataBrokers2025.objects.create(name=f"Broker {i}", contact_email=f"privacy@broker{i}.example")
+            for i in range(3)
+        ]
+        for consumer in consumers[:2]:
+            for broker in brokers:
+                ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+        # Cal's batch is complete after the first digest.
+        ConsumerBrokerStatus.objects.create(consumer=consumers[2], broker=brokers[0])
+
+        original_bulk_create = BrokerContactLog.objects.bulk_create
+        calls = []
+
+        def fail_third_digest(objs, *args, **kwargs):
+            calls.append(objs)
+            if len(calls) == 3:
+                raise DatabaseError("connection lost")
+            return original_bulk_create(objs, *args, **kwargs)
+
+        with patch.object(BrokerContactLog.objects, "bulk_create", side_effect=fail_third_digest):
+            with self.assertRaises(DatabaseError):
+                call_command("send_consumer_broker_drip", digest=True, domain_rate=0)
+
+        run = DripRun.objects.get()
+        self.assertEqual(run.status, DripRun.Status.FAILED)
+        self.assertIsNone(run.last_consumer_id)
+        self.assertEqual(BrokerContactLog.objects.count(), 5)
+        self.assertEqual(len(mail.outbox), 3)
+
+        call_command("send_consumer_broker_drip", domain_rate=0, resume=True)
+
+        # Only the unrecorded third digest goes out again.
+        self.assertEqual([message.to for message in mail.outbox[3:]], [["privacy@broker2.example"]])
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.last_consumer_id, run.total_sent), ("completed", consumers[1].id, 7))
+        self.assertFalse(ConsumerBrokerStatus.objects.exclude(status=ConsumerBrokerStatus.Status.CONTACTED).exists())
+        for consumer, contacted in zip(consumers, (3, 3, 1)):
+            state = EmailDripState.objects.get(consumer=consumer)
+            self.assertEqual((state.sequence_index, state.total_contacted), (1, contacted))
+
+    def test_run_start_uses_constant_queries_for_idle_consumers(self):
+        broker = DataBrokers2025.objects.create(name="DataCo", contact_email="privacy@dataco.example")
+        for i in range(5):
+            consumer = Consumer.objects.create(first_name=f"Idle{i}", last_name="Test", primary_email=f"idle{i}@example.com")
+            ConsumerBrokerStatus.objects.update_or_create(
+                consumer=consumer,
+                broker=broker,
+                defaults={"status": ConsumerBrokerStatus.Status.COMPLETED},
+            )
+
+        # Run insert, exists(), pending onboarding, consumers, drip states,
+        # one insert for the missing states, their reload, a single grouped
+        # status count, the run's completion update and the metrics record.
+        with self.assertNumQueries(10):
+            call_command("send_consumer_broker_drip", domain_rate=0)
+        self.assertEqual(EmailDripState.objects.count(), 5)
+        self.assertEqual(len(mail.outbox), 0)
+
+        with self.assertNumQueries(8):
+            call_command("send_consumer_broker_drip", domain_rate=0)
+
+    def test_resume_skips_consumers_the_failed_run_recorded(self):
+        consumers = [
+            Consumer.objects.create(first_name=f"Resume{i}", last_name="Test", primary_email=f"resume{i}@example.com")
+            for i in range(3)
+        ]
+        brokers = [
+            DataBrokers2025.objects.create(name=f"Broker {i}", contact_email=f"privacy@broker{i}.example")
+            for i in range(2)
+        ]
+        for consumer in consumers:
+            for broker in brokers:
+                ConsumerBrokerStatus.objects.create(consumer=consumer, broker=broker)
+
+        original_bulk_create = BrokerContactLog.objects.bulk_create
+        calls = []
+
+        def fail_second_consumer(objs, *args, **kwargs):
+            calls.append(objs)
+            if len(calls) == 2:
+                raise DatabaseError("connection lost")
+            return original_bulk_create(objs, *args, **kwargs)
+
+        with patch.object(BrokerContactLog.objects, "bulk_create", side_effect=fail_second_consumer):
+            with self.assertRaises(DatabaseError):
+                call_command("send_consumer_broker_drip", max_batch=1, domain_rate=0)
+
+        run = DripRun.objects.get()
+        self.assertEqual(run.status, DripRun.Status.FAILED)
+        self.assertEqual(run.last_consumer_id, consumers[0].id)
+        self.assertEqual(run.sent_counts, {str(consumers[0].id): 1})
+
+        # The stored options win over flags that differ on the resuming command.
+        call_command("send_consumer_broker_drip", max_batch=5, digest=True, domain_rate=0, resume=True)
+
+        run.refresh_from_db()
+        self.assertFalse(BrokerContactLog.objects.filter(metadata__has_key="digest_size").exists())
+        self.assertEqual(DripRun.objects.count(), 1)
+        self.assertEqual(run.status, DripRun.Status.COMPLETED)
+        self.assertEqual(run.last_consumer_id, consumers[2].id)
+        self.assertEqual(run.total_sent, 3)
+        contacted = dict(
+            ConsumerBrokerStatus.objects.filter(status=ConsumerBrokerStatus.Status.CONTACTED)
+            .values_list("consumer_id")
+            .annotate(n=Count("id"))
+        )
+        self.assertEqual(contacted, {consumer.id: 1 for consumer in consumers})
+
+        # Nothing left to resume: a new run starts from the first consumer.
+        call_command("send_consumer_broker_drip", max_batch=1, domain_rate=0, resume=True)
+        self.assertEqual(DripRun.objects.count(), 2)
+        self.assertFalse(
+            ConsumerBrokerStatus.objects.filter(status=ConsumerBrokerStatus.Status.QUEUED).exists()
+        )
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class ProcessEmailQueueCommandTests(TestCase):
+    def test_enqueue_message_keeps_html_alternative(self):
+        message = EmailMultiAlternatives("Hi", "text", "from@example.com", ["to@example.com"], reply_to=["r@example.com"])
+        message.attach_alternative("<p>html</p>", "text/html")
+        queued = enqueue_message(message)
+
+        rebuilt = queued.to_message()
+        self.assertEqual(rebuilt.to, ["to@example.com"])
+        self.assertEqual(rebuilt.reply_to, ["r@example.com"])
+        self.assertEqual(rebuilt.alternatives[0][0], "<p>html</p>")
+
+    def test_sends_pending_rows_and_marks_them_sent(self):
+        first = enqueue_email("First", "body", "from@example.com", ["a@example.com"])
+        second = enqueue_email("Second", "body", "from@example.com", ["b@example.com"])
+        later = enqueue_email("Later", "body", "from@example.com", ["c@example.com"])
+        OutboundEmail.objects.filter(pk=later.pk).update(next_attempt_at=timezone.now() + timedelta(hours=1))
+
+        call_command("process_email_queue", batch_size=1)
+
+        self.assertEqual([m.subject for m in mail.outbox], ["First", "Second"])
+        for row in (first, second):
+            row.refresh_from_db()
+            self.assertEqual(row.status, OutboundEmail.Status.SENT)
+            self.assertEqual(row.attempts, 1)
+            self.assertIsNotNone(row.sent_at)
+        later.refresh_from_db()
+        self.assertEqual(later.status, OutboundEmail.Status.PENDING)
+
+    def test_failures_back_off_then_give_up(self):
+        row = enqueue_email("Flaky", "body", "from@example.com", ["a@example.com"])
+        OutboundEmail.objects.filter(pk=row.pk).update(max_attempts=2)
+
+        with patch.object(EmailConnectionPool, "send", side_effect=SMTPException("451 try later")):
+            call_command("process_email_queue", retry_delay=30)
+            row.refresh_from_db()
+            self.assertEqual(row.status, OutboundEmail.Status.PENDING)
+            self.assertEqual(row.attempts, 1)
+            self.assertIn("451", row.last_error)
+            self.assertGreater(row.next_attempt_at, timezone.now() + timedelta(seconds=25))
+
+            OutboundEmail.objects.filter(pk=row.pk).update(next_attempt_at=timezone.now())
+            call_command("process_email_queue", retry_delay=30)
+            row.refresh_from_db()
+            self.assertEqual(row.status, OutboundEmail.Status.FAILED)
+            self.assertEqual(row.attempts, 2)
+        self.assertEqual(len(mail.outbox), 0)
+
+    def test_run_records_timing_summary(self):
+        enqueue_email("One", "body", "from@example.com", ["a@example.com"])
+        enqueue_email("Two", "body", "from@example.com", ["b@example.com"])
+
+        call_command("process_email_queue")
+
+        run = CommandRun.objects.get(command="process_email_queue")
+        self.assertEqual(run.messages_sent, 2)
+        self.assertEqual(run.summary["phases"]["send"]["count"], 2)
+        self.assertEqual(set(run.summary["phases"]), {"query", "render", "send", "bookkeeping"})
+        self.assertIsNotNone(run.summary["send_latency_seconds"]["p90"])
+
+    def test_reclaims_rows_stuck_in_sending(self):
+        row = enqueue_email("Stuck", "body", "from@example.com", ["a@example.com"])
+        OutboundEmail.objects.filter(pk=row.pk).update(
+            status=OutboundEmail.Status.SENDING,
+            locked_at=timezone.now() - timedelta(hours=1),
+        )
+
+        call_command("process_email_queue")
+
+        row.refresh_from_db()
+        self.assertEqual(row.status, OutboundEmail.Status.SENT)
+        self.assertEqual(len(mail.outbox), 1)
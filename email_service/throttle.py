@@ -0,0 +1,90 @@
+import threading
+import time
+from email.utils import parseaddr
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, bursting to ``capacity``.
+
+    ``acquire`` reserves a token under the lock and sleeps outside it, so
+    concurrent callers queue up fairly instead of spinning.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1, *, clock=time.monotonic, sleep=time.sleep):
+        if rate <= 0:
+            raise ValueError("TokenBucket rate must be positive.")
+        self.rate = float(rate)
+        self.capacity = max(1, int(capacity))
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.capacity)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def wait_time(self) -> float:
+        """Seconds until a token would be free, without taking one."""
+        with self._lock:
+            tokens = min(self.capacity, self._tokens + (self._clock() - self._updated) * self.rate)
+        return max(0.0, (1 - tokens) / self.rate)
+
+    def acquire(self) -> float:
+        """Take one token, blocking until it is available. Returns seconds waited."""
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self._sleep(wait)
+        return wait
+
+
+def recipient_domain(address: str) -> str:
+    """Return the lower-cased domain of an email address ("" when there is none)."""
+    _, addr = parseaddr(address or "")
+    if "@" not in addr:
+        return ""
+    return addr.rsplit("@", 1)[1].strip().lower()
+
+
+class DomainRateLimiter:
+    """One ``TokenBucket`` per recipient domain, created on first use.
+
+    ``per_minute`` of 0 (or less) disables limiting entirely.
+    """
+
+    def __init__(self, per_minute: float, burst: int = 1, *, clock=time.monotonic, sleep=time.sleep):
+        self.per_minute = float(per_minute or 0)
+        self.burst = max(1, int(burst or 1))
+        self._clock = clock
+        self._sleep = sleep
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.per_minute > 0
+
+    def _bucket(self, domain: str) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(domain)
+            if bucket is None:
+                bucket = TokenBucket(
+                    self.per_minute / 60.0,
+                    self.burst,
+                    clock=self._clock,
+                    sleep=self._sleep,
+                )
+                self._buckets[domain] = bucket
+            return bucket
+
+    def acquire(self, recipients) -> float:
+        """Block until every recipient domain of one message has a token free."""
+        if not self.enabled:
+            return 0.0
+        waited = 0.0
+        # Sorted so two threads never take the same pair of buckets in opposite order.
+        for domain in sorted({recipient_domain(r) for r in recipients} - {""}):
+            waited += self._bucket(domain).acquire()
+        return waited
@@ -1,3 +1,6 @@
+import shutil
+import tempfile
+from pathlib import Path
 from unittest import mock
 
 import httpx
@@ -8,6 +11,21 @@ from django.test import TestCase, override_settings
 from insights.models import Insight, InsightSection
 
 
+_logs_override = None
+
+
+def setUpModule():
+    # Command logs and run summaries go to a scratch dir, not the working tree.
+    global _logs_override
+    _logs_override = override_settings(LOGS_ROOT=Path(tempfile.mkdtemp()))
+    _logs_override.enable()
+
+
+def tearDownModule():
+    shutil.rmtree(_logs_override.options["LOGS_ROOT"], ignore_errors=True)
+    _logs_override.disable()
+
+
 def _post(post_id=1208, **overrides):
     data = {
         "id": post_id,
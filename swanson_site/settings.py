@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 import os
+import tempfile
 from pathlib import Path
 
 
@@ -51,6 +52,11 @@ except Exception:
     # Directory creation failure should not crash Django startup
     pass
 
+# Cached broker CSV exports (contain PII; not publicly served), kept outside
+# the project tree and pruned after DNE_EXPORT_MAX_AGE_DAYS; see website/exports.py.
+DNE_EXPORT_ROOT = Path(os.getenv('DNE_EXPORT_ROOT', Path(tempfile.gettempdir()) / 'swanson-dne-exports'))
+DNE_EXPORT_MAX_AGE_DAYS = int(os.getenv('DNE_EXPORT_MAX_AGE_DAYS', '3'))
+
 
 # Quick-start development settings - unsuitable for production
 # See https://docs.djangoproject.com/en/5.2/howto/deployment/checklist/
@@ -176,8 +182,15 @@ TEST_BROKER_RECIPIENTS = env_list('TEST_BROKER_RECIPIENTS', default=[
     "daswanson22@gmail.com",
 ])
 
+# SMTP connection pooling for management-command senders (email_service.connection)
+EMAIL_POOL_SIZE = int(os.getenv('EMAIL_POOL_SIZE', 2))
+EMAIL_POOL_MAX_MESSAGES = int(os.getenv('EMAIL_POOL_MAX_MESSAGES', 100))
+
 # Broker outreach tuning
 BROKER_DRIP_BATCH_SEQUENCE = [5, 10, 20, 30, 50, 75, 100]
+# Per-recipient-domain ceiling for the drip, in emails/minute (0 disables) and burst size
+BROKER_DRIP_DOMAIN_RATE = float(os.getenv('BROKER_DRIP_DOMAIN_RATE', 30))
+BROKER_DRIP_DOMAIN_BURST = int(os.getenv('BROKER_DRIP_DOMAIN_BURST', 5))
 # Internationalization
 # https://docs.djangoproject.com/en/5.2/topics/i18n/
 
@@ -2,11 +2,15 @@ from django.contrib import admin
 from django.utils.html import format_html
 
 from .models import (
+    AcknowledgementRun,
     DoNotEmailRequest,
     DoNotCallRequest,
     DataBrokers2025,
     Consumer,
+    ConsumerProgress,
     BrokerContactLog,
+    ArchivedBrokerContactLog,
+    ArchivedConsumerBrokerStatus,
     EmailDripState,
     ConsumerBrokerStatus,
     NewsletterSubscriber,
@@ -45,10 +49,32 @@ class DoNotCallRequestAdmin(admin.ModelAdmin):
 
 admin.site.register(DoNotEmailRequest, DoNotEmailRequestAdmin)
 admin.site.register(DoNotCallRequest, DoNotCallRequestAdmin)
+class ConsumerProgressInline(admin.StackedInline):
+    model = ConsumerProgress
+    can_delete = False
+    readonly_fields = (
+        "queued_count",
+        "contacted_count",
+        "processing_count",
+        "completed_count",
+        "rejected_count",
+        "bounced_count",
+        "no_response_count",
+        "skipped_count",
+        "contacted_total",
+        "last_completed_at",
+        "updated_at",
+    )
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
 @admin.register(Consumer)
 class ConsumerAdmin(admin.ModelAdmin):
     list_display = ("id", "first_name", "last_name", "primary_email", "phone", "created_at", "weekly_status_opt_in")
     search_fields = ("id", "first_name", "last_name", "primary_email")
+    inlines = (ConsumerProgressInline,)
 
 
 admin.site.register(BrokerContactLog)
@@ -70,6 +96,25 @@ class ConsumerBrokerStatusAdmin(admin.ModelAdmin):
     search_fields = ("consumer__first_name", "consumer__last_name", "broker__name", "tracking_token")
     readonly_fields = ("tracking_token", "created_at", "updated_at")
 
+
+@admin.register(ArchivedConsumerBrokerStatus)
+class ArchivedConsumerBrokerStatusAdmin(admin.ModelAdmin):
+    list_display = ("consumer", "broker", "status", "request_type", "completed_at", "archived_at")
+    list_filter = ("status", "request_type")
+    search_fields = ("consumer__first_name", "consumer__last_name", "broker__name", "tracking_token")
+    list_select_related = ("consumer", "broker")
+
+
+admin.site.register(ArchivedBrokerContactLog)
+
+
+@admin.register(AcknowledgementRun)
+class AcknowledgementRunAdmin(admin.ModelAdmin):
+    list_display = ("id", "status", "last_broker_id", "sent", "skipped", "failed", "total", "started_at", "finished_at")
+    list_filter = ("status",)
+    readonly_fields = ("started_at", "updated_at", "finished_at", "last_sent_at")
+
+
 @admin.register(DataBrokers2025)
 class DataBrokers2025Admin(admin.ModelAdmin):
     list_display = ("name", "state", "website", "contact_email")
@@ -0,0 +1,282 @@
+import csv
+import gzip
+import importlib.util
+import io
+import os
+import tempfile
+import zipfile
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.db.models import Count, Max
+from django.utils import timezone
+
+from .models import DoNotEmailRequest
+
+WINDOW_TZ = ZoneInfo("America/Los_Angeles")
+
+DNE_CSV_HEADER = [
+    "first_name",
+    "last_name",
+    "email1",
+    "email2",
+    "address1",
+    "address2",
+    "city",
+    "state",
+    "postal",
+    "region",
+    "created_at",
+]
+
+# Model fields behind each DNE_CSV_HEADER column, read with values_list().
+_ROW_FIELDS = (
+    "first_name",
+    "last_name",
+    "primary_email",
+    "secondary_email",
+    "address1",
+    "address2",
+    "city",
+    "region",
+    "postal",
+    "created_at",
+)
+
+# Rows fetched per database round trip / bytes per streamed chunk.
+ROW_CHUNK_SIZE = 2000
+STREAM_CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    """An output format for window exports; every format carries the same columns."""
+
+    name: str
+    extension: str
+    content_type: str
+    label: str
+
+
+def parquet_available() -> bool:
+    """Whether pandas and a Parquet engine (pyarrow or fastparquet) are installed."""
+    return importlib.util.find_spec("pandas") is not None and any(
+        importlib.util.find_spec(engine) is not None for engine in ("pyarrow", "fastparquet")
+    )
+
+
+EXPORT_FORMATS = {
+    fmt.name: fmt
+    for fmt in (
+        ExportFormat("csv", ".csv", "text/csv", "CSV"),
+        ExportFormat("csv.gz", ".csv.gz", "application/gzip", "CSV (gzip)"),
+        ExportFormat("zip", ".zip", "application/zip", "ZIP"),
+    )
+}
+# Parquet needs an optional engine; only offer it where one is installed.
+if parquet_available():
+    EXPORT_FORMATS["parquet"] = ExportFormat("parquet", ".parquet", "application/vnd.apache.parquet", "Parquet")
+DEFAULT_EXPORT_FORMAT = "csv"
+
+
+def get_export_format(name: str | None) -> ExportFormat:
+    """Look up a format by name (``None`` means CSV); raises ``ValueError`` for unknown names."""
+    try:
+        return EXPORT_FORMATS[(name or DEFAULT_EXPORT_FORMAT).lower()]
+    except KeyError:
+        raise ValueError(f"Unknown export format {name!r}; choose from {', '.join(EXPORT_FORMATS)}.") from None
+
+
+@dataclass(frozen=True)
+class WindowExport:
+    """A generated export of paid Stop My Spam records for one LA window."""
+
+    path: Path
+    filename: str
+    row_count: int
+    format: ExportFormat = EXPORT_FORMATS[DEFAULT_EXPORT_FORMAT]
+
+    @property
+    def content_type(self) -> str:
+        return self.format.content_type
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def read_text(self) -> str:
+        """The CSV text; only meaningful for the plain ``csv`` format."""
+        # newline="" keeps the csv module's \r\n line endings intact.
+        with self.path.open(encoding="utf-8", newline="") as fh:
+            return fh.read()
+
+
+def default_window(now: datetime | None = None) -> tuple[datetime, datetime]:
+    """Prior-day 8am -> today 8am (America/Los_Angeles)."""
+    now_la = (now or timezone.now()).astimezone(WINDOW_TZ)
+    end = timezone.make_aware(datetime.combine(now_la.date(), time(8)), WINDOW_TZ)
+    if now_la < end:
+        end -= timedelta(days=1)
+    return end - timedelta(days=1), end
+
+
+def window_queryset(start: datetime, end: datetime):
+    return DoNotEmailRequest.objects.filter(
+        paid_confirmed=True,
+        created_at__gte=start,
+        created_at__lt=end,
+    ).order_by("created_at")
+
+
+def window_rows(start: datetime, end: datetime) -> Iterator[list[str]]:
+    """CSV rows for a window, read in chunks without building model instances."""
+    rows = window_queryset(start, end).values_list(*_ROW_FIELDS).iterator(chunk_size=ROW_CHUNK_SIZE)
+    for first, last, email1, email2, address1, address2, city, region, postal, created_at in rows:
+        yield [
+            first,
+            last,
+            email1,
+            email2 or "",
+            address1,
+            address2 or "",
+            city,
+            region,
+            postal,
+            region,
+            created_at.astimezone(WINDOW_TZ).isoformat(),
+        ]
+
+
+class _Echo:
+    """File-like sink that hands back what ``csv.writer`` writes."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def stream_window_csv(
+    start: datetime, end: datetime, rows: Iterable[list[str]] | None = None
+) -> Iterator[bytes]:
+    """The window's CSV as UTF-8 chunks of roughly ``STREAM_CHUNK_BYTES``, at constant memory.
+
+    ``rows`` lets a caller pass a ``window_rows`` iterator it has already started.
+    """
+    writer = csv.writer(_Echo())
+    buffer = [writer.writerow(DNE_CSV_HEADER)]
+    size = len(buffer[0])
+    for row in window_rows(start, end) if rows is None else rows:
+        line = writer.writerow(row)
+        buffer.append(line)
+        size += len(line)
+        if size >= STREAM_CHUNK_BYTES:
+            yield "".join(buffer).encode("utf-8")
+            buffer, size = [], 0
+    if buffer:
+        yield "".join(buffer).encode("utf-8")
+
+
+def window_filename(start: datetime, end: datetime, fmt: ExportFormat | None = None) -> str:
+    start_label = start.astimezone(WINDOW_TZ).strftime("%Y%m%d_%H%M")
+    end_label = end.astimezone(WINDOW_TZ).strftime("%Y%m%d_%H%M")
+    extension = fmt.extension if fmt else ".csv"
+    return f"dne_records_{start_label}_to_{end_label}{extension}"
+
+
+def export_root() -> Path:
+    return Path(getattr(settings, "DNE_EXPORT_ROOT", Path(tempfile.gettempdir()) / "swanson-dne-exports"))
+
+
+def prune_exports(root: Path, keep: Path | None = None) -> int:
+    """Delete cached exports (and orphaned temp files) older than ``DNE_EXPORT_MAX_AGE_DAYS``.
+
+    Exports are regenerated on demand, so pruning only costs a rebuild.
+    Returns the number of files removed.
+    """
+    cutoff = (timezone.now() - timedelta(days=getattr(settings, "DNE_EXPORT_MAX_AGE_DAYS", 3))).timestamp()
+    removed = 0
+    for pattern in ("dne_*", ".tmp-*"):
+        for path in root.glob(pattern):
+            try:
+                if path != keep and path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                continue
+    return removed
+
+
+def _write_csv_rows(fh, start: datetime, end: datetime) -> None:
+    writer = csv.writer(fh)
+    writer.writerow(DNE_CSV_HEADER)
+    writer.writerows(window_rows(start, end))
+
+
+def _write_parquet(fh, start: datetime, end: datetime) -> None:
+    # pandas (and its pyarrow/fastparquet engine) is only needed for this format.
+    import pandas as pd
+
+    frame = pd.DataFrame.from_records(window_rows(start, end), columns=DNE_CSV_HEADER)
+    frame.to_parquet(fh, index=False, compression="snappy")
+
+
+def _write_export(path: Path, start: datetime, end: datetime, fmt: ExportFormat) -> None:
+    # The files hold PII, so the directory is private to the app user.
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # Write beside the target and rename so readers never see a partial file.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=".tmp-", suffix=fmt.extension)
+    try:
+        if fmt.name == "csv":
+            with os.fdopen(fd, "w", newline="", encoding="utf-8") as fh:
+                _write_csv_rows(fh, start, end)
+        elif fmt.name == "csv.gz":
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", newline="", encoding="utf-8") as fh:
+                _write_csv_rows(fh, start, end)
+        elif fmt.name == "zip":
+            member = window_filename(start, end)
+            with os.fdopen(fd, "wb") as raw, zipfile.ZipFile(raw, "w", zipfile.ZIP_DEFLATED) as archive:
+                with archive.open(member, "w") as binary:
+                    with io.TextIOWrapper(binary, encoding="utf-8", newline="") as fh:
+                        _write_csv_rows(fh, start, end)
+        else:
+            with os.fdopen(fd, "wb") as fh:
+                _write_parquet(fh, start, end)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+def window_export(start: datetime, end: datetime, fmt: ExportFormat | str | None = None) -> WindowExport | None:
+    """Return the export for a window, generating it only when the data changed.
+
+    Files are cached under ``DNE_EXPORT_ROOT`` and keyed by the window bounds
+    plus a (row count, max id) fingerprint, so a new paid signup inside the
+    window produces a fresh file while repeat downloads and drip attachments
+    reuse the stored one. Writing a new file also prunes exports of any window
+    older than ``DNE_EXPORT_MAX_AGE_DAYS``. ``fmt`` picks one of ``EXPORT_FORMATS`` (CSV by
+    default); each format is cached separately. Returns ``None`` when the
+    window has no records.
+    """
+    if not isinstance(fmt, ExportFormat):
+        fmt = get_export_format(fmt)
+    fingerprint = window_queryset(start, end).order_by().aggregate(rows=Count("id"), max_id=Max("id"))
+    rows = fingerprint["rows"]
+    if not rows:
+        return None
+
+    filename = window_filename(start, end, fmt)
+    stem = f"dne_{int(start.timestamp())}_{int(end.timestamp())}"
+    path = export_root() / f"{stem}_{rows}_{fingerprint['max_id']}{fmt.extension}"
+    if not path.exists():
+        _write_export(path, start, end, fmt)
+        for stale in path.parent.glob(f"{stem}_*{fmt.extension}"):
+            if stale != path:
+                stale.unlink(missing_ok=True)
+        prune_exports(path.parent, keep=path)
+    return WindowExport(path=path, filename=filename, row_count=rows, format=fmt)
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
+
+from website.models import (
+    ArchivedBrokerContactLog,
+    ArchivedConsumerBrokerStatus,
+    BrokerContactLog,
+    ConsumerBrokerStatus,
+)
+
+# Shorter cut-offs would move completions that the weekly status email still
+# reports as recent; archived rows only count towards the all-time totals.
+MIN_DAYS = 30
+
+
+class Command(BaseCommand):
+    help = (
+        "Move completed/rejected ConsumerBrokerStatus rows (and their BrokerContactLog entries) that have "
+        "not changed for --days into the archive tables, keeping the hot tables small."
+    )
+
+    ARCHIVED_STATUSES = (
+        ConsumerBrokerStatus.Status.COMPLETED,
+        ConsumerBrokerStatus.Status.REJECTED,
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=90, help="Archive rows untouched for this many days.")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows moved per transaction.")
+        parser.add_argument("--dry-run", action="store_true", help="Only report what would be archived.")
+
+    def handle(self, *args, **opts):
+        if opts["days"] < MIN_DAYS:
+            raise CommandError(f"--days must be at least {MIN_DAYS}.")
+        batch_size = max(1, opts["batch_size"])
+        cutoff = timezone.now() - timedelta(days=opts["days"])
+        statuses = ConsumerBrokerStatus.objects.filter(
+            status__in=self.ARCHIVED_STATUSES,
+            updated_at__lt=cutoff,
+        )
+        logs = BrokerContactLog.objects.filter(sent_at__lt=cutoff)
+
+        if opts["dry_run"]:
+            self.stdout.write(
+                f"Would archive {statuses.count()} status row(s) and {logs.count()} old contact log(s) "
+                f"(cut-off {cutoff:%Y-%m-%d})."
+            )
+            return
+
+        archived_statuses = archived_logs = 0
+        last_id = 0
+        while True:
+            ids = list(statuses.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            last_id = ids[-1]
+            with transaction.atomic():
+                # Logs go first: deleting a status would otherwise cascade to them.
+                archived_logs += self._move(BrokerContactLog, ArchivedBrokerContactLog, "status_id", ids)
+                archived_statuses += self._move(ConsumerBrokerStatus, ArchivedConsumerBrokerStatus, "id", ids)
+
+        # Old log entries whose status row is still in flight.
+        last_id = 0
+        while True:
+            ids = list(logs.filter(id__gt=last_id).order_by("id").values_list("id", flat=True)[:batch_size])
+            if not ids:
+                break
+            last_id = ids[-1]
+            with transaction.atomic():
+                archived_logs += self._move(BrokerContactLog, ArchivedBrokerContactLog, "id", ids)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Archived {archived_statuses} status row(s) and {archived_logs} contact log(s).")
+        )
+
+    @staticmethod
+    def _move(model, archive_model, key: str, ids: list[int]) -> int:
+        """Copy the matching rows into ``archive_model`` with one INSERT ... SELECT, then delete them."""
+        qn = connection.ops.quote_name
+        columns = [field.column for field in model._meta.concrete_fields]
+        column_sql = ", ".join(qn(column) for column in columns)
+        placeholders = ", ".join(["%s"] * len(ids))
+        archived_at = archive_model._meta.get_field("archived_at").get_db_prep_save(timezone.now(), connection)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {qn(archive_model._meta.db_table)} ({column_sql}, {qn('archived_at')}) "
+                f"SELECT {column_sql}, %s FROM {qn(model._meta.db_table)} WHERE {qn(key)} IN ({placeholders})",
+                [archived_at, *ids],
+            )
+            cursor.execute(
+                f"DELETE FROM {qn(model._meta.db_table)} WHERE {qn(key)} IN ({placeholders})",
+                ids,
+            )
+            return max(cursor.rowcount, 0)
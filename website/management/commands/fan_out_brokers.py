@@ -0,0 +1,93 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from website.models import Consumer, ConsumerBrokerStatus, ConsumerProgress, DataBrokers2025
+
+
+class Command(BaseCommand):
+    help = (
+        "Create missing ConsumerBrokerStatus rows for brokers added or reactivated since the last run, "
+        "and mark queued rows of deactivated brokers as skipped."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Consumers covered by each INSERT ... SELECT statement.",
+        )
+
+    def handle(self, *args, **opts):
+        chunk_size = max(1, opts["chunk_size"])
+        skipped = self._skip_inactive(chunk_size)
+
+        broker_ids = list(
+            DataBrokers2025.objects.filter(is_active=True, fanned_out_at__isnull=True)
+            .order_by("id")
+            .values_list("id", flat=True)
+        )
+        created = requeued = 0
+        if broker_ids:
+            requeued = self._requeue(broker_ids, chunk_size)
+            created = self._fan_out(broker_ids, chunk_size)
+            DataBrokers2025.objects.filter(id__in=broker_ids).update(fanned_out_at=timezone.now())
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Fanned out {len(broker_ids)} broker(s): created={created} requeued={requeued} skipped={skipped}"
+            )
+        )
+
+    def _fan_out(self, broker_ids: list[int], chunk_size: int) -> int:
+        """Insert missing rows for onboarded consumers, one consumer-id chunk per statement."""
+        consumers = Consumer.objects.filter(brokers_initialized_at__isnull=False).order_by("id")
+        created = 0
+        last_id = 0
+        while True:
+            chunk = list(consumers.filter(id__gt=last_id).values_list("id", flat=True)[:chunk_size])
+            if not chunk:
+                break
+            last_id = chunk[-1]
+            with transaction.atomic():
+                if ConsumerBrokerStatus.supports_insert_select():
+                    rows = ConsumerBrokerStatus.insert_missing(chunk, broker_ids)
+                else:
+                    rows = sum(
+                        consumer.initialize_broker_statuses(brokers=broker_ids)
+                        for consumer in Consumer.objects.filter(id__in=chunk)
+                    )
+                if rows and ConsumerBrokerStatus.supports_insert_select():
+                    ConsumerProgress.rebuild(consumer_ids=chunk)
+            created += rows
+        return created
+
+    def _requeue(self, broker_ids: list[int], chunk_size: int) -> int:
+        """Return rows skipped while a now-reactivated broker was inactive to the queue."""
+        rows = ConsumerBrokerStatus.objects.filter(
+            broker_id__in=broker_ids,
+            status=ConsumerBrokerStatus.Status.SKIPPED,
+        )
+        return self._bulk_transition(rows, ConsumerBrokerStatus.Status.QUEUED, chunk_size)
+
+    def _skip_inactive(self, chunk_size: int) -> int:
+        rows = ConsumerBrokerStatus.objects.filter(
+            broker__is_active=False,
+            status=ConsumerBrokerStatus.Status.QUEUED,
+        )
+        skipped = self._bulk_transition(rows, ConsumerBrokerStatus.Status.SKIPPED, chunk_size)
+        DataBrokers2025.objects.filter(is_active=False, fanned_out_at__isnull=False).update(fanned_out_at=None)
+        return skipped
+
+    @staticmethod
+    def _bulk_transition(rows, status: str, chunk_size: int) -> int:
+        """One UPDATE for every matching row, then a set-based progress recount for the consumers touched."""
+        with transaction.atomic():
+            consumer_ids = list(rows.order_by("consumer_id").values_list("consumer_id", flat=True).distinct())
+            if not consumer_ids:
+                return 0
+            updated = rows.update(status=status, updated_at=timezone.now())
+            for start in range(0, len(consumer_ids), chunk_size):
+                ConsumerProgress.rebuild(consumer_ids=consumer_ids[start:start + chunk_size])
+        return updated
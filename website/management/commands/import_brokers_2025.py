@@ -4,6 +4,7 @@ from pathlib import Path
 from django.core.management.base import BaseCommand, CommandError
 from django.conf import settings
 
+from email_service.recipients import recipient_key
 from website.models import DataBrokers2025
 
 
@@ -80,6 +81,7 @@ class Command(BaseCommand):
                     dba=(row.get(dba_key) or "").strip() if dba_key else "",
                     website=(row.get(web_key) or "").strip() if web_key else "",
                     contact_email=(row.get(email_key) or "").strip() if email_key else "",
+                    contact_recipients=recipient_key(row.get(email_key) if email_key else ""),
                     phone=(row.get(phone_key) or "").strip() if phone_key else "",
                     street=(row.get(street_key) or "").strip() if street_key else "",
                     city=(row.get(city_key) or "").strip() if city_key else "",
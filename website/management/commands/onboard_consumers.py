@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from website.models import Consumer
+
+
+class Command(BaseCommand):
+    help = "Create broker statuses for consumers whose onboarding was deferred at signup."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--limit", type=int, help="Onboard at most this many consumers.")
+
+    def handle(self, *args, **options):
+        onboarded, created = Consumer.onboard_pending(limit=options.get("limit"))
+        self.stdout.write(
+            self.style.SUCCESS(f"Onboarded {onboarded} consumer(s); created {created} broker status row(s).")
+        )
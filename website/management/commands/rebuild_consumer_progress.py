@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from website.models import ConsumerProgress
+
+
+class Command(BaseCommand):
+    help = "Recompute ConsumerProgress counters from ConsumerBrokerStatus rows to repair any drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--consumer-id",
+            type=int,
+            action="append",
+            dest="consumer_ids",
+            help="Only rebuild this consumer (may be repeated). Default: every consumer.",
+        )
+
+    def handle(self, *args, **options):
+        rows = ConsumerProgress.rebuild(consumer_ids=options.get("consumer_ids"))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt progress counters for {rows} consumer(s)."))
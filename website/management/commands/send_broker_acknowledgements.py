@@ -1,20 +1,20 @@
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from django.conf import settings
 from django.core.mail import EmailMultiAlternatives
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Case, DateTimeField, F, Q, Value, When
 from django.template.loader import render_to_string
 from django.urls import reverse
 from django.utils import timezone
-from django.db.models import Q
+from django.utils.http import urlencode
 
-from website.models import BrokerAcknowledgement, DataBrokers2025
-
-
-def _split_recipients(raw: str | None) -> list[str]:
-    if not raw:
-        return []
-    return [part.strip() for part in raw.replace(";", ",").split(",") if part.strip()]
+from email_service.connection import EmailConnectionPool
+from email_service.throttle import DomainRateLimiter, TokenBucket
+from website.models import AcknowledgementRun, BrokerAcknowledgement, DataBrokers2025
 
 
 class Command(BaseCommand):
@@ -23,6 +23,10 @@ class Command(BaseCommand):
         "to confirm SwanTech as a service that protects consumer data."
     )
 
+    # Indirection so tests can stub out waiting.
+    sleep = staticmethod(time.sleep)
+    clock = staticmethod(time.monotonic)
+
     def add_arguments(self, parser):
         parser.add_argument("--limit", type=int, default=None, help="Limit the number of brokers processed.")
         parser.add_argument("--offset", type=int, default=0, help="Skip the first N brokers.")
@@ -50,120 +54,305 @@ class Command(BaseCommand):
             "--delay-seconds",
             type=float,
             default=120.0,
-            help="Delay between emails in seconds (default: 120 = 2 minutes).",
+            help="Global pace: at most one email per this many seconds, kept across --resume invocations (0 disables).",
+        )
+        parser.add_argument(
+            "--domain-rate",
+            type=float,
+            default=0,
+            help="Max emails per minute to any one recipient domain (0 disables).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=2,
+            help="Render and submit emails on N threads (DB updates stay on the main thread).",
         )
         parser.add_argument(
             "--start-index",
             type=int,
             default=1,
-            help="Start processing at this 1-based index within the filtered broker list (useful for resuming).",
+            help="Start a new run at this 1-based index within the filtered broker list.",
+        )
+        parser.add_argument(
+            "--resume",
+            action="store_true",
+            help="Continue the last unfinished run (its original filters apply); does nothing if there is none.",
+        )
+        parser.add_argument(
+            "--max-seconds",
+            type=float,
+            default=None,
+            help="Stop this invocation before the next send would start after this many seconds.",
+        )
+        parser.add_argument("--max-sends", type=int, default=None, help="Stop this invocation after N emails.")
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=50,
+            help="Send results written per bookkeeping transaction (results are also flushed while waiting on the pace).",
         )
 
     def handle(self, *args, **opts):
         base_url = getattr(settings, "PUBLIC_BASE_URL", "https://swantech.org").rstrip("/")
         confirmation_path = reverse("website:broker-acknowledgement-confirmation")
-        confirmation_base = f"{base_url}{confirmation_path}"
-        support_email = getattr(
+        self.confirmation_base = f"{base_url}{confirmation_path}"
+        self.base_url = base_url
+        self.support_email = getattr(
             settings,
             "SUPPORT_EMAIL_HOST_USER",
             getattr(settings, "DEFAULT_FROM_EMAIL", "support@swantech.org"),
         )
-        test_recipients = list(getattr(settings, "TEST_BROKER_RECIPIENTS", []))
-        subject = opts["subject"]
-        dry_run = opts["dry_run"]
-        delay_seconds = max(0.0, float(opts.get("delay_seconds", 120.0)))
-        include_acknowledged = opts["include_acknowledged"]
         from_email = (
             getattr(settings, "COMPLIANCE_EMAIL_HOST_USER", None)
             or getattr(settings, "EMAIL_HOST_USER", None)
             or getattr(settings, "DEFAULT_FROM_EMAIL", "no-reply@swantech.org")
         )
-        from_email_formatted = f"SwanTech Compliance <{from_email}>"
+        self.from_email_formatted = f"SwanTech Compliance <{from_email}>"
+
+        if opts["resume"]:
+            run = AcknowledgementRun.resumable()
+            if run is None:
+                self.stdout.write("No unfinished acknowledgement run to resume.")
+                return
+            # A resumed run keeps the filters it was started with.
+            for key in ("include_acknowledged", "test", "subject"):
+                opts[key] = run.options.get(key, opts[key])
+        else:
+            run = self._start_run(opts)
+            if run is None:
+                return
+
+        brokers = self._candidates(opts["include_acknowledged"]).filter(
+            id__gte=run.first_broker_id,
+            id__lte=run.final_broker_id,
+            id__gt=run.last_broker_id or 0,
+        )
+        if opts["resume"]:
+            # Already covered by a shared-address email sent earlier in this run.
+            brokers = brokers.exclude(acknowledgement__last_sent_at__gte=run.started_at)
+        brokers = list(brokers)
+        groups = self._recipient_groups(brokers)
+        test_recipients = list(getattr(settings, "TEST_BROKER_RECIPIENTS", []))
+
+        if opts["dry_run"]:
+            for members in groups:
+                recipients = test_recipients if opts["test"] else members[0].recipients
+                if recipients:
+                    self.stdout.write(
+                        f"[DRY RUN] {self._names(members)} -> {', '.join(recipients)} | "
+                        f"{self._confirmation_url(members)}"
+                    )
+            return
+
+        delay_seconds = max(0.0, float(opts.get("delay_seconds") or 0))
+        self.bucket = TokenBucket(1 / delay_seconds, clock=self.clock, sleep=self.sleep) if delay_seconds else None
+        self.limiter = DomainRateLimiter(opts["domain_rate"], clock=self.clock, sleep=self.sleep)
+        self.subject = opts["subject"]
+        self.run = run
+        deadline = self.clock() + opts["max_seconds"] if opts["max_seconds"] is not None else None
+        max_sends = opts["max_sends"]
+        workers = max(1, opts["workers"])
+        self.chunk_size = max(1, opts["chunk_size"])
+        self._sent: list[tuple[int, object]] = []
+        self._skipped = self._failed = 0
+        self._last_broker_id = None
+
+        # Every broker in range gets its row now, so recording a send is a plain UPDATE.
+        BrokerAcknowledgement.objects.bulk_create(
+            [BrokerAcknowledgement(broker_id=broker.id) for broker in brokers],
+            ignore_conflicts=True,
+            batch_size=500,
+        )
+
+        stopped_early = False
+        try:
+            # Keep the pace of the previous invocation of this run.
+            if self.bucket and run.last_sent_at:
+                wait = delay_seconds - (timezone.now() - run.last_sent_at).total_seconds()
+                if wait > 0:
+                    if deadline is not None and self.clock() + wait > deadline:
+                        groups = []
+                        stopped_early = True
+                    else:
+                        self.sleep(wait)
+
+            submitted = 0
+            pending: deque[tuple[list[DataBrokers2025], list[str], Future | None]] = deque()
+            with EmailConnectionPool(size=workers) as pool, ThreadPoolExecutor(max_workers=workers) as executor:
+                self.pool = pool
+                for members in groups:
+                    recipients = test_recipients if opts["test"] else members[0].recipients
+                    if not recipients:
+                        pending.append((members, recipients, None))
+                        self._drain(pending)
+                        continue
+                    if max_sends is not None and submitted >= max_sends:
+                        stopped_early = True
+                        break
+                    wait = self.bucket.wait_time() if self.bucket else 0.0
+                    if deadline is not None and self.clock() + wait > deadline:
+                        stopped_early = True
+                        break
+                    if wait > 0:
+                        # Idle until the next token anyway; persist what has finished.
+                        self._drain(pending)
+                        self._flush()
+                    if self.bucket:
+                        self.bucket.acquire()
+                    pending.append((members, recipients, executor.submit(self._deliver, members, recipients)))
+                    submitted += 1
+                    self._drain(pending)
+                self._drain(pending, wait=True)
+        except Exception as exc:
+            self._flush()
+            run.finish(error=str(exc) or exc.__class__.__name__)
+            raise
+        self._flush()
+
+        if stopped_early:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Paused acknowledgement run {run.pk} at broker {run.last_broker_id}; "
+                    f"continue with --resume. Sent={run.sent}/{run.total}"
+                )
+            )
+            return
+        run.finish()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Completed acknowledgement run. Sent={run.sent} skipped={run.skipped} "
+                f"failed={run.failed} total_candidates={run.total}"
+            )
+        )
 
-        qs = DataBrokers2025.objects.filter(is_active=True).select_related("acknowledgement").order_by("id")
+    @staticmethod
+    def _candidates(include_acknowledged: bool):
+        qs = DataBrokers2025.objects.filter(is_active=True).order_by("id")
         if not include_acknowledged:
             qs = qs.filter(Q(acknowledgement__acknowledged=False) | Q(acknowledgement__isnull=True))
+        return qs
+
+    def _start_run(self, opts) -> AcknowledgementRun | None:
+        """Fix the broker id range for a new campaign (offset/limit/start-index apply only here)."""
+        qs = self._candidates(opts["include_acknowledged"]).values_list("id", flat=True)
         if opts["offset"]:
             qs = qs[opts["offset"] :]
         if opts["limit"] is not None:
             qs = qs[: opts["limit"]]
         if opts["test"]:
             qs = qs[:1]
-
-        total_candidates = qs.count()
+        broker_ids = list(qs)
+        if not broker_ids:
+            self.stdout.write(self.style.WARNING("No data brokers available to process."))
+            return None
         start_index = max(1, int(opts.get("start_index", 1)))
-        if start_index > total_candidates:
+        if start_index > len(broker_ids):
             self.stdout.write(
                 self.style.WARNING(
-                    f"Start index {start_index} is beyond the available brokers ({total_candidates}). Nothing to do."
+                    f"Start index {start_index} is beyond the available brokers ({len(broker_ids)}). Nothing to do."
                 )
             )
-            return
-        sent_offset = start_index - 1
+            return None
+        broker_ids = broker_ids[start_index - 1 :]
+        run = AcknowledgementRun(
+            options={key: opts[key] for key in ("include_acknowledged", "test", "subject")},
+            first_broker_id=broker_ids[0],
+            final_broker_id=broker_ids[-1],
+            total=len(broker_ids),
+        )
+        if not opts["dry_run"]:
+            run.save()
+        return run
 
-        if total_candidates == 0:
-            self.stdout.write(self.style.WARNING("No data brokers available to process."))
-            return
+    @staticmethod
+    def _recipient_groups(brokers: list[DataBrokers2025]) -> list[list[DataBrokers2025]]:
+        """Brokers sharing normalized recipients, in order of each group's first broker id."""
+        groups: dict[str, list[DataBrokers2025]] = {}
+        for broker in brokers:
+            groups.setdefault(broker.contact_recipients or f"broker:{broker.id}", []).append(broker)
+        return list(groups.values())
 
-        sent = 0
-        skipped = 0
-        for idx, broker in enumerate(qs, start=1):
-            if idx < start_index:
-                continue
-            try:
-                acknowledgement = broker.acknowledgement
-            except BrokerAcknowledgement.DoesNotExist:
-                acknowledgement = None
-
-            if acknowledgement and acknowledgement.acknowledged and not include_acknowledged:
-                skipped += 1
-                continue
-
-            recipients = test_recipients if opts["test"] else _split_recipients(broker.contact_email)
-            if not recipients:
-                skipped += 1
-                continue
-
-            confirmation_url = f"{confirmation_base}?brokerid={broker.id}"
-            context = {
-                "broker": broker,
-                "confirmation_url": confirmation_url,
-                "support_email": support_email,
-                "base_url": base_url,
-            }
-            text_body = render_to_string("emails/broker_acknowledgement_request.txt", context)
-            html_body = render_to_string("emails/broker_acknowledgement_request.html", context)
-
-            if dry_run:
-                self.stdout.write(f"[DRY RUN] {broker.name} -> {', '.join(recipients)} | {confirmation_url}")
-                continue
-
-            email = EmailMultiAlternatives(
-                subject,
-                text_body,
-                from_email_formatted,
-                recipients,
-            )
-            email.attach_alternative(html_body, "text/html")
-            email.send()
-
-            ack_record, _ = BrokerAcknowledgement.objects.get_or_create(broker=broker)
-            now = timezone.now()
-            ack_record.last_sent_at = now
-            ack_record.send_count = (ack_record.send_count or 0) + 1
-            ack_record.save(update_fields=["last_sent_at", "send_count", "updated_at"])
-            sent += 1
-            self.stdout.write(
-                self.style.SUCCESS(
-                    f"[{sent_offset + sent}/{total_candidates}] Sent acknowledgement request to {broker.name} ({', '.join(recipients)})"
-                )
-            )
+    @staticmethod
+    def _names(members: list[DataBrokers2025]) -> str:
+        return ", ".join(broker.name for broker in members)
 
-            if not dry_run and idx < total_candidates and delay_seconds > 0:
-                time.sleep(delay_seconds)
+    def _confirmation_url(self, members: list[DataBrokers2025]) -> str:
+        token = BrokerAcknowledgement.confirmation_token([broker.id for broker in members])
+        return f"{self.confirmation_base}?{urlencode({'token': token})}"
 
-        self.stdout.write(
-            self.style.SUCCESS(
-                f"Completed acknowledgement run. Sent={sent} skipped={skipped} total_candidates={total_candidates}"
-            )
+    def _deliver(self, members: list[DataBrokers2025], recipients: list[str]):
+        """Render and submit one email for a broker group. Runs on a worker thread, so it must not touch the DB."""
+        self.limiter.acquire(recipients)
+        context = {
+            "broker": members[0],
+            "brokers": members,
+            "broker_names": self._names(members),
+            "confirmation_url": self._confirmation_url(members),
+            "support_email": self.support_email,
+            "base_url": self.base_url,
+        }
+        email = EmailMultiAlternatives(
+            self.subject,
+            render_to_string("emails/broker_acknowledgement_request.txt", context),
+            self.from_email_formatted,
+            recipients,
         )
+        email.attach_alternative(render_to_string("emails/broker_acknowledgement_request.html", context), "text/html")
+        self.pool.send(email)
+        return timezone.now()
+
+    def _drain(self, pending: deque, wait: bool = False) -> None:
+        """Buffer finished sends in group order, so the checkpoint never skips an unfinished one.
+
+        The checkpoint only advances to a group's first broker; the others are
+        recognised on resume by the send time recorded for them here.
+        """
+        while pending:
+            members, recipients, future = pending[0]
+            if future is not None and not (wait or future.done()):
+                return
+            pending.popleft()
+            self._last_broker_id = members[0].id
+            if future is None:
+                self._skipped += len(members)
+            else:
+                try:
+                    sent_at = future.result()
+                except Exception as exc:
+                    self.stderr.write(f"Failed to send acknowledgement request to {self._names(members)}: {exc}")
+                    self._failed += len(members)
+                else:
+                    self._sent.extend((broker.id, sent_at) for broker in members)
+                    self.stdout.write(
+                        self.style.SUCCESS(
+                            f"[{self.run.sent + len(self._sent)}/{self.run.total}] Sent acknowledgement request "
+                            f"to {self._names(members)} ({', '.join(recipients)})"
+                        )
+                    )
+            if len(self._sent) + self._skipped + self._failed >= self.chunk_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Write buffered results: one UPDATE for the acknowledgements plus the run checkpoint."""
+        if self._last_broker_id is None or self._last_broker_id == self.run.last_broker_id:
+            return
+        with transaction.atomic():
+            if self._sent:
+                BrokerAcknowledgement.objects.filter(broker_id__in=[broker_id for broker_id, _ in self._sent]).update(
+                    send_count=F("send_count") + 1,
+                    last_sent_at=Case(
+                        *[When(broker_id=broker_id, then=Value(sent_at)) for broker_id, sent_at in self._sent],
+                        output_field=DateTimeField(),
+                    ),
+                    updated_at=timezone.now(),
+                )
+            self.run.checkpoint(
+                self._last_broker_id,
+                sent=len(self._sent),
+                skipped=self._skipped,
+                failed=self._failed,
+                sent_at=max((sent_at for _, sent_at in self._sent), default=None),
+            )
+        self._sent = []
+        self._skipped = self._failed = 0
@@ -1,7 +1,7 @@
 import datetime
 
 from django.conf import settings
-from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail import EmailMultiAlternatives
 from django.core.management import call_command, CommandError
 from django.core.management.base import BaseCommand
 from django.template.loader import render_to_string
@@ -9,6 +9,7 @@ from django.templatetags.static import static
 from django.urls import reverse
 from django.utils import timezone
 
+from email_service.connection import EmailConnectionPool
 from insights.models import Insight
 from website.models import NewsletterSubscriber
 from website.utils import manage_preferences_url
@@ -89,7 +90,6 @@ class Command(BaseCommand):
 
         from_email = f"SwanTech Newsletter <{getattr(settings, 'DEFAULT_FROM_EMAIL', 'no-reply@swantech.org')}>"
 
-        connection = get_connection()
         messages = []
 
         for email in subscribers:
@@ -98,12 +98,12 @@ class Command(BaseCommand):
                 text_body,
                 from_email,
                 [email],
-                connection=connection,
             )
             msg.attach_alternative(html_body, "text/html")
             messages.append(msg)
 
-        connection.send_messages(messages)
+        with EmailConnectionPool() as pool:
+            pool.send_messages(messages)
 
         self.stdout.write(
             self.style.SUCCESS(
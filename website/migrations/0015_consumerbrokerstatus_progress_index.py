@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0014_siteimage'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='consumerbrokerstatus',
+            index=models.Index(fields=['consumer', 'status', 'completed_at'], name='website_con_consume_a16613_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='consumerbrokerstatus',
+            name='website_con_consume_2d9784_idx',
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:12
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0015_consumerbrokerstatus_progress_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ConsumerProgress',
+            fields=[
+                ('consumer', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='progress', serialize=False, to='website.consumer')),
+                ('queued_count', models.IntegerField(default=0)),
+                ('contacted_count', models.IntegerField(default=0)),
+                ('processing_count', models.IntegerField(default=0)),
+                ('completed_count', models.IntegerField(default=0)),
+                ('rejected_count', models.IntegerField(default=0)),
+                ('bounced_count', models.IntegerField(default=0)),
+                ('no_response_count', models.IntegerField(default=0)),
+                ('contacted_total', models.IntegerField(default=0)),
+                ('last_completed_at', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name_plural': 'consumer progress',
+            },
+        ),
+    ]
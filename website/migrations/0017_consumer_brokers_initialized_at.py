@@ -0,0 +1,27 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:15
+
+from django.db import migrations, models
+
+
+def mark_initialized_consumers(apps, schema_editor):
+    Consumer = apps.get_model('website', 'Consumer')
+    ConsumerBrokerStatus = apps.get_model('website', 'ConsumerBrokerStatus')
+    Consumer.objects.filter(
+        id__in=ConsumerBrokerStatus.objects.values('consumer_id'),
+    ).update(brokers_initialized_at=models.F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0016_consumerprogress'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='consumer',
+            name='brokers_initialized_at',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.RunPython(mark_initialized_consumers, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:16
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def mark_fanned_out_brokers(apps, schema_editor):
+    # Brokers that already have status rows were fanned out before this field
+    # existed; without this the first fan_out_brokers run would redo all of them.
+    DataBrokers2025 = apps.get_model('website', 'DataBrokers2025')
+    ConsumerBrokerStatus = apps.get_model('website', 'ConsumerBrokerStatus')
+    DataBrokers2025.objects.filter(
+        id__in=ConsumerBrokerStatus.objects.values('broker_id'),
+    ).update(fanned_out_at=timezone.now())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0017_consumer_brokers_initialized_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='consumerprogress',
+            name='skipped_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='databrokers2025',
+            name='fanned_out_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_fanned_out_brokers, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='consumerbrokerstatus',
+            name='status',
+            field=models.CharField(choices=[('queued', 'Queued'), ('contacted', 'Contacted'), ('processing', 'Processing'), ('completed', 'Completed'), ('rejected', 'Rejected'), ('bounced', 'Bounced'), ('no_response', 'No Response'), ('skipped', 'Skipped (broker inactive)')], db_index=True, default='queued', max_length=20),
+        ),
+    ]
@@ -0,0 +1,60 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:19
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0018_broker_fanout'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedBrokerContactLog',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status_id', models.BigIntegerField(db_index=True)),
+                ('subject', models.CharField(max_length=255)),
+                ('snippet', models.TextField(blank=True)),
+                ('sent_at', models.DateTimeField()),
+                ('success', models.BooleanField(default=True)),
+                ('error', models.TextField(blank=True)),
+                ('metadata', models.JSONField(blank=True, default=dict)),
+                ('created_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('broker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_contact_logs', to='website.databrokers2025')),
+                ('consumer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_contact_logs', to='website.consumer')),
+            ],
+            options={
+                'ordering': ('-sent_at',),
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedConsumerBrokerStatus',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('contacted', 'Contacted'), ('processing', 'Processing'), ('completed', 'Completed'), ('rejected', 'Rejected'), ('bounced', 'Bounced'), ('no_response', 'No Response'), ('skipped', 'Skipped (broker inactive)')], max_length=20)),
+                ('tracking_token', models.UUIDField(editable=False, unique=True)),
+                ('request_type', models.CharField(choices=[('delete', 'Delete / Remove'), ('do_not_sell', 'Do Not Sell / Share'), ('do_not_contact', 'Do Not Contact')], max_length=20)),
+                ('batch_number', models.PositiveIntegerField(blank=True, null=True)),
+                ('contacted_at', models.DateTimeField(blank=True, null=True)),
+                ('last_response_at', models.DateTimeField(blank=True, null=True)),
+                ('completed_at', models.DateTimeField(blank=True, null=True)),
+                ('broker_contact_name', models.CharField(blank=True, max_length=255)),
+                ('broker_contact_email', models.CharField(blank=True, max_length=255)),
+                ('notes', models.TextField(blank=True)),
+                ('last_email_subject', models.CharField(blank=True, max_length=255)),
+                ('last_email_id', models.CharField(blank=True, max_length=255)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField()),
+                ('broker', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_consumer_statuses', to='website.databrokers2025')),
+                ('consumer', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_broker_statuses', to='website.consumer')),
+            ],
+            options={
+                'unique_together': {('consumer', 'broker')},
+            },
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.7 on 2026-10-17 02:27
+
+from django.db import migrations, models
+
+from email_service.recipients import recipient_key
+
+
+def fill_contact_recipients(apps, schema_editor):
+    DataBrokers2025 = apps.get_model('website', 'DataBrokers2025')
+    brokers = list(DataBrokers2025.objects.only('id', 'contact_email'))
+    for broker in brokers:
+        broker.contact_recipients = recipient_key(broker.contact_email)
+    DataBrokers2025.objects.bulk_update(brokers, ['contact_recipients'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('website', '0020_acknowledgementrun'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='databrokers2025',
+            name='contact_recipients',
+            field=models.CharField(blank=True, db_index=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(fill_contact_recipients, migrations.RunPython.noop),
+    ]
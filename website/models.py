@@ -3,12 +3,16 @@ import uuid
 from typing import Iterable, Sequence
 
 from django.conf import settings
-from django.db import models
+from django.core import signing
+from django.db import connection, models, transaction
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 from django.utils import timezone
 from django.core.validators import RegexValidator
 
+from email_service.models import ResumableRun
+from email_service.recipients import recipient_key
+
 
 class BrokerRequestType(models.TextChoices):
     DELETE = "delete", "Delete / Remove"
@@ -71,6 +75,9 @@ class DataBrokers2025(models.Model):
     dba = models.CharField(max_length=255, blank=True)
     website = models.URLField(blank=True)
     contact_email = models.CharField(max_length=255, blank=True)
+    # ``contact_email`` parsed once (see email_service.recipients); brokers
+    # with equal values share one outbound message.
+    contact_recipients = models.CharField(max_length=255, blank=True, db_index=True, editable=False)
     phone = models.CharField(max_length=64, blank=True)
 
     street = models.CharField(max_length=255, blank=True)
@@ -83,6 +90,9 @@ class DataBrokers2025(models.Model):
 
     raw = models.JSONField(default=dict, blank=True)
     is_active = models.BooleanField(default=True)
+    # Set once every onboarded consumer has a status row for this broker;
+    # cleared on deactivation so reactivation fans out again (fan_out_brokers).
+    fanned_out_at = models.DateTimeField(blank=True, null=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
@@ -93,6 +103,17 @@ class DataBrokers2025(models.Model):
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.contact_recipients = recipient_key(self.contact_email)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "contact_email" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "contact_recipients"}
+        super().save(*args, **kwargs)
+
+    @property
+    def recipients(self) -> list[str]:
+        return self.contact_recipients.split(",") if self.contact_recipients else []
+
 
 class BrokerCompliance(models.Model):
     broker = models.OneToOneField(
@@ -149,9 +170,25 @@ class BrokerAcknowledgement(models.Model):
         verbose_name = "Broker Acknowledgement"
         verbose_name_plural = "Broker Acknowledgements"
 
+    # Salt for the signed broker ids carried by confirmation links.
+    SIGNING_SALT = "website.BrokerAcknowledgement.confirmation"
+
     def __str__(self):
         return f"Acknowledgement for {self.broker.name}"
 
+    @classmethod
+    def confirmation_token(cls, broker_ids: Sequence[int]) -> str:
+        """Signed token naming the brokers one confirmation link acknowledges."""
+        return signing.dumps(list(broker_ids), salt=cls.SIGNING_SALT, compress=True)
+
+    @classmethod
+    def broker_ids_from_token(cls, token: str) -> list[int]:
+        """Broker ids signed into ``token``; raises ``signing.BadSignature`` if it was not issued by us."""
+        broker_ids = signing.loads(token, salt=cls.SIGNING_SALT)
+        if not isinstance(broker_ids, list) or not all(isinstance(value, int) for value in broker_ids):
+            raise signing.BadSignature("Malformed acknowledgement token.")
+        return broker_ids
+
     def mark_acknowledged(self):
         now = timezone.now()
         self.acknowledged = True
@@ -159,6 +196,37 @@ class BrokerAcknowledgement(models.Model):
         self.save(update_fields=["acknowledged", "acknowledged_at", "updated_at"])
 
 
+class AcknowledgementRun(ResumableRun):
+    """Position of one ``send_broker_acknowledgements`` campaign.
+
+    Brokers are sent to in id order, so ``last_broker_id`` is enough to pick
+    up where the previous invocation stopped; ``last_sent_at`` lets the next
+    invocation keep the global send pace.
+    """
+
+    first_broker_id = models.PositiveIntegerField()
+    final_broker_id = models.PositiveIntegerField()
+    last_broker_id = models.PositiveIntegerField(blank=True, null=True)
+    total = models.PositiveIntegerField(default=0)
+    sent = models.PositiveIntegerField(default=0)
+    skipped = models.PositiveIntegerField(default=0)
+    failed = models.PositiveIntegerField(default=0)
+    last_sent_at = models.DateTimeField(blank=True, null=True)
+
+    def __str__(self):
+        return f"Acknowledgement run {self.pk} ({self.status}, {self.sent}/{self.total} sent)"
+
+    def checkpoint(self, broker_id: int, *, sent: int = 0, skipped: int = 0, failed: int = 0, sent_at=None) -> None:
+        """Record that every broker up to ``broker_id`` is done; call inside the bookkeeping transaction."""
+        self.sent += sent
+        self.skipped += skipped
+        self.failed += failed
+        if sent_at is not None:
+            self.last_sent_at = sent_at
+        self.last_broker_id = max(broker_id, self.last_broker_id or 0)
+        self.save(update_fields=["last_broker_id", "sent", "skipped", "failed", "last_sent_at", "updated_at"])
+
+
 class Consumer(models.Model):
     """Represents a paying consumer that we execute suppression requests for."""
 
@@ -181,6 +249,7 @@ class Consumer(models.Model):
     )
     weekly_status_opt_in = models.BooleanField(default=True)
     last_status_email_at = models.DateTimeField(blank=True, null=True)
+    brokers_initialized_at = models.DateTimeField(blank=True, null=True, db_index=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -190,6 +259,43 @@ class Consumer(models.Model):
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
 
+    def onboard(self) -> int:
+        """Create this consumer's broker statuses exactly once; returns rows created.
+
+        The ``brokers_initialized_at`` claim and the inserts commit together,
+        so concurrent callers (the post_save signal, ``onboard_consumers``,
+        the drip) never initialize the same consumer twice.
+        """
+        now = timezone.now()
+        with transaction.atomic():
+            claimed = Consumer.objects.filter(pk=self.pk, brokers_initialized_at__isnull=True).update(
+                brokers_initialized_at=now,
+                updated_at=now,
+            )
+            if not claimed:
+                return 0
+            self.brokers_initialized_at = now
+            return self.initialize_broker_statuses(request_type=ConsumerBrokerStatus.RequestType.DELETE)
+
+    @classmethod
+    def onboard_pending(cls, consumers=None, *, limit: int | None = None) -> tuple[int, int]:
+        """Onboard every consumer still awaiting initialization.
+
+        Returns ``(consumers onboarded, status rows created)``.
+        """
+        qs = (consumers if consumers is not None else cls.objects.all()).filter(
+            brokers_initialized_at__isnull=True
+        ).order_by("id")
+        if limit:
+            qs = qs[:limit]
+        onboarded = created = 0
+        for consumer in qs:
+            rows = consumer.onboard()
+            if consumer.brokers_initialized_at:
+                onboarded += 1
+            created += rows
+        return onboarded, created
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}".strip()
@@ -201,20 +307,40 @@ class Consumer(models.Model):
         request_type: str | None = None,
         batch_size: int = 500,
     ) -> int:
-        """Create queued ConsumerBrokerStatus rows for all active brokers."""
+        """Create queued ConsumerBrokerStatus rows for all active brokers.
+
+        On SQLite and MySQL the missing rows are written by a single
+        ``INSERT ... SELECT`` from the broker table, so the cost does not grow
+        with the registry. Other backends fall back to batched ``bulk_create``.
+        Existing rows are left alone either way.
+        """
         request_type = request_type or ConsumerBrokerStatus.RequestType.DELETE
-        if brokers is None:
-            broker_ids = list(
-                DataBrokers2025.objects.filter(is_active=True).values_list(
-                    "id", flat=True
-                )
-            )
-        else:
+        broker_ids = None
+        if brokers is not None:
             broker_ids = [
                 b if isinstance(b, int) else getattr(b, "id")
                 for b in brokers
                 if b
             ]
+            if not broker_ids:
+                return 0
+
+        if ConsumerBrokerStatus.supports_insert_select():
+            created = ConsumerBrokerStatus.insert_missing([self.id], broker_ids, request_type)
+        else:
+            created = self._initialize_statuses_in_python(broker_ids, request_type, batch_size)
+        if created:
+            # Neither path goes through save(), so recount this consumer's progress row.
+            ConsumerProgress.rebuild(consumer_ids=[self.id])
+        return created
+
+    def _initialize_statuses_in_python(self, broker_ids: list[int] | None, request_type: str, batch_size: int) -> int:
+        if broker_ids is None:
+            broker_ids = list(
+                DataBrokers2025.objects.filter(is_active=True).values_list(
+                    "id", flat=True
+                )
+            )
         if not broker_ids:
             return 0
 
@@ -223,6 +349,11 @@ class Consumer(models.Model):
                 consumer=self, broker_id__in=broker_ids
             ).values_list("broker_id", flat=True)
         )
+        existing.update(
+            ArchivedConsumerBrokerStatus.objects.filter(
+                consumer=self, broker_id__in=broker_ids
+            ).values_list("broker_id", flat=True)
+        )
 
         created = 0
         buffer: list[ConsumerBrokerStatus] = []
@@ -249,27 +380,95 @@ class Consumer(models.Model):
         return len(statuses)
 
     def progress_snapshot(self, window_start=None) -> dict:
-        qs = self.broker_statuses.all()
-        total = qs.count()
-        snapshot = {"total": total}
-        status_counts = {}
-        for choice, _ in ConsumerBrokerStatus.Status.choices:
-            count = qs.filter(status=choice).count()
-            snapshot[choice] = count
-            status_counts[choice] = count
-        engaged_statuses = [
-            ConsumerBrokerStatus.Status.CONTACTED,
-            ConsumerBrokerStatus.Status.PROCESSING,
-            ConsumerBrokerStatus.Status.COMPLETED,
-            ConsumerBrokerStatus.Status.REJECTED,
-            ConsumerBrokerStatus.Status.BOUNCED,
-            ConsumerBrokerStatus.Status.NO_RESPONSE,
-        ]
-        contacted_total = qs.filter(
-            models.Q(contacted_at__isnull=False) | models.Q(status__in=engaged_statuses)
-        ).count()
+        """Status counts for this consumer.
+
+        Read from the materialized ``ConsumerProgress`` row when there is one
+        (plus one indexed count for ``recent_completions``); otherwise
+        recounted from the status rows and their archive.
+        """
+        Status = ConsumerBrokerStatus.Status
+        try:
+            progress = self.progress
+        except ConsumerProgress.DoesNotExist:
+            progress = None
+        if progress is not None:
+            counts = progress.counts()
+            if window_start:
+                counts["recent_completions"] = self.broker_statuses.filter(
+                    status=Status.COMPLETED,
+                    completed_at__gte=window_start,
+                ).count()
+        else:
+            counts = self._aggregate_progress(window_start)
+        return self.snapshot_from_counts(counts, window_start)
+
+    @classmethod
+    def bulk_progress_snapshots(cls, consumer_ids: Iterable[int], window_start=None) -> dict[int, dict]:
+        """``progress_snapshot`` for many consumers from one grouped query.
+
+        Groups the status rows by ``(consumer_id, status)``, plus the same
+        grouping over the archive; consumers with no rows get an all-zero
+        snapshot. Archived rows are older than any reporting window (see
+        ``archive_broker_history``), so they never add to ``recent_completions``.
+        """
+        Status = ConsumerBrokerStatus.Status
+        consumer_ids = list(consumer_ids)
+        annotations = {
+            "rows": models.Count("id"),
+            "contacted": models.Count(
+                "id",
+                filter=models.Q(contacted_at__isnull=False)
+                | models.Q(status__in=ConsumerBrokerStatus.ENGAGED_STATUSES),
+            ),
+        }
+        if window_start:
+            annotations["recent"] = models.Count(
+                "id",
+                filter=models.Q(status=Status.COMPLETED, completed_at__gte=window_start),
+            )
+        grouped = list(
+            ConsumerBrokerStatus.objects.filter(consumer_id__in=consumer_ids)
+            .values("consumer_id", "status")
+            .annotate(**annotations)
+            .order_by()
+        )
+        annotations.pop("recent", None)
+        grouped += list(
+            ArchivedConsumerBrokerStatus.objects.filter(consumer_id__in=consumer_ids)
+            .values("consumer_id", "status")
+            .annotate(**annotations)
+            .order_by()
+        )
+
+        counts: dict[int, dict] = {}
+        for consumer_id in consumer_ids:
+            counts[consumer_id] = {"total": 0, "contacted": 0}
+            counts[consumer_id].update({f"status_{choice}": 0 for choice, _ in Status.choices})
+            if window_start:
+                counts[consumer_id]["recent_completions"] = 0
+        for row in grouped:
+            entry = counts[row["consumer_id"]]
+            entry["total"] += row["rows"]
+            entry["contacted"] += row["contacted"]
+            key = f"status_{row['status']}"
+            entry[key] = entry.get(key, 0) + row["rows"]
+            if window_start:
+                entry["recent_completions"] += row.get("recent", 0)
+        return {
+            consumer_id: cls.snapshot_from_counts(entry, window_start)
+            for consumer_id, entry in counts.items()
+        }
+
+    @staticmethod
+    def snapshot_from_counts(counts: dict, window_start=None) -> dict:
+        """Shape raw counts (keyed like ``_aggregate_progress``) into a progress snapshot."""
+        Status = ConsumerBrokerStatus.Status
+        snapshot = {"total": counts["total"]}
+        for choice, _ in Status.choices:
+            snapshot[choice] = counts[f"status_{choice}"]
+        contacted_total = counts["contacted"]
         snapshot["contacted"] = contacted_total
-        completed_count = status_counts.get(ConsumerBrokerStatus.Status.COMPLETED, 0)
+        completed_count = snapshot[Status.COMPLETED]
         if contacted_total > 0:
             completed_pct = (completed_count / contacted_total) * 100
         else:
@@ -281,12 +480,33 @@ class Consumer(models.Model):
         snapshot["completed_percentage"] = completed_pct
         snapshot["completed_percentage_display"] = completed_display
         if window_start:
-            snapshot["recent_completions"] = qs.filter(
-                status=ConsumerBrokerStatus.Status.COMPLETED,
-                completed_at__gte=window_start,
-            ).count()
+            snapshot["recent_completions"] = counts["recent_completions"]
         return snapshot
 
+    def _aggregate_progress(self, window_start=None) -> dict:
+        """Recount this consumer's status rows, hot and archived, with one aggregate each."""
+        Status = ConsumerBrokerStatus.Status
+        aggregates = {
+            "total": models.Count("id"),
+            "contacted": models.Count(
+                "id",
+                filter=models.Q(contacted_at__isnull=False)
+                | models.Q(status__in=ConsumerBrokerStatus.ENGAGED_STATUSES),
+            ),
+        }
+        for choice, _ in Status.choices:
+            aggregates[f"status_{choice}"] = models.Count("id", filter=models.Q(status=choice))
+        if window_start:
+            aggregates["recent_completions"] = models.Count(
+                "id",
+                filter=models.Q(status=Status.COMPLETED, completed_at__gte=window_start),
+            )
+        counts = self.broker_statuses.aggregate(**aggregates)
+        aggregates.pop("recent_completions", None)
+        for key, value in self.archived_broker_statuses.aggregate(**aggregates).items():
+            counts[key] += value
+        return counts
+
 
 class ConsumerBrokerStatus(models.Model):
     class Status(models.TextChoices):
@@ -297,6 +517,7 @@ class ConsumerBrokerStatus(models.Model):
         REJECTED = "rejected", "Rejected"
         BOUNCED = "bounced", "Bounced"
         NO_RESPONSE = "no_response", "No Response"
+        SKIPPED = "skipped", "Skipped (broker inactive)"
 
     RequestType = BrokerRequestType
 
@@ -341,7 +562,8 @@ class ConsumerBrokerStatus(models.Model):
     class Meta:
         unique_together = ("consumer", "broker")
         indexes = [
-            models.Index(fields=("consumer", "status")),
+            # Covers progress_snapshot's status / recent-completion counts.
+            models.Index(fields=("consumer", "status", "completed_at")),
             models.Index(fields=("broker", "status")),
             models.Index(fields=("status", "request_type")),
         ]
@@ -349,12 +571,145 @@ class ConsumerBrokerStatus(models.Model):
     def __str__(self):
         return f"{self.consumer} -> {self.broker} ({self.status})"
 
+    # Statuses that count as "contacted" even without a contacted_at timestamp.
+    ENGAGED_STATUSES = (
+        Status.CONTACTED,
+        Status.PROCESSING,
+        Status.COMPLETED,
+        Status.REJECTED,
+        Status.BOUNCED,
+        Status.NO_RESPONSE,
+    )
+
+    # Requests sent to a broker that still await its response.
+    OPEN_STATUSES = (
+        Status.CONTACTED,
+        Status.PROCESSING,
+        Status.NO_RESPONSE,
+    )
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_progress = instance._progress_key()
+        return instance
+
+    def _progress_key(self) -> tuple | None:
+        """(status, counts as contacted, completed_at) as seen by ``ConsumerProgress``."""
+        if not {"status", "contacted_at", "completed_at"} <= self.__dict__.keys():
+            return None
+        contacted = self.contacted_at is not None or self.status in self.ENGAGED_STATUSES
+        return (self.status, contacted, self.completed_at)
+
+    def save(self, *args, **kwargs):
+        adding = self._state.adding
+        before = None if adding else getattr(self, "_loaded_progress", None)
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+            after = self._progress_key()
+            if after is not None and (adding or (before is not None and before != after)):
+                ConsumerProgress.apply_changes([(self.consumer_id, before, after)])
+        self._loaded_progress = after
+
+    @staticmethod
+    def supports_insert_select() -> bool:
+        return connection.vendor in ("sqlite", "mysql")
+
+    @classmethod
+    def insert_missing(
+        cls,
+        consumer_ids: Sequence[int],
+        broker_ids: Sequence[int] | None = None,
+        request_type: str | None = None,
+    ) -> int:
+        """Create QUEUED rows for every missing (consumer, broker) pair in one statement.
+
+        ``INSERT ... SELECT`` over consumers x brokers (every active broker
+        when ``broker_ids`` is None), skipping pairs that already have a row.
+        SQLite and MySQL only (see ``supports_insert_select``). Tracking
+        tokens are 16 random bytes from the database's CSPRNG, in the same
+        32-hex-character form Django stores UUIDs in, so they stay as
+        unguessable as ``uuid4``. Bypasses ``save()``, so callers must rebuild
+        ``ConsumerProgress``. Returns the number of rows created.
+        """
+        if not consumer_ids or broker_ids is not None and not broker_ids:
+            return 0
+        qn = connection.ops.quote_name
+        status_table = qn(cls._meta.db_table)
+        consumer_table = qn(Consumer._meta.db_table)
+        broker_table = qn(DataBrokers2025._meta.db_table)
+        if connection.vendor == "sqlite":
+            insert = "INSERT OR IGNORE INTO"
+            token_sql = "lower(hex(randomblob(16)))"
+        else:
+            insert = "INSERT IGNORE INTO"
+            token_sql = "LOWER(HEX(RANDOM_BYTES(16)))"
+
+        now = timezone.now()
+        explicit = {
+            "status": cls.Status.QUEUED,
+            "request_type": request_type or cls.RequestType.DELETE,
+            "created_at": now,
+            "updated_at": now,
+        }
+        columns, selects, params = [], [], []
+        for field in cls._meta.concrete_fields:
+            if field.primary_key:
+                continue
+            columns.append(qn(field.column))
+            if field.name == "consumer":
+                selects.append("c.id")
+            elif field.name == "broker":
+                selects.append("b.id")
+            elif field.name == "tracking_token":
+                selects.append(token_sql)
+            else:
+                value = explicit[field.name] if field.name in explicit else field.get_default()
+                selects.append("%s")
+                params.append(field.get_db_prep_save(value, connection))
+
+        where = ["c.id IN ({})".format(", ".join(["%s"] * len(consumer_ids)))]
+        params.extend(consumer_ids)
+        if broker_ids is None:
+            where.append("b.is_active = %s")
+            params.append(True)
+        else:
+            where.append("b.id IN ({})".format(", ".join(["%s"] * len(broker_ids))))
+            params.extend(broker_ids)
+        archive_table = qn(ArchivedConsumerBrokerStatus._meta.db_table)
+        # Archived (completed/rejected) pairs must never be re-queued.
+        where.append(f"NOT EXISTS (SELECT 1 FROM {status_table} s WHERE s.consumer_id = c.id AND s.broker_id = b.id)")
+        where.append(f"NOT EXISTS (SELECT 1 FROM {archive_table} a WHERE a.consumer_id = c.id AND a.broker_id = b.id)")
+
+        sql = (
+            f"{insert} {status_table} ({', '.join(columns)}) "
+            f"SELECT {', '.join(selects)} FROM {consumer_table} c CROSS JOIN {broker_table} b "
+            f"WHERE {' AND '.join(where)}"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return max(cursor.rowcount, 0)
+
+    # Every column an outreach transition may touch; used for bulk writes.
+    OUTREACH_UPDATE_FIELDS = (
+        "status",
+        "contacted_at",
+        "last_email_subject",
+        "last_email_id",
+        "batch_number",
+        "notes",
+        "updated_at",
+    )
+
     def mark_contacted(
         self,
         subject: str | None = None,
         email_id: str | None = None,
         batch_number: int | None = None,
-    ):
+        *,
+        commit: bool = True,
+    ) -> list[str]:
+        """Move to CONTACTED. Pass ``commit=False`` to defer the write to ``bulk_save_outreach``."""
         self.status = self.Status.CONTACTED
         self.contacted_at = timezone.now()
         update_fields = ["status", "contacted_at", "updated_at"]
@@ -367,10 +722,68 @@ class ConsumerBrokerStatus(models.Model):
         if batch_number is not None:
             self.batch_number = batch_number
             update_fields.append("batch_number")
-        self.save(update_fields=update_fields)
+        if commit:
+            self.save(update_fields=update_fields)
+        return update_fields
+
+    def mark_bounced(self, error: str, *, commit: bool = True) -> list[str]:
+        """Move to BOUNCED after a failed send, keeping the error in ``notes``."""
+        self.status = self.Status.BOUNCED
+        self.notes = f"Send failure: {error}"
+        update_fields = ["status", "notes", "updated_at"]
+        if commit:
+            self.save(update_fields=update_fields)
+        return update_fields
+
+    # Every column a broker response may touch; used for bulk writes.
+    RESPONSE_UPDATE_FIELDS = (
+        "status",
+        "last_response_at",
+        "contacted_at",
+        "completed_at",
+        "notes",
+        "broker_contact_name",
+        "broker_contact_email",
+        "updated_at",
+    )
+
+    @classmethod
+    def bulk_save_outreach(
+        cls,
+        statuses: Sequence["ConsumerBrokerStatus"],
+        fields: Sequence[str] = OUTREACH_UPDATE_FIELDS,
+    ) -> int:
+        """Write in-memory transitions with a single UPDATE statement."""
+        if not statuses:
+            return 0
+        now = timezone.now()
+        changes = []
+        for status in statuses:
+            status.updated_at = now
+            before = getattr(status, "_loaded_progress", None)
+            after = status._progress_key()
+            if before is not None and after is not None and before != after:
+                changes.append((status.consumer_id, before, after))
+            status._loaded_progress = after
+        with transaction.atomic():
+            updated = cls.objects.bulk_update(statuses, fields)
+            ConsumerProgress.apply_changes(changes)
+        return updated
+
+    def apply_broker_response(
+        self,
+        status: str,
+        notes: str = "",
+        contact_name: str = "",
+        contact_email: str = "",
+        *,
+        commit: bool = True,
+    ) -> list[str]:
+        """Update the record based on broker feedback.
 
-    def apply_broker_response(self, status: str, notes: str = "", contact_name: str = "", contact_email: str = ""):
-        """Update the record based on broker feedback."""
+        Pass ``commit=False`` to defer the write to
+        ``bulk_save_outreach(statuses, RESPONSE_UPDATE_FIELDS)``.
+        """
         now = timezone.now()
         self.status = status
         self.last_response_at = now
@@ -384,7 +797,167 @@ class ConsumerBrokerStatus(models.Model):
         self.notes = notes
         self.broker_contact_name = contact_name
         self.broker_contact_email = contact_email
-        self.save(update_fields=update_fields)
+        if commit:
+            self.save(update_fields=update_fields)
+        return update_fields
+
+
+class ConsumerProgress(models.Model):
+    """Materialized per-consumer ``ConsumerBrokerStatus`` counters.
+
+    Kept current inside the same transaction as the row change by
+    ``ConsumerBrokerStatus.save``, ``bulk_save_outreach`` and
+    ``initialize_broker_statuses``, using F() increments so concurrent
+    writers do not lose updates. Queryset ``update()``/``delete()`` calls and
+    broker deletions bypass it; ``manage.py rebuild_consumer_progress``
+    recomputes every row from scratch.
+    """
+
+    consumer = models.OneToOneField(
+        Consumer,
+        primary_key=True,
+        related_name="progress",
+        on_delete=models.CASCADE,
+    )
+    queued_count = models.IntegerField(default=0)
+    contacted_count = models.IntegerField(default=0)
+    processing_count = models.IntegerField(default=0)
+    completed_count = models.IntegerField(default=0)
+    rejected_count = models.IntegerField(default=0)
+    bounced_count = models.IntegerField(default=0)
+    no_response_count = models.IntegerField(default=0)
+    skipped_count = models.IntegerField(default=0)
+    contacted_total = models.IntegerField(default=0)
+    last_completed_at = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name_plural = "consumer progress"
+
+    def __str__(self):
+        return f"Progress for {self.consumer_id}"
+
+    @staticmethod
+    def count_field(status: str) -> str:
+        return f"{status}_count"
+
+    @property
+    def total(self) -> int:
+        return sum(
+            getattr(self, self.count_field(choice))
+            for choice, _ in ConsumerBrokerStatus.Status.choices
+        )
+
+    def counts(self) -> dict:
+        """Counters keyed like ``Consumer._aggregate_progress``."""
+        counts = {"total": self.total, "contacted": self.contacted_total}
+        for choice, _ in ConsumerBrokerStatus.Status.choices:
+            counts[f"status_{choice}"] = getattr(self, self.count_field(choice))
+        return counts
+
+    @classmethod
+    def apply_changes(cls, changes: Iterable[tuple[int, tuple | None, tuple]]) -> None:
+        """Apply ``(consumer_id, before, after)`` status transitions as F() increments.
+
+        ``before``/``after`` are ``ConsumerBrokerStatus._progress_key`` tuples;
+        ``before`` is ``None`` for a new row. Issues one UPDATE per consumer;
+        a consumer without a progress row yet is recounted instead.
+        """
+        deltas: dict[int, dict[str, int]] = {}
+        completed: dict[int, object] = {}
+        for consumer_id, before, after in changes:
+            delta = deltas.setdefault(consumer_id, {})
+            if before is not None:
+                field = cls.count_field(before[0])
+                delta[field] = delta.get(field, 0) - 1
+                delta["contacted_total"] = delta.get("contacted_total", 0) - int(before[1])
+            field = cls.count_field(after[0])
+            delta[field] = delta.get(field, 0) + 1
+            delta["contacted_total"] = delta.get("contacted_total", 0) + int(after[1])
+            completed_at = after[2]
+            if completed_at and completed_at != (before[2] if before else None):
+                if consumer_id not in completed or completed[consumer_id] < completed_at:
+                    completed[consumer_id] = completed_at
+
+        now = timezone.now()
+        for consumer_id, delta in deltas.items():
+            updates = {field: models.F(field) + amount for field, amount in delta.items() if amount}
+            completed_at = completed.get(consumer_id)
+            if completed_at:
+                updates["last_completed_at"] = models.Case(
+                    models.When(
+                        models.Q(last_completed_at__isnull=True) | models.Q(last_completed_at__lt=completed_at),
+                        then=models.Value(completed_at, output_field=models.DateTimeField()),
+                    ),
+                    default=models.F("last_completed_at"),
+                )
+            if not updates:
+                continue
+            updates["updated_at"] = now
+            if not cls.objects.filter(consumer_id=consumer_id).update(**updates):
+                cls.rebuild(consumer_ids=[consumer_id])
+
+    @classmethod
+    def rebuild(cls, consumer_ids: Iterable[int] | None = None) -> int:
+        """Recompute counters from ``ConsumerBrokerStatus`` and its archive with set-based SQL.
+
+        Deletes the affected progress rows and re-inserts them with one
+        ``INSERT ... SELECT ... GROUP BY``. Returns the number of rows written.
+        """
+        qn = connection.ops.quote_name
+        progress_table = qn(cls._meta.db_table)
+        consumer_table = qn(Consumer._meta.db_table)
+        choices = [choice for choice, _ in ConsumerBrokerStatus.Status.choices]
+
+        columns = ["consumer_id"] + [cls.count_field(choice) for choice in choices]
+        columns += ["contacted_total", "last_completed_at", "updated_at"]
+        selects = ["c.id"]
+        params: list = []
+        for choice in choices:
+            selects.append("COALESCE(SUM(CASE WHEN s.status = %s THEN 1 ELSE 0 END), 0)")
+            params.append(choice)
+        engaged = ", ".join(["%s"] * len(ConsumerBrokerStatus.ENGAGED_STATUSES))
+        selects.append(
+            "COALESCE(SUM(CASE WHEN s.contacted_at IS NOT NULL "
+            f"OR s.status IN ({engaged}) THEN 1 ELSE 0 END), 0)"
+        )
+        params.extend(ConsumerBrokerStatus.ENGAGED_STATUSES)
+        selects.append("MAX(s.completed_at)")
+        selects.append("%s")
+        params.append(connection.ops.adapt_datetimefield_value(timezone.now()))
+
+        where = status_where = ""
+        delete_sql = f"DELETE FROM {progress_table}"
+        delete_params: list = []
+        if consumer_ids is not None:
+            consumer_ids = list(consumer_ids)
+            if not consumer_ids:
+                return 0
+            placeholders = ", ".join(["%s"] * len(consumer_ids))
+            where = f" WHERE c.id IN ({placeholders})"
+            status_where = f" WHERE consumer_id IN ({placeholders})"
+            delete_sql += status_where
+            delete_params = consumer_ids
+            # Once for each half of the UNION, once for the outer WHERE.
+            params.extend(consumer_ids * 3)
+
+        # Hot and archived rows both count; filter each half so neither is scanned in full.
+        status_columns = "consumer_id, status, contacted_at, completed_at"
+        statuses = (
+            f"(SELECT {status_columns} FROM {qn(ConsumerBrokerStatus._meta.db_table)}{status_where} "
+            f"UNION ALL SELECT {status_columns} FROM "
+            f"{qn(ArchivedConsumerBrokerStatus._meta.db_table)}{status_where})"
+        )
+        insert_sql = (
+            f"INSERT INTO {progress_table} ({', '.join(qn(col) for col in columns)}) "
+            f"SELECT {', '.join(selects)} FROM {consumer_table} c "
+            f"LEFT JOIN {statuses} s ON s.consumer_id = c.id"
+            f"{where} GROUP BY c.id"
+        )
+        with transaction.atomic(), connection.cursor() as cursor:
+            cursor.execute(delete_sql, delete_params)
+            cursor.execute(insert_sql, params)
+            return cursor.rowcount
 
 
 class EmailDripState(models.Model):
@@ -463,6 +1036,72 @@ class BrokerContactLog(models.Model):
         ordering = ("-sent_at",)
 
 
+class ArchivedConsumerBrokerStatus(models.Model):
+    """Cold copy of a terminal ``ConsumerBrokerStatus`` row.
+
+    Rows keep their original id and tracking token; ``archive_broker_history``
+    moves them here so the hot table only holds work in flight. Progress
+    counts, compliance links and re-initialization all look at both tables.
+    """
+
+    id = models.BigIntegerField(primary_key=True)
+    consumer = models.ForeignKey(
+        Consumer,
+        related_name="archived_broker_statuses",
+        on_delete=models.CASCADE,
+    )
+    broker = models.ForeignKey(
+        DataBrokers2025,
+        related_name="archived_consumer_statuses",
+        on_delete=models.CASCADE,
+    )
+    status = models.CharField(max_length=20, choices=ConsumerBrokerStatus.Status.choices)
+    tracking_token = models.UUIDField(unique=True, editable=False)
+    request_type = models.CharField(max_length=20, choices=BrokerRequestType.choices)
+    batch_number = models.PositiveIntegerField(blank=True, null=True)
+    contacted_at = models.DateTimeField(blank=True, null=True)
+    last_response_at = models.DateTimeField(blank=True, null=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+    broker_contact_name = models.CharField(max_length=255, blank=True)
+    broker_contact_email = models.CharField(max_length=255, blank=True)
+    notes = models.TextField(blank=True)
+    last_email_subject = models.CharField(max_length=255, blank=True)
+    last_email_id = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ("consumer", "broker")
+
+    def __str__(self):
+        return f"{self.consumer} -> {self.broker} ({self.status}, archived)"
+
+
+class ArchivedBrokerContactLog(models.Model):
+    """Cold copy of a ``BrokerContactLog`` row; ``status_id`` may point at either store."""
+
+    id = models.BigIntegerField(primary_key=True)
+    consumer = models.ForeignKey(
+        Consumer, related_name="archived_contact_logs", on_delete=models.CASCADE
+    )
+    broker = models.ForeignKey(
+        DataBrokers2025, related_name="archived_contact_logs", on_delete=models.CASCADE
+    )
+    status_id = models.BigIntegerField(db_index=True)
+    subject = models.CharField(max_length=255)
+    snippet = models.TextField(blank=True)
+    sent_at = models.DateTimeField()
+    success = models.BooleanField(default=True)
+    error = models.TextField(blank=True)
+    metadata = models.JSONField(default=dict, blank=True)
+    created_at = models.DateTimeField()
+    archived_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ("-sent_at",)
+
+
 class NewsletterSubscriber(models.Model):
     """Newsletter opt-in records."""
 
@@ -478,8 +1117,10 @@ class NewsletterSubscriber(models.Model):
 
 @receiver(post_save, sender=Consumer)
 def auto_initialize_brokers(sender, instance: Consumer, created: bool, **kwargs):
-    if created:
-        instance.initialize_broker_statuses()
+    # Request handlers set ``defer_onboarding`` and leave the work to
+    # ``onboard_consumers`` (or the next drip run) instead.
+    if created and not kwargs.get("raw") and not getattr(instance, "defer_onboarding", False):
+        instance.onboard()
 
 
 class ServiceMarket(models.Model):
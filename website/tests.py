@@ -1,21 +1,59 @@
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+import uuid
+import zipfile
+from datetime import timedelta
+from io import StringIO
+from pathlib import Path
 from unittest.mock import patch
+from urllib.parse import unquote
 
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from django.core import mail
-from django.core.management import call_command
+from django.core.management import CommandError, call_command
 
 from website.models import (
+    AcknowledgementRun,
+    ArchivedBrokerContactLog,
+    ArchivedConsumerBrokerStatus,
+    BrokerContactLog,
     Consumer,
     ConsumerBrokerStatus,
     DataBrokers2025,
+    BrokerAcknowledgement,
     BrokerCompliance,
+    ConsumerProgress,
+    DoNotEmailRequest,
     NewsletterSubscriber,
 )
+from email_service.models import OutboundEmail
+from website.exports import EXPORT_FORMATS, parquet_available, window_export
+from website.management.commands.send_broker_acknowledgements import Command as AckCommand
+from website.views import _ensure_consumer
 from insights.models import Insight
 
 
+_logs_override = None
+
+
+def setUpModule():
+    # Command logs and run summaries go to a scratch dir, not the working tree.
+    global _logs_override
+    _logs_override = override_settings(LOGS_ROOT=Path(tempfile.mkdtemp()))
+    _logs_override.enable()
+
+
+def tearDownModule():
+    shutil.rmtree(_logs_override.options["LOGS_ROOT"], ignore_errors=True)
+    _logs_override.disable()
+
+
 class BrokerComplianceViewTests(TestCase):
     def setUp(self):
         self.broker = DataBrokers2025.objects.create(name="Acme Data", state="CA")
@@ -128,6 +166,672 @@ class BrokerComplianceViewTests(TestCase):
         self.assertEqual(self.status.status, ConsumerBrokerStatus.Status.PROCESSING)
 
 
+class BrokerComplianceBulkTests(TestCase):
+    def setUp(self):
+        self.broker = DataBrokers2025.objects.create(name="Bulk Data", state="CA")
+        self.other_broker = DataBrokers2025.objects.create(name="Other Data", state="CA")
+        self.consumers = [
+            Consumer.objects.create(first_name=f"Bulk{i}", last_name="Doe", primary_email=f"bulk{i}@example.com")
+            for i in range(3)
+        ]
+        self.statuses = list(ConsumerBrokerStatus.objects.filter(broker=self.broker).order_by("id"))
+        self.foreign = ConsumerBrokerStatus.objects.filter(broker=self.other_broker).first()
+        self.compliance = BrokerCompliance.objects.create(
+            broker=self.broker,
+            token=BrokerCompliance.generate_token(),
+            contact_name="Agent",
+        )
+        self.url = reverse("website:broker-compliance-bulk")
+
+    def test_json_upload_reports_every_row(self):
+        payload = [
+            {"tracking_token": str(self.statuses[0].tracking_token), "status": "completed", "notes": "Deleted"},
+            {"tracking_token": str(self.statuses[1].tracking_token), "status": "processing"},
+            {"tracking_token": str(self.statuses[1].tracking_token), "status": "rejected"},
+            {"tracking_token": str(self.foreign.tracking_token), "status": "completed"},
+            {"tracking_token": "not-a-token", "status": "completed"},
+            {"tracking_token": str(self.statuses[2].tracking_token), "status": "queued"},
+        ]
+        # Token lookup, the IN query, then the bulk UPDATE and progress counters.
+        with self.assertNumQueries(7):
+            resp = self.client.post(
+                self.url,
+                data=json.dumps(payload),
+                content_type="application/json",
+                HTTP_AUTHORIZATION=f"Bearer {self.compliance.token}",
+            )
+
+        self.assertEqual(resp.status_code, 200)
+        report = resp.json()
+        self.assertEqual((report["updated"], report["errors"]), (2, 4))
+        self.assertEqual(
+            [row["result"] for row in report["results"]],
+            ["updated", "updated", "error", "error", "error", "error"],
+        )
+        self.assertEqual(report["results"][2]["error"], "Duplicate of row 2.")
+        first = ConsumerBrokerStatus.objects.get(pk=self.statuses[0].pk)
+        self.assertEqual((first.status, first.notes, first.broker_contact_name), ("completed", "Deleted", "Agent"))
+        self.assertIsNotNone(first.completed_at)
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, ConsumerBrokerStatus.Status.QUEUED)
+        progress = ConsumerProgress.objects.get(consumer=self.statuses[0].consumer)
+        self.assertEqual(progress.counts(), self.statuses[0].consumer._aggregate_progress())
+
+    def test_csv_upload_and_authentication(self):
+        body = f"tracking_token,status,notes\n{self.statuses[0].tracking_token},rejected,No record\n"
+        resp = self.client.post(self.url, data=body, content_type="text/csv")
+        self.assertEqual(resp.status_code, 403)
+
+        resp = self.client.post(f"{self.url}?t={self.compliance.token}", data=body, content_type="text/csv")
+
+        self.assertEqual(resp.json()["updated"], 1)
+        self.statuses[0].refresh_from_db()
+        self.assertEqual(self.statuses[0].status, ConsumerBrokerStatus.Status.REJECTED)
+
+        resp = self.client.post(f"{self.url}?t={self.compliance.token}", data="status\n", content_type="text/csv")
+        self.assertEqual(resp.status_code, 400)
+
+        # Multipart form without the file field is rejected rather than read as a raw body.
+        resp = self.client.post(f"{self.url}?t={self.compliance.token}", data={"notes": "no file"})
+        self.assertEqual(resp.status_code, 400)
+        self.assertIn("'file' field", resp.json()["error"])
+
+
+class BrokerRequestFeedTests(TestCase):
+    def setUp(self):
+        self.broker = DataBrokers2025.objects.create(name="Feed Data", state="CA")
+        for i in range(5):
+            Consumer.objects.create(first_name=f"Feed{i}", last_name="Doe", primary_email=f"feed{i}@example.com")
+        self.statuses = list(ConsumerBrokerStatus.objects.filter(broker=self.broker).order_by("id"))
+        for status in self.statuses[:4]:
+            status.mark_contacted()
+        self.compliance = BrokerCompliance.objects.create(broker=self.broker, token=BrokerCompliance.generate_token())
+        self.url = reverse("website:broker-request-feed")
+        self.auth = {"HTTP_AUTHORIZATION": f"Bearer {self.compliance.token}"}
+
+    def test_keyset_pages_cover_open_requests(self):
+        with self.assertNumQueries(3):  # token, validators, page
+            first = self.client.get(self.url, {"limit": 3}, **self.auth)
+        page = first.json()
+        self.assertEqual(len(page["results"]), 3)
+        self.assertEqual(page["results"][0]["email"], "feed0@example.com")
+        self.assertEqual(page["next_cursor"], self.statuses[2].id)
+
+        second = self.client.get(self.url, {"limit": 3, "cursor": page["next_cursor"]}, **self.auth).json()
+        self.assertEqual(
+            [row["tracking_token"] for row in second["results"]], [str(self.statuses[3].tracking_token)]
+        )
+        self.assertIsNone(second["next_cursor"])
+
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_conditional_requests_and_deltas(self):
+        resp = self.client.get(self.url, **self.auth)
+        etag, last_modified = resp["ETag"], resp["Last-Modified"]
+
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.auth).status_code, 304)
+        self.assertEqual(
+            self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=last_modified, **self.auth).status_code, 304
+        )
+
+        since = timezone.now().isoformat()
+        self.statuses[0].apply_broker_response(ConsumerBrokerStatus.Status.PROCESSING)
+        self.statuses[1].apply_broker_response(ConsumerBrokerStatus.Status.COMPLETED)
+        delta = self.client.get(self.url, {"since": since}, **self.auth).json()
+        self.assertEqual([row["status"] for row in delta["results"]], ["processing"])
+        # Requests that left the open set are reported so clients can drop them.
+        self.assertEqual(
+            delta["closed"],
+            [
+                {
+                    "tracking_token": str(self.statuses[1].tracking_token),
+                    "status": "completed",
+                    "updated_at": ConsumerBrokerStatus.objects.get(pk=self.statuses[1].pk).updated_at.isoformat(),
+                }
+            ],
+        )
+        self.assertNotIn("closed", self.client.get(self.url, **self.auth).json())
+
+        resp = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag, **self.auth)
+        self.assertEqual(resp.status_code, 200)
+        self.assertNotEqual(resp["ETag"], etag)
+
+
+class SendBrokerAcknowledgementsCommandTests(TestCase):
+    def setUp(self):
+        mail.outbox.clear()
+        self.brokers = [
+            DataBrokers2025.objects.create(name=f"Ack {i}", contact_email=f"privacy@ack{i}.example")
+            for i in range(4)
+        ]
+        DataBrokers2025.objects.create(name="No email")
+
+    def _call(self, **opts):
+        out = StringIO()
+        with patch.object(AckCommand, "sleep") as sleep:
+            call_command("send_broker_acknowledgements", stdout=out, **opts)
+        return out.getvalue(), sleep
+
+    def test_run_is_split_across_invocations_and_keeps_pace(self):
+        output, sleep = self._call(max_sends=2, delay_seconds=0)
+        self.assertIn("continue with --resume", output)
+        self.assertEqual(len(mail.outbox), 2)
+        run = AcknowledgementRun.objects.get()
+        self.assertEqual((run.status, run.sent, run.last_broker_id), ("running", 2, self.brokers[1].id))
+
+        # The previous send was just now, so the next one waits out the global delay first.
+        output, sleep = self._call(resume=True, delay_seconds=30, max_sends=1)
+        self.assertGreater(sleep.call_args_list[0].args[0], 25)
+        self.assertEqual(len(mail.outbox), 3)
+
+        output, _ = self._call(resume=True, delay_seconds=0, workers=3)
+        run.refresh_from_db()
+        self.assertEqual((run.status, run.sent, run.skipped), ("completed", 4, 1))
+        self.assertEqual(sorted(m.to[0] for m in mail.outbox), [b.contact_email for b in self.brokers])
+        self.assertEqual(BrokerAcknowledgement.objects.filter(send_count=1).count(), 4)
+
+        output, _ = self._call(resume=True)
+        self.assertIn("No unfinished acknowledgement run", output)
+
+    def test_bookkeeping_is_constant_per_chunk(self):
+        BrokerAcknowledgement.objects.create(broker=self.brokers[0], send_count=2)
+        # Id range, run row, broker scan, rows created up front, then one
+        # UPDATE and one checkpoint per chunk, and the finish.
+        with self.assertNumQueries(9):
+            self._call(delay_seconds=0, chunk_size=50)
+        counts = dict(BrokerAcknowledgement.objects.values_list("broker__name", "send_count"))
+        self.assertEqual(counts, {"Ack 0": 3, "Ack 1": 1, "Ack 2": 1, "Ack 3": 1, "No email": 0})
+        self.assertEqual(AcknowledgementRun.objects.get().skipped, 1)
+
+    def test_confirmation_link_marks_broker_acknowledged(self):
+        url = reverse("website:broker-acknowledgement-confirmation")
+        token = BrokerAcknowledgement.confirmation_token([self.brokers[0].id])
+        resp = self.client.get(url, {"token": token})
+        self.assertContains(resp, "has been recorded")
+        self.assertTrue(BrokerAcknowledgement.objects.get(broker=self.brokers[0]).acknowledged)
+
+    def test_confirmation_link_rejects_unsigned_broker_ids(self):
+        url = reverse("website:broker-acknowledgement-confirmation")
+        token = BrokerAcknowledgement.confirmation_token([self.brokers[0].id])
+        for params in ({"brokerid": self.brokers[1].id}, {"token": token[:-1]}, {"token": f"[{self.brokers[1].id}]"}):
+            with self.subTest(params=params):
+                self.assertEqual(self.client.get(url, params).status_code, 400)
+        self.assertFalse(BrokerAcknowledgement.objects.filter(acknowledged=True).exists())
+
+    def test_brokers_sharing_recipients_get_one_email(self):
+        parent_a = DataBrokers2025.objects.create(
+            name="Parent A", contact_email="Privacy <PRIVACY@parent.example>; legal@parent.example"
+        )
+        sibling = DataBrokers2025.objects.create(name="Sibling", contact_email="privacy@sibling.example")
+        parent_b = DataBrokers2025.objects.create(
+            name="Parent B", contact_email="legal@parent.example, privacy@parent.example"
+        )
+
+        self._call(delay_seconds=0, max_sends=5)
+        # Workers finish in any order, so find the shared email by its recipients.
+        shared = ["legal@parent.example", "privacy@parent.example"]
+        [combined] = [message for message in mail.outbox if message.to == shared]
+        self.assertIn("Hello Parent A, Parent B team", combined.body)
+        token = unquote(re.search(r"token=([^\"&]+)", combined.alternatives[0][0]).group(1))
+        self.assertEqual(BrokerAcknowledgement.broker_ids_from_token(token), [parent_a.id, parent_b.id])
+
+        # Parent B sits after the checkpoint but was covered, so resuming only reaches the sibling.
+        self._call(resume=True, delay_seconds=0)
+        self.assertEqual(len(mail.outbox), 6)
+        self.assertEqual(mail.outbox[-1].to, [sibling.contact_email])
+        run = AcknowledgementRun.objects.get()
+        self.assertEqual((run.status, run.sent, run.skipped, run.total), ("completed", 7, 1, 8))
+        self.assertEqual(BrokerAcknowledgement.objects.get(broker=parent_b).send_count, 1)
+
+        resp = self.client.get(
+            reverse("website:broker-acknowledgement-confirmation"), {"token": token}
+        )
+        self.assertContains(resp, "Parent A, Parent B")
+        self.assertEqual(
+            BrokerAcknowledgement.objects.filter(broker__in=[parent_a, parent_b], acknowledged=True).count(), 2
+        )
+
+    def test_time_budget_stops_before_waiting_past_it(self):
+        output, sleep = self._call(delay_seconds=120, max_seconds=60)
+        self.assertEqual(len(mail.outbox), 1)
+        sleep.assert_not_called()
+        self.assertEqual(AcknowledgementRun.objects.get().sent, 1)
+
+
+class ConsumerProgressSnapshotTests(TestCase):
+    def test_snapshot_reads_counters_or_recounts_in_one_query(self):
+        consumer = Consumer.objects.create(first_name="Lee", last_name="Chan", primary_email="lee@example.com")
+        now = timezone.now()
+        Status = ConsumerBrokerStatus.Status
+        rows = [
+            (Status.QUEUED, None, None),
+            (Status.QUEUED, now, None),
+            (Status.CONTACTED, now, None),
+            (Status.COMPLETED, now, now),
+            (Status.COMPLETED, now, now - timedelta(days=30)),
+            (Status.BOUNCED, None, None),
+        ]
+        for i, (status, contacted_at, completed_at) in enumerate(rows):
+            broker = DataBrokers2025.objects.create(name=f"Snapshot {i}")
+            ConsumerBrokerStatus.objects.update_or_create(
+                consumer=consumer,
+                broker=broker,
+                defaults={"status": status, "contacted_at": contacted_at, "completed_at": completed_at},
+            )
+
+        # Progress row plus the indexed recent-completions count.
+        with self.assertNumQueries(2):
+            snapshot = consumer.progress_snapshot(window_start=now - timedelta(days=7))
+
+        ConsumerProgress.objects.filter(consumer=consumer).delete()
+        consumer = Consumer.objects.get(pk=consumer.pk)
+        with self.assertNumQueries(3):  # missing progress row, then the hot and archive aggregates
+            recounted = consumer.progress_snapshot(window_start=now - timedelta(days=7))
+        self.assertEqual(recounted, snapshot)
+
+        expected = {"total": 6}
+        expected.update({choice: 0 for choice, _ in Status.choices})
+        expected.update({Status.QUEUED: 2, Status.CONTACTED: 1, Status.COMPLETED: 2, Status.BOUNCED: 1})
+        expected.update(
+            {
+                "contacted": 5,
+                "completed_percentage": 40.0,
+                "completed_percentage_display": "40%",
+                "recent_completions": 1,
+            }
+        )
+        self.assertEqual(snapshot, expected)
+        self.assertEqual(list(snapshot), list(expected))
+        self.assertNotIn("recent_completions", consumer.progress_snapshot())
+
+
+class InitializeBrokerStatusesTests(TestCase):
+    def _onboard(self, broker_count):
+        DataBrokers2025.objects.bulk_create(
+            [DataBrokers2025(name=f"Registry {broker_count}-{i}") for i in range(broker_count)]
+        )
+        # bulk_create skips the post_save auto-initialization.
+        (consumer,) = Consumer.objects.bulk_create(
+            [Consumer(first_name="Init", last_name="Test", primary_email=f"init{broker_count}@example.com")]
+        )
+        return consumer
+
+    def test_set_based_insert_costs_constant_statements(self):
+        # INSERT ... SELECT, then the progress recount (savepoint, DELETE,
+        # INSERT ... SELECT, release) regardless of registry size.
+        small = self._onboard(3)
+        with self.assertNumQueries(5) as small_ctx:
+            self.assertEqual(small.initialize_broker_statuses(), 3)
+
+        large = self._onboard(40)
+        with self.assertNumQueries(5):
+            self.assertEqual(large.initialize_broker_statuses(), 43)
+        self.assertIn("SELECT", small_ctx.captured_queries[0]["sql"])
+
+        tokens = list(ConsumerBrokerStatus.objects.values_list("tracking_token", flat=True))
+        self.assertEqual(len(tokens), len(set(tokens)))
+        self.assertTrue(all(isinstance(token, uuid.UUID) for token in tokens))
+        self.assertEqual(ConsumerProgress.objects.get(consumer=large).queued_count, 43)
+
+    def test_existing_and_inactive_brokers_are_skipped(self):
+        consumer = self._onboard(3)
+        DataBrokers2025.objects.filter(name="Registry 3-2").update(is_active=False)
+        existing = ConsumerBrokerStatus.objects.create(
+            consumer=consumer,
+            broker=DataBrokers2025.objects.get(name="Registry 3-0"),
+            status=ConsumerBrokerStatus.Status.COMPLETED,
+        )
+
+        self.assertEqual(consumer.initialize_broker_statuses(), 1)
+        self.assertEqual(consumer.initialize_broker_statuses(), 0)
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.status, ConsumerBrokerStatus.Status.COMPLETED)
+        created = consumer.broker_statuses.get(broker__name="Registry 3-1")
+        self.assertEqual(created.status, ConsumerBrokerStatus.Status.QUEUED)
+        self.assertEqual(created.request_type, ConsumerBrokerStatus.RequestType.DELETE)
+        self.assertEqual(created.notes, "")
+        self.assertIsNotNone(created.created_at)
+
+
+class ConsumerOnboardingTests(TestCase):
+    def test_signup_defers_onboarding_to_command_and_runs_once(self):
+        for i in range(3):
+            DataBrokers2025.objects.create(name=f"Onboard {i}")
+
+        consumer = _ensure_consumer("signup@example.com", "Sig", "Nup", "5551234567", True)
+
+        self.assertIsNone(consumer.brokers_initialized_at)
+        self.assertFalse(consumer.broker_statuses.exists())
+
+        call_command("onboard_consumers")
+
+        consumer.refresh_from_db()
+        self.assertIsNotNone(consumer.brokers_initialized_at)
+        self.assertEqual(consumer.broker_statuses.count(), 3)
+        self.assertEqual(consumer.onboard(), 0)
+        self.assertEqual(Consumer.onboard_pending(), (0, 0))
+
+    def test_directly_created_consumers_are_onboarded_immediately(self):
+        DataBrokers2025.objects.create(name="Onboard direct")
+        consumer = Consumer.objects.create(first_name="Ad", last_name="Min", primary_email="admin-made@example.com")
+
+        self.assertIsNotNone(consumer.brokers_initialized_at)
+        self.assertEqual(consumer.broker_statuses.count(), 1)
+
+
+class FanOutBrokersCommandTests(TestCase):
+    def test_new_deactivated_and_reactivated_brokers(self):
+        original = DataBrokers2025.objects.create(name="Original")
+        consumers = [
+            Consumer.objects.create(first_name=f"Fan{i}", last_name="Out", primary_email=f"fan{i}@example.com")
+            for i in range(3)
+        ]
+        call_command("fan_out_brokers")  # catches up the pre-existing broker
+        added = DataBrokers2025.objects.create(name="Added later")
+
+        call_command("fan_out_brokers", chunk_size=2)
+
+        for consumer in consumers:
+            self.assertEqual(consumer.broker_statuses.count(), 2)
+        added.refresh_from_db()
+        self.assertIsNotNone(added.fanned_out_at)
+
+        contacted = consumers[0].broker_statuses.get(broker=original)
+        contacted.mark_contacted()
+        DataBrokers2025.objects.filter(pk=original.pk).update(is_active=False)
+        call_command("fan_out_brokers")
+
+        statuses = ConsumerBrokerStatus.objects.filter(broker=original)
+        self.assertEqual(statuses.filter(status=ConsumerBrokerStatus.Status.SKIPPED).count(), 2)
+        self.assertEqual(statuses.filter(status=ConsumerBrokerStatus.Status.CONTACTED).count(), 1)
+        progress = ConsumerProgress.objects.get(consumer=consumers[1])
+        self.assertEqual((progress.queued_count, progress.skipped_count), (1, 1))
+
+        DataBrokers2025.objects.filter(pk=original.pk).update(is_active=True)
+        call_command("fan_out_brokers")
+
+        self.assertEqual(statuses.filter(status=ConsumerBrokerStatus.Status.QUEUED).count(), 2)
+        self.assertEqual(ConsumerBrokerStatus.objects.count(), 6)
+        for consumer in consumers:
+            self.assertEqual(
+                ConsumerProgress.objects.get(consumer=consumer).counts(),
+                consumer._aggregate_progress(),
+            )
+
+
+class ConsumerProgressTests(TestCase):
+    def setUp(self):
+        self.brokers = [DataBrokers2025.objects.create(name=f"Progress {i}") for i in range(4)]
+        self.consumer = Consumer.objects.create(first_name="Dana", last_name="Ng", primary_email="dana@example.com")
+
+    def assertCountersMatchRows(self):
+        progress = ConsumerProgress.objects.get(consumer=self.consumer)
+        recount = self.consumer._aggregate_progress()
+        self.assertEqual(progress.counts(), recount)
+        return progress
+
+    def test_counters_follow_status_transitions(self):
+        progress = self.assertCountersMatchRows()
+        self.assertEqual(progress.queued_count, 4)
+
+        statuses = list(self.consumer.broker_statuses.order_by("id"))
+        statuses[0].mark_contacted(subject="Hello")
+        statuses[1].apply_broker_response(ConsumerBrokerStatus.Status.COMPLETED)
+        statuses[2].mark_bounced("550", commit=False)
+        statuses[3].mark_contacted(commit=False)
+        ConsumerBrokerStatus.bulk_save_outreach(statuses[2:])
+
+        progress = self.assertCountersMatchRows()
+        self.assertEqual(progress.queued_count, 0)
+        self.assertEqual(progress.contacted_count, 2)
+        self.assertEqual(progress.contacted_total, 4)
+        self.assertEqual(progress.last_completed_at, statuses[1].completed_at)
+
+        # Re-saving an unchanged row must not double count.
+        statuses[0].save()
+        self.assertCountersMatchRows()
+
+    def test_rebuild_command_repairs_drift(self):
+        ConsumerBrokerStatus.objects.filter(consumer=self.consumer).update(
+            status=ConsumerBrokerStatus.Status.REJECTED
+        )
+        other = Consumer.objects.create(first_name="No", last_name="Rows", primary_email="none@example.com")
+        ConsumerProgress.objects.filter(consumer=other).delete()
+
+        call_command("rebuild_consumer_progress")
+
+        progress = self.assertCountersMatchRows()
+        self.assertEqual(progress.rejected_count, 4)
+        self.assertEqual(ConsumerProgress.objects.get(consumer=other).total, 4)
+
+
+class ArchiveBrokerHistoryTests(TestCase):
+    def setUp(self):
+        self.brokers = [DataBrokers2025.objects.create(name=f"Archive {i}") for i in range(3)]
+        self.consumer = Consumer.objects.create(first_name="Ari", last_name="Cole", primary_email="ari@example.com")
+        statuses = list(self.consumer.broker_statuses.order_by("id"))
+        statuses[0].apply_broker_response(ConsumerBrokerStatus.Status.COMPLETED)
+        statuses[1].apply_broker_response(ConsumerBrokerStatus.Status.REJECTED)
+        self.old, self.recent, self.queued = statuses
+        long_ago = timezone.now() - timedelta(days=120)
+        for status in statuses:
+            BrokerContactLog.objects.create(
+                consumer=self.consumer, broker=status.broker, status=status, subject="Request", sent_at=long_ago
+            )
+        ConsumerBrokerStatus.objects.filter(pk__in=[self.old.pk, self.queued.pk]).update(updated_at=long_ago)
+
+    def test_moves_terminal_rows_and_reads_span_both_stores(self):
+        before = self.consumer._aggregate_progress()
+
+        call_command("archive_broker_history", days=90, stdout=StringIO())
+
+        self.assertEqual(
+            set(self.consumer.broker_statuses.values_list("id", flat=True)), {self.recent.pk, self.queued.pk}
+        )
+        archived = ArchivedConsumerBrokerStatus.objects.get()
+        self.assertEqual((archived.pk, archived.tracking_token), (self.old.pk, self.old.tracking_token))
+        self.assertEqual(BrokerContactLog.objects.count(), 0)
+        self.assertEqual(ArchivedBrokerContactLog.objects.count(), 3)
+
+        self.assertEqual(self.consumer._aggregate_progress(), before)
+        ConsumerProgress.rebuild([self.consumer.id])
+        self.assertEqual(ConsumerProgress.objects.get(consumer=self.consumer).counts(), before)
+        self.assertEqual(
+            Consumer.bulk_progress_snapshots([self.consumer.id])[self.consumer.id],
+            self.consumer.snapshot_from_counts(before),
+        )
+
+        # Archived pairs are not re-queued, and their compliance links still resolve.
+        self.assertEqual(self.consumer.initialize_broker_statuses(), 0)
+        response = self.client.get(reverse("website:broker-compliance-token", args=[self.old.tracking_token]))
+        self.assertTemplateUsed(response, "website/broker_compliance_success.html")
+
+    def test_dry_run_and_minimum_age(self):
+        out = StringIO()
+        call_command("archive_broker_history", dry_run=True, stdout=out)
+        self.assertIn("Would archive 1 status row(s) and 3 old contact log(s)", out.getvalue())
+        self.assertFalse(ArchivedConsumerBrokerStatus.objects.exists())
+        with self.assertRaises(CommandError):
+            call_command("archive_broker_history", days=7)
+
+
+class WindowExportTests(TestCase):
+    def setUp(self):
+        self.export_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.export_root, ignore_errors=True)
+        override = override_settings(DNE_EXPORT_ROOT=self.export_root)
+        override.enable()
+        self.addCleanup(override.disable)
+        self.end = timezone.now() + timedelta(minutes=5)
+        self.start = self.end - timedelta(days=1)
+
+    def _signup(self, email):
+        return DoNotEmailRequest.objects.create(
+            first_name="Pat",
+            last_name="Lee",
+            primary_email=email,
+            address1="1 Main St",
+            city="Fresno",
+            region="CA",
+            postal="93650",
+            paid_confirmed=True,
+        )
+
+    def test_export_is_cached_until_window_changes(self):
+        self.assertIsNone(window_export(self.start, self.end))
+
+        self._signup("one@example.com")
+        first = window_export(self.start, self.end)
+        self.assertEqual(first.row_count, 1)
+        self.assertIn("one@example.com", first.read_text())
+
+        with patch("website.exports._write_export") as write:
+            again = window_export(self.start, self.end)
+        write.assert_not_called()
+        self.assertEqual(again.path, first.path)
+
+        self._signup("two@example.com")
+        refreshed = window_export(self.start, self.end)
+        self.assertNotEqual(refreshed.path, first.path)
+        self.assertFalse(first.path.exists())
+        self.assertIn("two@example.com", refreshed.read_text())
+
+    def test_new_export_prunes_old_windows(self):
+        old = Path(self.export_root) / "dne_1_2_5_9.csv"
+        old.write_text("stale")
+        orphan = Path(self.export_root) / ".tmp-abc.csv"
+        orphan.write_text("partial")
+        week_ago = (timezone.now() - timedelta(days=7)).timestamp()
+        for path in (old, orphan):
+            os.utime(path, (week_ago, week_ago))
+        recent = Path(self.export_root) / "dne_3_4_1_1.csv"
+        recent.write_text("recent")
+
+        self._signup("one@example.com")
+        export = window_export(self.start, self.end)
+
+        self.assertTrue(export.path.exists())
+        self.assertTrue(recent.exists())
+        self.assertFalse(old.exists())
+        self.assertFalse(orphan.exists())
+
+    def test_compressed_and_columnar_formats_keep_columns(self):
+        self._signup("one@example.com")
+        self._signup("two@example.com")
+        csv_text = window_export(self.start, self.end).read_text()
+
+        gz = window_export(self.start, self.end, "csv.gz")
+        self.assertEqual(gz.filename[-7:], ".csv.gz")
+        self.assertEqual(gzip.decompress(gz.read_bytes()).decode(), csv_text)
+
+        packed = window_export(self.start, self.end, "zip")
+        with zipfile.ZipFile(packed.path) as archive:
+            (member,) = archive.namelist()
+            self.assertEqual(archive.read(member).decode(), csv_text)
+
+        with self.assertRaises(ValueError):
+            window_export(self.start, self.end, "xlsx")
+
+        if not parquet_available():
+            self.assertNotIn("parquet", EXPORT_FORMATS)
+            return
+        import pandas as pd
+
+        frame = pd.read_parquet(window_export(self.start, self.end, "parquet").path)
+        self.assertEqual(list(frame.columns), csv_text.splitlines()[0].split(","))
+        self.assertEqual(list(frame["email1"]), ["one@example.com", "two@example.com"])
+
+    def test_compliance_download_accepts_format(self):
+        self._signup("one@example.com")
+        broker = DataBrokers2025.objects.create(name="Acme Data", state="CA")
+        compliance = BrokerCompliance.objects.create(
+            broker=broker,
+            token=BrokerCompliance.generate_token(),
+            last_window_start=self.start,
+            last_window_end=self.end,
+        )
+        url = reverse("website:broker-compliance")
+
+        resp = self.client.post(url, {"t": compliance.token, "download_csv": "1", "format": "zip"})
+        self.assertEqual(resp["Content-Type"], "application/zip")
+        self.assertIn(".zip", resp["Content-Disposition"])
+
+        resp = self.client.post(url, {"t": compliance.token, "download_csv": "1", "format": "csv.gz"})
+        self.assertEqual(resp["Content-Type"], "application/gzip")
+        self.assertNotIn("Content-Encoding", resp)
+        body = gzip.decompress(b"".join(resp.streaming_content)).decode()
+        self.assertEqual(body, window_export(self.start, self.end).read_text())
+
+        resp = self.client.post(url, {"t": compliance.token, "download_csv": "1", "format": "xlsx"})
+        self.assertEqual(resp.status_code, 400)
+
+    def test_compliance_download_streams_csv(self):
+        self._signup("one@example.com")
+        broker = DataBrokers2025.objects.create(name="Acme Data", state="CA")
+        compliance = BrokerCompliance.objects.create(
+            broker=broker,
+            token=BrokerCompliance.generate_token(),
+            last_window_start=self.start,
+            last_window_end=self.end,
+        )
+
+        resp = self.client.post(reverse("website:broker-compliance"), {"t": compliance.token, "download_csv": "1"})
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp["Content-Type"], "text/csv")
+        body = b"".join(resp.streaming_content).decode()
+        self.assertEqual(body, window_export(self.start, self.end).read_text())
+        self.assertIn("one@example.com", body)
+        self.assertNotIn("Content-Encoding", resp)
+
+        resp = self.client.post(
+            reverse("website:broker-compliance"),
+            {"t": compliance.token, "download_csv": "1"},
+            HTTP_ACCEPT_ENCODING="gzip, deflate",
+        )
+
+        self.assertEqual(resp["Content-Encoding"], "gzip")
+        self.assertIn("dne_records_", resp["Content-Disposition"])
+        self.assertEqual(gzip.decompress(b"".join(resp.streaming_content)).decode(), body)
+
+    def test_compliance_page_previews_window_in_one_query(self):
+        DoNotEmailRequest.objects.bulk_create(
+            [
+                DoNotEmailRequest(
+                    first_name="Pat",
+                    last_name=f"Lee{i}",
+                    primary_email=f"p{i}@example.com",
+                    address1="1 Main St",
+                    city="Fresno",
+                    region="CA",
+                    postal="93650",
+                    paid_confirmed=True,
+                )
+                for i in range(52)
+            ]
+        )
+        broker = DataBrokers2025.objects.create(name="Acme Data", state="CA")
+        compliance = BrokerCompliance.objects.create(
+            broker=broker,
+            token=BrokerCompliance.generate_token(),
+            last_window_start=self.start,
+            last_window_end=self.end,
+        )
+        url = reverse("website:broker-compliance")
+
+        with self.assertNumQueries(2):  # token lookup, then preview rows with the window total
+            resp = self.client.get(url, {"t": compliance.token})
+        self.assertEqual(resp.context["csv_count"], 52)
+        self.assertEqual(len(resp.context["window_consumers"]), 50)
+        self.assertEqual(resp.context["remaining_consumers"], 2)
+
+        with self.assertNumQueries(2):  # token lookup, then the streamed rows
+            resp = self.client.post(url, {"t": compliance.token, "download_csv": "1"})
+            body = b"".join(resp.streaming_content).decode()
+        self.assertEqual(len(body.splitlines()), 53)
+
+
 class NewsletterSubscribeTests(TestCase):
     def setUp(self):
         mail.outbox.clear()
@@ -140,9 +844,15 @@ class NewsletterSubscribeTests(TestCase):
         )
         self.assertEqual(resp.status_code, 200)
         self.assertTrue(NewsletterSubscriber.objects.filter(email="test@example.com").exists())
+        # Nothing is sent inside the request; both emails wait in the outbound queue.
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(OutboundEmail.objects.filter(status=OutboundEmail.Status.PENDING).count(), 2)
+
+        call_command("process_email_queue")
         # A welcome email to the subscriber plus an admin "new subscriber" notification.
         self.assertEqual(len(mail.outbox), 2)
         self.assertIn("Welcome to the SwanTech newsletter", mail.outbox[0].subject)
+        self.assertTrue(mail.outbox[0].alternatives)
 
     def test_invalid_email_shows_error(self):
         resp = self.client.post(
@@ -162,7 +872,7 @@ class NewsletterSubscribeTests(TestCase):
         )
         self.assertEqual(resp.status_code, 200)
         self.assertEqual(NewsletterSubscriber.objects.filter(email="hello@example.com").count(), 1)
-        self.assertEqual(len(mail.outbox), 0)
+        self.assertFalse(OutboundEmail.objects.exists())
 
 
 class NewsletterCommandTests(TestCase):
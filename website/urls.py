@@ -36,6 +36,13 @@ urlpatterns = [
     ),
     path('locations/', views.location_directory, name='location-directory'),
     path('sitemap.xml', views.sitemap_xml, name='sitemap'),
+    path(
+        'broker-acknowledgement/confirm/',
+        views.broker_acknowledgement_confirmation,
+        name='broker-acknowledgement-confirmation',
+    ),
+    path('broker-compliance/bulk/', views.broker_compliance_bulk, name='broker-compliance-bulk'),
+    path('broker-compliance/requests/', views.broker_request_feed, name='broker-request-feed'),
     path('broker-compliance/<uuid:tracking_token>/', views.broker_compliance, name='broker-compliance-token'),
     path('broker-compliance/', views.broker_compliance, name='broker-compliance'),
 ]
@@ -1,12 +1,13 @@
 import csv
+import hashlib
+import io
+import itertools
 import json
 import re
 import uuid
-from datetime import datetime, time, timedelta
-from io import StringIO
+from datetime import timezone as dt_timezone
 from zoneinfo import ZoneInfo
 from django.conf import settings
-from django.core.mail import send_mail
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.templatetags.static import static
@@ -14,15 +15,20 @@ from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib import messages
 from django.urls import reverse, NoReverseMatch
 from django.contrib.auth import get_user_model
+from django.core import signing
 from django.core.paginator import Paginator
-from django.http import JsonResponse, HttpResponse
+from django.http import FileResponse, JsonResponse, HttpResponse, StreamingHttpResponse
+from django.db.models import Count, Max, Q, Window
 from django.template.loader import render_to_string
 from django.views.decorators.cache import cache_page
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import condition, require_GET, require_POST
 
 from .models import (
     DoNotEmailRequest,
     DoNotCallRequest,
     ConsumerBrokerStatus,
+    ArchivedConsumerBrokerStatus,
     Consumer,
     BrokerCompliance,
     BrokerAcknowledgement,
@@ -35,7 +41,24 @@ from django.http import HttpResponseBadRequest
 from django.utils import timezone
 from django.core.validators import validate_email
 from django.core.exceptions import ValidationError
+from django.utils.cache import patch_vary_headers
+from django.utils.dateparse import parse_datetime
+from django.utils.http import content_disposition_header
+from django.utils.text import compress_sequence
+from .exports import (
+    WINDOW_TZ,
+    EXPORT_FORMATS,
+    ExportFormat,
+    default_window,
+    get_export_format,
+    stream_window_csv,
+    window_export,
+    window_filename,
+    window_queryset,
+    window_rows,
+)
 from .utils import manage_preferences_url
+from email_service.queue import enqueue_email, enqueue_message
 from .city_profiles import CITY_PROFILES
 # Create your views here.
 
@@ -64,7 +87,7 @@ def _ensure_consumer(email: str, first: str, last: str, phone: str, weekly_opt_i
         user, _ = User.objects.get_or_create(username=email, defaults=user_defaults)
     consumer = Consumer.objects.filter(primary_email=email).first()
     if not consumer:
-        consumer = Consumer.objects.create(
+        consumer = Consumer(
             user=user,
             first_name=first,
             last_name=last,
@@ -72,7 +95,9 @@ def _ensure_consumer(email: str, first: str, last: str, phone: str, weekly_opt_i
             phone=phone,
             weekly_status_opt_in=weekly_opt_in,
         )
-        consumer.initialize_broker_statuses(request_type=ConsumerBrokerStatus.RequestType.DELETE)
+        # Broker statuses are created off the request path by onboard_consumers.
+        consumer.defer_onboarding = True
+        consumer.save()
     else:
         updated = False
         for field, value in {
@@ -120,9 +145,9 @@ def book_consultation(request):
     email = (request.POST.get("email") or "").strip() or "No email provided"
     inquiry = (request.POST.get("inquiry") or "").strip() or "Not specified"
 
-    send_mail(
+    enqueue_email(
         subject="Hero Form: Book 15-minute Consultation",
-        message=(
+        body=(
             f"A visitor clicked 'Book 15-minute Consultation' on the homepage.\n\n"
             f"Name:    {name}\n"
             f"Email:   {email}\n"
@@ -130,8 +155,7 @@ def book_consultation(request):
             f"They are being redirected to Calendly now."
         ),
         from_email="SwanTech Site <contact@swantech.org>",
-        recipient_list=[getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")],
-        fail_silently=True,
+        to=[getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")],
     )
 
     return redirect(CALENDLY_URL)
@@ -175,9 +199,9 @@ def submit_estimate(request):
 
     notes_text = ("\n\nNotes:\n" + "\n".join(f"  - {n}" for n in notes)) if notes else ""
 
-    send_mail(
+    enqueue_email(
         subject=f"Pricing Calculator: {service_label} estimate requested",
-        message=(
+        body=(
             f"A visitor built an estimate for \"{service_label}\" and clicked 'Get an exact quote'.\n\n"
             f"Selections:\n{line_text}\n\n"
             f"{totals_text}"
@@ -185,8 +209,7 @@ def submit_estimate(request):
             f"They are being redirected to Calendly to book a call now."
         ),
         from_email="SwanTech Site <contact@swantech.org>",
-        recipient_list=[getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")],
-        fail_silently=True,
+        to=[getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")],
     )
 
     return redirect(CALENDLY_URL)
@@ -241,11 +264,11 @@ def newsletter_subscribe(request):
             [email],
         )
         welcome_email.attach_alternative(html_content, "text/html")
-        welcome_email.send()
+        enqueue_message(welcome_email)
         # Notify admin of a new subscriber (fun inbox check)
         admin_email = getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")
         total = NewsletterSubscriber.objects.count()
-        send_mail(
+        enqueue_email(
             "Newsletter: New Subscriber!",
             (
                 f"A new user subscribed to the newsletter.\n"
@@ -578,7 +601,7 @@ def submit_do_not_email(request):
             paid_confirmed=True,
             weekly_status_opt_in=weekly_opt_in,
         )
-        # Ensure auth user + consumer exist and are initialized after payment.
+        # Ensure auth user + consumer exist; onboarding is queued for onboard_consumers.
         _ensure_consumer(
             email=email_value,
             first=data['first_name'],
@@ -608,11 +631,11 @@ def submit_do_not_email(request):
                 [obj.primary_email],
             )
             confirmation_email.attach_alternative(html_content, "text/html")
-            confirmation_email.send()
+            enqueue_message(confirmation_email)
         # Notify admin of new Stop My Spam registration (paid)
         admin_email = getattr(settings, "ADMIN_NOTIFICATION_EMAIL", "admin@swantech.org")
         total_requests = DoNotEmailRequest.objects.count()
-        send_mail(
+        enqueue_email(
             "Stop My Spam: New Registration!",
             (
                 "A new Stop My Spam request has been paid and recorded.\n"
@@ -775,8 +798,8 @@ def contact_sales_page(request):
         from_email = "SwanTech Sales <contact@swantech.org>"
         recipient_list = ["admin@swantech.org"]
 
-        # Send notification email to your team
-        send_mail(subject, message, from_email, recipient_list)
+        # Queue notification email to your team
+        enqueue_email(subject, message, from_email, recipient_list)
 
         # --- Send confirmation email to the user ---
         confirmation_subject = "Thanks for contacting Swanson Software Solutions!"
@@ -797,7 +820,7 @@ def contact_sales_page(request):
             [email],
         )
         confirmation_email.attach_alternative(html_content, "text/html")
-        confirmation_email.send()
+        enqueue_message(confirmation_email)
 
         messages.success(request, "Your message has been sent! We'll get back to you soon.")
         return render(request, 'website/contact_sales.html', { 'inquiry_prefill': inquiry_prefill, **seo_context })
@@ -986,22 +1009,34 @@ def location_directory(request):
 def broker_acknowledgement_confirmation(request):
     """Record broker acknowledgement when they click the confirmation link."""
 
-    broker_id = request.GET.get("brokerid")
-    if not broker_id:
-        return HttpResponseBadRequest("Missing brokerid.")
+    # One email can cover several brokers sharing a contact address; its signed token names them all.
+    token = request.GET.get("token")
+    if not token:
+        return HttpResponseBadRequest("Missing token.")
     try:
-        broker = DataBrokers2025.objects.get(pk=int(broker_id))
-    except (DataBrokers2025.DoesNotExist, ValueError, TypeError):
+        broker_ids = list(dict.fromkeys(BrokerAcknowledgement.broker_ids_from_token(token)))
+    except signing.BadSignature:
+        return HttpResponseBadRequest("Invalid or tampered link.")
+    if not broker_ids:
+        return HttpResponseBadRequest("Invalid broker.")
+    brokers = list(DataBrokers2025.objects.filter(pk__in=broker_ids).order_by("id"))
+    if len(brokers) != len(broker_ids):
         return HttpResponseBadRequest("Invalid broker.")
 
-    acknowledgement, _ = BrokerAcknowledgement.objects.get_or_create(broker=broker)
-    already_acknowledged = acknowledgement.acknowledged
-    if not acknowledgement.acknowledged:
-        acknowledgement.mark_acknowledged()
+    acknowledgements = []
+    for broker in brokers:
+        acknowledgement, _ = BrokerAcknowledgement.objects.get_or_create(broker=broker)
+        acknowledgements.append((acknowledgement, acknowledgement.acknowledged))
+        if not acknowledgement.acknowledged:
+            acknowledgement.mark_acknowledged()
+    acknowledgement = acknowledgements[0][0]
+    already_acknowledged = all(already for _, already in acknowledgements)
 
     support_email = getattr(settings, "SUPPORT_EMAIL_HOST_USER", getattr(settings, "DEFAULT_FROM_EMAIL", "support@swantech.org"))
     context = {
-        "broker": broker,
+        "broker": brokers[0],
+        "brokers": brokers,
+        "broker_names": ", ".join(broker.name for broker in brokers),
         "acknowledgement": acknowledgement,
         "already_acknowledged": already_acknowledged,
         "support_email": support_email,
@@ -1009,6 +1044,18 @@ def broker_acknowledgement_confirmation(request):
     return render(request, "website/broker_acknowledgement_confirmation.html", context)
 
 
+# Statuses a broker may report through the compliance page or the bulk upload.
+BROKER_RESPONSE_STATUSES = {
+    ConsumerBrokerStatus.Status.COMPLETED,
+    ConsumerBrokerStatus.Status.PROCESSING,
+    ConsumerBrokerStatus.Status.REJECTED,
+    ConsumerBrokerStatus.Status.NO_RESPONSE,
+}
+
+# Upper bound on rows per bulk upload, so one request stays one IN query.
+MAX_BULK_RESPONSES = 5000
+
+
 def broker_compliance(request, tracking_token=None):
     """Display and accept broker confirmations tied to ConsumerBrokerStatus tokens."""
 
@@ -1024,66 +1071,46 @@ def broker_compliance(request, tracking_token=None):
 
     def compute_csv_window(compliance_obj: BrokerCompliance | None) -> tuple[timezone.datetime, timezone.datetime, ZoneInfo]:
         """Use stored window if present; otherwise default to prior-day 8am -> today 8am (LA)."""
-        la = ZoneInfo("America/Los_Angeles")
         if compliance_obj and compliance_obj.last_window_start and compliance_obj.last_window_end:
-            return compliance_obj.last_window_start, compliance_obj.last_window_end, la
-        now_la = timezone.now().astimezone(la)
-        today = now_la.date()
-        end_default = timezone.make_aware(datetime.combine(today, time(8)), la)
-        if now_la < end_default:
-            end_default -= timedelta(days=1)
-        start_default = end_default - timedelta(days=1)
-        return start_default, end_default, la
-
-    def build_csv_response(start, end, la: ZoneInfo) -> HttpResponse | None:
-        qs = (
-            DoNotEmailRequest.objects.filter(
-                paid_confirmed=True,
-                created_at__gte=start,
-                created_at__lt=end,
-            ).order_by("created_at")
-        )
-        if not qs.exists():
-            return None
-        buf = StringIO()
-        writer = csv.writer(buf)
-        writer.writerow(
-            [
-                "first_name",
-                "last_name",
-                "email1",
-                "email2",
-                "address1",
-                "address2",
-                "city",
-                "state",
-                "postal",
-                "region",
-                "created_at",
-            ]
-        )
-        for r in qs:
-            created_local = r.created_at.astimezone(la).isoformat()
-            writer.writerow(
-                [
-                    r.first_name,
-                    r.last_name,
-                    r.primary_email,
-                    r.secondary_email or "",
-                    r.address1,
-                    r.address2 or "",
-                    r.city,
-                    r.region,
-                    r.postal,
-                    r.region,
-                    created_local,
-                ]
+            return compliance_obj.last_window_start, compliance_obj.last_window_end, WINDOW_TZ
+        start_default, end_default = default_window()
+        return start_default, end_default, WINDOW_TZ
+
+    def build_csv_response(start, end, fmt: ExportFormat) -> HttpResponse | None:
+        """The window's export in ``fmt``.
+
+        CSV (plain or .csv.gz) streams straight from the database, plain CSV
+        gzipped in transit when the client accepts it; zip and Parquet are
+        served from the cached ``window_export`` file.
+        """
+        if fmt.name not in ("csv", "csv.gz"):
+            export = window_export(start, end, fmt)
+            if export is None:
+                return None
+            return FileResponse(
+                export.path.open("rb"),
+                as_attachment=True,
+                filename=export.filename,
+                content_type=export.content_type,
             )
-        start_label = start.astimezone(la).strftime("%Y%m%d_%H%M")
-        end_label = end.astimezone(la).strftime("%Y%m%d_%H%M")
-        filename = f"dne_records_{start_label}_to_{end_label}.csv"
-        response = HttpResponse(buf.getvalue(), content_type="text/csv")
-        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        rows = window_rows(start, end)
+        # Peek at the first row instead of a separate exists(); the same cursor feeds the stream.
+        first = next(rows, None)
+        if first is None:
+            return None
+        content = stream_window_csv(start, end, rows=itertools.chain([first], rows))
+        if fmt.name == "csv.gz":
+            content = compress_sequence(content)
+            use_gzip = False
+        else:
+            use_gzip = bool(re.search(r"\bgzip\b", request.headers.get("Accept-Encoding", "")))
+            if use_gzip:
+                content = compress_sequence(content)
+        response = StreamingHttpResponse(content, content_type=fmt.content_type)
+        response["Content-Disposition"] = content_disposition_header(True, window_filename(start, end, fmt))
+        if use_gzip:
+            response["Content-Encoding"] = "gzip"
+        patch_vary_headers(response, ("Accept-Encoding",))
         return response
 
     if tracking_token:
@@ -1100,19 +1127,27 @@ def broker_compliance(request, tracking_token=None):
     compliance = None
     try:
         uuid.UUID(str(token))
-        status_record = get_object_or_404(
-            ConsumerBrokerStatus.objects.select_related('consumer', 'broker'),
-            tracking_token=token,
+        status_record = (
+            ConsumerBrokerStatus.objects.select_related('consumer', 'broker')
+            .filter(tracking_token=token)
+            .first()
         )
     except (ValueError, TypeError):
         status_record = None
+    else:
+        if status_record is None:
+            # Finished requests are moved to the archive; their links still resolve
+            # but there is nothing left for the broker to update.
+            archived = get_object_or_404(ArchivedConsumerBrokerStatus, tracking_token=token)
+            return render(
+                request,
+                'website/broker_compliance_success.html',
+                {
+                    'status_record': archived,
+                },
+            )
 
-    allowed_statuses = {
-        ConsumerBrokerStatus.Status.COMPLETED,
-        ConsumerBrokerStatus.Status.PROCESSING,
-        ConsumerBrokerStatus.Status.REJECTED,
-        ConsumerBrokerStatus.Status.NO_RESPONSE,
-    }
+    allowed_statuses = BROKER_RESPONSE_STATUSES
     if status_record:
         preselected_status = (
             status_record.status if status_record.status in allowed_statuses else ""
@@ -1143,23 +1178,24 @@ def broker_compliance(request, tracking_token=None):
             f"{csv_start.astimezone(la).strftime('%Y-%m-%d %H:%M %Z')} "
             f"to {csv_end.astimezone(la).strftime('%Y-%m-%d %H:%M %Z')}"
         )
-        consumer_qs = DoNotEmailRequest.objects.filter(
-            paid_confirmed=True,
-            created_at__gte=csv_start,
-            created_at__lt=csv_end,
-        ).order_by("created_at")
-        csv_count = consumer_qs.count()
-        csv_available = csv_count > 0
-        # Capture a snapshot of included consumers for display (no per-consumer links).
-        window_consumers = list(
-            consumer_qs.values("first_name", "last_name", "primary_email")[:50]
-        )
-        remaining_consumers = max(0, csv_count - len(window_consumers))
         if request.method == 'POST' and request.POST.get('download_csv'):
-            csv_response = build_csv_response(csv_start, csv_end, la)
+            try:
+                export_format = get_export_format(request.POST.get('format') or request.GET.get('format'))
+            except ValueError as exc:
+                return HttpResponseBadRequest(str(exc))
+            csv_response = build_csv_response(csv_start, csv_end, export_format)
             if csv_response:
                 return csv_response
             messages.info(request, "No paid Stop My Spam records found for this window.")
+        # Preview rows and the window total in one query (no per-consumer links).
+        window_consumers = list(
+            window_queryset(csv_start, csv_end)
+            .annotate(window_total=Window(Count("id")))
+            .values("first_name", "last_name", "primary_email", "window_total")[:50]
+        )
+        csv_count = window_consumers[0]["window_total"] if window_consumers else 0
+        csv_available = csv_count > 0
+        remaining_consumers = max(0, csv_count - len(window_consumers))
 
         if request.method == 'POST' and not request.POST.get('download_csv'):
             response_status = request.POST.get('response_status')
@@ -1212,9 +1248,237 @@ def broker_compliance(request, tracking_token=None):
             'token': token,
             'preselected_status': preselected_status,
             'csv_available': csv_available,
+            'export_formats': EXPORT_FORMATS.values(),
             'csv_window_label': csv_window_label,
             'csv_count': csv_count,
             'window_consumers': window_consumers,
             'remaining_consumers': remaining_consumers,
         },
     )
+
+
+def _compliance_from_request(request) -> BrokerCompliance | None:
+    """The BrokerCompliance named by ``Authorization: Bearer <token>`` or a ``t`` parameter (cached per request)."""
+    if not hasattr(request, "_broker_compliance"):
+        auth = request.headers.get("Authorization", "")
+        if auth.startswith("Bearer "):
+            token = auth[7:].strip()
+        else:
+            token = request.GET.get("t") or (request.POST.get("t") if request.method == "POST" else None)
+        request._broker_compliance = (
+            BrokerCompliance.objects.filter(token=token).first() if token else None
+        )
+    return request._broker_compliance
+
+
+def _parse_bulk_responses(request) -> list[dict]:
+    """Rows of ``tracking_token,status,notes`` from a JSON body, a CSV body or an uploaded ``file``."""
+    if request.content_type == "multipart/form-data":
+        # Parsing the form consumes the stream, so request.body is no fallback here.
+        upload = request.FILES.get("file")
+        if upload is None:
+            raise ValueError("Multipart uploads need a 'file' field.")
+        raw = upload.read()
+        is_json = upload.name.lower().endswith(".json")
+    else:
+        raw = request.body
+        is_json = request.content_type == "application/json"
+    text = raw.decode("utf-8-sig")
+    if is_json:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get("responses")
+        if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+            raise ValueError("Expected a list of {tracking_token, status, notes} objects.")
+        return data
+    reader = csv.DictReader(io.StringIO(text))
+    if not reader.fieldnames or not {"tracking_token", "status"} <= set(reader.fieldnames):
+        raise ValueError("CSV needs a header row with tracking_token,status[,notes].")
+    return list(reader)
+
+
+@csrf_exempt
+@require_POST
+def broker_compliance_bulk(request):
+    """Apply many broker responses in one request, authenticated by the broker's compliance token.
+
+    The token comes from ``Authorization: Bearer <token>`` (or a ``t``
+    parameter). Tokens in the upload are resolved with one ``IN`` query
+    scoped to that broker and the changes written with ``bulk_update``;
+    the response reports the outcome of every row.
+    """
+    compliance = _compliance_from_request(request)
+    if compliance is None:
+        return JsonResponse({"error": "Invalid or missing compliance token."}, status=403)
+
+    try:
+        rows = _parse_bulk_responses(request)
+    except (ValueError, UnicodeDecodeError) as exc:
+        return JsonResponse({"error": f"Could not read upload: {exc}"}, status=400)
+    if len(rows) > MAX_BULK_RESPONSES:
+        return JsonResponse({"error": f"At most {MAX_BULK_RESPONSES} rows per upload."}, status=400)
+
+    results: list[dict] = []
+    wanted: dict[str, tuple[dict, str, str]] = {}  # token -> (result, status, notes)
+    for number, row in enumerate(rows, start=1):
+        token_value = str(row.get("tracking_token") or "").strip()
+        status_value = str(row.get("status") or "").strip().lower()
+        result = {"row": number, "tracking_token": token_value}
+        results.append(result)
+        try:
+            token_value = str(uuid.UUID(token_value))
+        except ValueError:
+            result.update(result="error", error="Invalid tracking token.")
+            continue
+        if status_value not in BROKER_RESPONSE_STATUSES:
+            result.update(result="error", error="Invalid status.")
+        elif token_value in wanted:
+            result.update(result="error", error=f"Duplicate of row {wanted[token_value][0]['row']}.")
+        else:
+            wanted[token_value] = (result, status_value, str(row.get("notes") or ""))
+
+    records = {
+        str(record.tracking_token): record
+        for record in ConsumerBrokerStatus.objects.filter(
+            broker_id=compliance.broker_id, tracking_token__in=list(wanted)
+        )
+    }
+    changed = []
+    for token_value, (result, status_value, notes) in wanted.items():
+        record = records.get(token_value)
+        if record is None:
+            result.update(result="error", error="Unknown tracking token for this broker.")
+            continue
+        record.apply_broker_response(
+            status_value,
+            notes=notes,
+            contact_name=compliance.contact_name,
+            contact_email=compliance.contact_email,
+            commit=False,
+        )
+        changed.append(record)
+        result.update(result="updated", status=status_value)
+    ConsumerBrokerStatus.bulk_save_outreach(changed, ConsumerBrokerStatus.RESPONSE_UPDATE_FIELDS)
+
+    return JsonResponse(
+        {
+            "updated": len(changed),
+            "errors": len(results) - len(changed),
+            "results": results,
+        }
+    )
+
+
+# Page size bounds for the broker request feed.
+BROKER_FEED_PAGE_SIZE = 500
+BROKER_FEED_MAX_PAGE_SIZE = 1000
+
+
+def _broker_feed_state(request) -> dict | None:
+    """Open-request count and last change for the caller's broker, computed once per request.
+
+    ``updated_at`` is taken over all of the broker's rows, not just open
+    ones, so a request leaving the feed (e.g. marked completed) still bumps
+    the validators.
+    """
+    if not hasattr(request, "_broker_feed_state"):
+        compliance = _compliance_from_request(request)
+        state = None
+        if compliance is not None:
+            state = ConsumerBrokerStatus.objects.filter(broker_id=compliance.broker_id).aggregate(
+                open_count=Count("id", filter=Q(status__in=ConsumerBrokerStatus.OPEN_STATUSES)),
+                last_modified=Max("updated_at"),
+            )
+        request._broker_feed_state = state
+    return request._broker_feed_state
+
+
+def _broker_feed_etag(request):
+    state = _broker_feed_state(request)
+    if state is None:
+        return None
+    last_modified = state["last_modified"].isoformat() if state["last_modified"] else ""
+    key = f"{state['open_count']}|{last_modified}|{request.GET.urlencode()}"
+    return hashlib.sha256(key.encode()).hexdigest()[:32]
+
+
+def _broker_feed_last_modified(request):
+    state = _broker_feed_state(request)
+    return state["last_modified"] if state else None
+
+
+@require_GET
+@condition(etag_func=_broker_feed_etag, last_modified_func=_broker_feed_last_modified)
+def broker_request_feed(request):
+    """Keyset-paginated JSON of the caller's open requests, for brokers automating suppression.
+
+    Authenticated like ``broker_compliance_bulk``. Pass the returned
+    ``next_cursor`` as ``cursor`` to fetch the next page, and ``since``
+    (ISO-8601) to only list requests changed after that time. A ``since``
+    query also reports, under ``closed``, contacted requests that left the
+    open set in that time, so incremental clients can drop them. ETag and
+    Last-Modified let polling clients get a 304 when nothing changed.
+    """
+    compliance = _compliance_from_request(request)
+    if compliance is None:
+        return JsonResponse({"error": "Invalid or missing compliance token."}, status=403)
+
+    try:
+        cursor = int(request.GET.get("cursor") or 0)
+        limit = int(request.GET.get("limit") or BROKER_FEED_PAGE_SIZE)
+    except ValueError:
+        return JsonResponse({"error": "cursor and limit must be integers."}, status=400)
+    limit = max(1, min(limit, BROKER_FEED_MAX_PAGE_SIZE))
+
+    is_open = Q(status__in=ConsumerBrokerStatus.OPEN_STATUSES)
+    requests_qs = ConsumerBrokerStatus.objects.filter(broker_id=compliance.broker_id, id__gt=cursor)
+    since = request.GET.get("since")
+    if since:
+        since_dt = parse_datetime(since)
+        if since_dt is None:
+            return JsonResponse({"error": "since must be an ISO-8601 datetime."}, status=400)
+        if timezone.is_naive(since_dt):
+            since_dt = timezone.make_aware(since_dt, dt_timezone.utc)
+        # Open rows plus contacted rows that closed since then, paged together by id.
+        requests_qs = requests_qs.filter(is_open | Q(contacted_at__isnull=False), updated_at__gt=since_dt)
+    else:
+        requests_qs = requests_qs.filter(is_open)
+
+    # One extra row tells us whether another page exists.
+    rows = list(
+        requests_qs.order_by("id").values_list(
+            "id",
+            "tracking_token",
+            "status",
+            "request_type",
+            "contacted_at",
+            "updated_at",
+            "consumer__first_name",
+            "consumer__last_name",
+            "consumer__primary_email",
+        )[: limit + 1]
+    )
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+    results: list[dict] = []
+    closed: list[dict] = []
+    for _, token, status, request_type, contacted_at, updated_at, first_name, last_name, email in rows:
+        if status not in ConsumerBrokerStatus.OPEN_STATUSES:
+            closed.append({"tracking_token": str(token), "status": status, "updated_at": updated_at.isoformat()})
+            continue
+        results.append(
+            {
+                "tracking_token": str(token),
+                "status": status,
+                "request_type": request_type,
+                "contacted_at": contacted_at.isoformat() if contacted_at else None,
+                "updated_at": updated_at.isoformat(),
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+            }
+        )
+    payload = {"results": results, "next_cursor": rows[-1][0] if has_more else None}
+    if since:
+        payload["closed"] = closed
+    return JsonResponse(payload)